@@ -0,0 +1,116 @@
+"""
+One-off migration: move interviews.answers (JSONB list) into interview_answers.
+
+Interview answers used to be a JSONB list on the interviews row; they are now
+one InterviewAnswer row per question. create_all adds the new table but leaves
+the old column and its data in existing databases. This script copies every
+stored answer into interview_answers, recounts completed_questions, and then
+drops interviews.answers, all in one transaction.
+
+Safe to re-run: answers already in interview_answers are kept, and a database
+without the old column is left untouched.
+
+Run once per existing database, before starting the new backend:
+    python migrate_interview_answers.py
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import orjson
+from sqlalchemy import DateTime, inspect, select, text
+from sqlalchemy.engine import Connection
+
+from src.database import engine
+from src.models import interview  # noqa: F401  (interviews table for the foreign key)
+from src.models.interview_answer import InterviewAnswer
+from src.utils.logging_config import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+
+def _parse_answered_at(value: Any, fallback: datetime) -> datetime:
+    """ISO timestamp from the old JSON answer, or fallback if missing/invalid."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    return fallback
+
+
+def _latest_answers(answers: Any) -> Dict[int, Dict[str, Any]]:
+    """Old answer list keyed by question ID; a later entry wins over an earlier one."""
+    if isinstance(answers, (str, bytes)):
+        answers = orjson.loads(answers)
+
+    latest: Dict[int, Dict[str, Any]] = {}
+    for answer in answers or []:
+        if not isinstance(answer, dict) or answer.get("question_id") is None:
+            continue
+        latest[int(answer["question_id"])] = answer
+    return latest
+
+
+def migrate_interview_answers(connection: Connection) -> Optional[int]:
+    """
+    Copy interviews.answers into interview_answers and drop the old column.
+
+    Runs in the caller's transaction.
+
+    Returns:
+        Number of answer rows inserted, or None if there was nothing to migrate
+    """
+    columns = {column["name"] for column in inspect(connection).get_columns("interviews")}
+    if "answers" not in columns:
+        logger.info("interview_answers_migration_skipped", reason="interviews.answers already dropped")
+        return None
+
+    InterviewAnswer.__table__.create(bind=connection, checkfirst=True)
+
+    existing = set(connection.execute(
+        select(InterviewAnswer.interview_id, InterviewAnswer.question_id)
+    ).all())
+
+    rows = []
+    interviews = connection.execute(text(
+        "SELECT id, answers, updated_at, created_at FROM interviews WHERE answers IS NOT NULL"
+    ).columns(updated_at=DateTime(timezone=True), created_at=DateTime(timezone=True))).all()
+    for interview_id, answers, updated_at, created_at in interviews:
+        fallback = updated_at or created_at or datetime.utcnow()
+        for question_id, answer in _latest_answers(answers).items():
+            if (interview_id, question_id) in existing:
+                continue
+            rows.append({
+                "interview_id": interview_id,
+                "question_id": question_id,
+                "answer_text": answer.get("answer_text") or "",
+                "answer_audio_url": answer.get("answer_audio_url"),
+                "answered_at": _parse_answered_at(answer.get("answered_at"), fallback),
+                "evaluation": answer.get("evaluation"),
+            })
+
+    if rows:
+        connection.execute(InterviewAnswer.__table__.insert(), rows)
+
+    # get_progress reads the counter, so it must match the copied rows. Plain
+    # SQL so updated_at (onupdate=now()) is not bumped on every interview.
+    connection.execute(text(
+        "UPDATE interviews SET completed_questions = "
+        "(SELECT COUNT(*) FROM interview_answers WHERE interview_answers.interview_id = interviews.id)"
+    ))
+
+    connection.execute(text("ALTER TABLE interviews DROP COLUMN answers"))
+
+    logger.info(
+        "interview_answers_migrated",
+        interviews=len(interviews),
+        answers_inserted=len(rows),
+    )
+    return len(rows)
+
+
+if __name__ == "__main__":
+    configure_logging(log_level="INFO", json_output=False)
+    with engine.begin() as connection:
+        migrate_interview_answers(connection)
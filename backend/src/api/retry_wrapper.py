@@ -6,12 +6,16 @@ Constitution Compliance:
 - Principle V: Code Quality - Structured logging for retry attempts
 """
 
+import json
 import time
 from typing import Any, Callable, Optional, Type, Union
 from functools import wraps
+from google.api_core.exceptions import ResourceExhausted
+from pydantic import ValidationError
 from tenacity import (
     retry,
     stop_after_attempt,
+    stop_after_delay,
     wait_exponential,
     retry_if_exception_type,
     before_sleep_log,
@@ -31,6 +35,8 @@ def retry_with_backoff(
     multiplier: float = 2.0,
     exceptions: tuple = (Exception,),
     logger_name: Optional[str] = None,
+    wait_strategy: Optional[Callable] = None,
+    max_delay: Optional[float] = None,
 ):
     """
     Decorator for retrying functions with exponential backoff.
@@ -46,6 +52,8 @@ def retry_with_backoff(
         multiplier: Exponential backoff multiplier (default: 2.0)
         exceptions: Tuple of exceptions to retry on (default: all exceptions)
         logger_name: Custom logger name (optional)
+        wait_strategy: Custom tenacity wait callable, replaces the exponential wait (optional)
+        max_delay: Stop retrying once this many seconds have elapsed in total (optional)
 
     Returns:
         Decorated function with retry logic
@@ -67,9 +75,13 @@ def retry_with_backoff(
         # Get or create logger
         func_logger = get_logger(logger_name or func.__module__)
 
-        @retry(
-            stop=stop_after_attempt(max_attempts),
-            wait=wait_exponential(
+        stop = stop_after_attempt(max_attempts)
+        if max_delay is not None:
+            stop = stop | stop_after_delay(max_delay)
+
+        retry_kwargs = dict(
+            stop=stop,
+            wait=wait_strategy or wait_exponential(
                 multiplier=multiplier,
                 min=initial_wait,
                 max=max_wait,
@@ -78,6 +90,8 @@ def retry_with_backoff(
             before_sleep=before_sleep_log(logging.getLogger(func_logger.name), logging.WARNING),
             after=after_log(logging.getLogger(func_logger.name), logging.INFO),
         )
+
+        @retry(**retry_kwargs)
         @wraps(func)
         async def async_wrapper(*args, **kwargs) -> Any:
             try:
@@ -103,17 +117,7 @@ def retry_with_backoff(
                 )
                 raise
 
-        @retry(
-            stop=stop_after_attempt(max_attempts),
-            wait=wait_exponential(
-                multiplier=multiplier,
-                min=initial_wait,
-                max=max_wait,
-            ),
-            retry=retry_if_exception_type(exceptions),
-            before_sleep=before_sleep_log(logging.getLogger(func_logger.name), logging.WARNING),
-            after=after_log(logging.getLogger(func_logger.name), logging.INFO),
-        )
+        @retry(**retry_kwargs)
         @wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
             try:
@@ -151,18 +155,39 @@ def retry_with_backoff(
 
 
 # Specific retry decorators for common APIs
+def wait_for_gemini_error(retry_state) -> float:
+    """
+    Wait time between Gemini retries, chosen by the failure type.
+
+    - 429 / ResourceExhausted: exponential backoff (2s, 4s, 8s...) capped at 30s
+    - Invalid JSON / schema mismatch: retry immediately (waiting does not fix a format error)
+    - Anything else: fixed 2s backoff
+    """
+    exception = retry_state.outcome.exception() if retry_state.outcome else None
+
+    if isinstance(exception, ResourceExhausted):
+        return min(2 ** retry_state.attempt_number, 30)
+    if isinstance(exception, (json.JSONDecodeError, ValidationError)):
+        return 0
+    return 2.0
+
+
 def retry_gemini_api(
     max_attempts: int = 3,
     timeout: float = 30.0,
+    max_delay: float = 90.0,
 ):
     """
     Retry decorator specifically for Gemini API calls.
 
     Uses project configuration for retry settings (Constitution II).
+    Rate-limit errors back off exponentially while other failures use a short
+    fixed wait (see wait_for_gemini_error); total retry time is capped.
 
     Args:
         max_attempts: Maximum retry attempts (default from config: 3)
         timeout: API call timeout in seconds (default from config: 30)
+        max_delay: Stop retrying after this many seconds in total (default: 90)
 
     Example:
         @retry_gemini_api()
@@ -174,10 +199,10 @@ def retry_gemini_api(
 
     return retry_with_backoff(
         max_attempts=max_attempts or settings.gemini_max_retries,
-        initial_wait=1.0,
-        max_wait=8.0,
         exceptions=(Exception,),  # Retry all exceptions for now
         logger_name="pathpilot.api.gemini",
+        wait_strategy=wait_for_gemini_error,
+        max_delay=max_delay,
     )
 
 
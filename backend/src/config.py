@@ -28,9 +28,51 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = Field(..., description="PostgreSQL connection URL")
+    db_pool_size: int = Field(default=20, description="Persistent connections in the sync engine pool")
+    db_max_overflow: int = Field(default=10, description="Extra connections allowed above db_pool_size under load")
+    db_pool_timeout_seconds: int = Field(
+        default=5,
+        description="Max wait for a pooled connection before the request fails",
+    )
+    db_pool_recycle_seconds: int = Field(
+        default=1800,
+        description="Reopen connections older than this (below typical server/proxy idle timeouts)",
+    )
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379", description="Redis connection URL")
+    cover_letter_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse cached content for identical cover letter regenerations",
+    )
+    cover_letter_cache_ttl_seconds: int = Field(default=3600, description="Cover letter regeneration cache TTL in seconds")
+    interview_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse question sets for identical generic interview requests (no resume/job description)",
+    )
+    interview_cache_ttl_seconds: int = Field(default=86400, description="Interview question set cache TTL in seconds")
+    interview_recent_ttl_seconds: int = Field(
+        default=600,
+        description="Window in which a repeated identical interview request from the same user reuses its previous questions",
+    )
+    job_recommendation_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse job recommendations for equivalent candidate profiles and preferences",
+    )
+    job_recommendation_cache_ttl_seconds: int = Field(default=86400, description="Job recommendation cache TTL in seconds")
+    job_match_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse job match analyses for identical match prompts",
+    )
+    job_match_cache_ttl_seconds: int = Field(default=3600, description="Job match analysis cache TTL in seconds")
+    job_match_prefilter_enabled: bool = Field(
+        default=True,
+        description="Return a weak match without calling Gemini when a job mentions none of the resume skills",
+    )
+    job_match_prefilter_min_skills: int = Field(
+        default=5,
+        description="Minimum number of resume skills before the job match prefilter applies",
+    )
 
     # AI Models - Gemini
     google_api_key: str = Field(..., description="Google Gemini API key")
@@ -51,6 +93,21 @@ class Settings(BaseSettings):
     # File Upload
     max_upload_size_mb: int = Field(default=5, description="Max file upload size in MB")
     upload_dir: str = Field(default="./uploads", description="Upload directory path")
+    resume_extract_workers: int = Field(
+        default=2,
+        description="Worker processes for PDF/DOCX text extraction per app process",
+    )
+
+    # Object Storage (presigned direct uploads for large resumes)
+    resume_upload_bucket: Optional[str] = Field(
+        default=None,
+        description="S3-compatible bucket for presigned resume uploads (optional, disabled when unset)",
+    )
+    s3_endpoint_url: Optional[str] = Field(
+        default=None,
+        description="Custom S3 endpoint, e.g. GCS interoperability or MinIO (optional)",
+    )
+    presigned_url_ttl_seconds: int = Field(default=300, description="Presigned upload URL lifetime in seconds")
 
     # Logging
     log_level: str = Field(default="INFO", description="Log level: DEBUG, INFO, WARNING, ERROR")
@@ -58,6 +115,7 @@ class Settings(BaseSettings):
     # API Rate Limiting (Constitution II: API Resilience)
     gemini_max_retries: int = Field(default=3, description="Max retry attempts for Gemini API")
     gemini_timeout_seconds: int = Field(default=30, description="Timeout for Gemini API calls")
+    gemini_concurrency: int = Field(default=16, description="Max concurrent in-flight Gemini calls per process")
     elevenlabs_max_retries: int = Field(default=3, description="Max retry attempts for ElevenLabs API")
     elevenlabs_timeout_seconds: int = Field(default=10, description="Timeout for ElevenLabs API calls")
 
@@ -6,29 +6,38 @@ Constitution Compliance:
 - Principle V: Code Quality - Structured logging for database operations
 """
 
-from typing import Generator
-from sqlalchemy import create_engine, event, MetaData, text
+from functools import lru_cache
+from typing import AsyncGenerator, Generator
+from sqlalchemy import create_engine, event, make_url, MetaData, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from src.config import settings
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# psycopg2 batches executemany UPDATE/DELETE too (e.g. saved-job match refreshes);
+# INSERTs already use insertmanyvalues
+DRIVER_ENGINE_KWARGS = {
+    "psycopg2": {"executemany_mode": "values_plus_batch"},
+}
+
 # Database connection with pooling configuration
 # Constitution III: database_url from environment, never hardcoded
 engine = create_engine(
     settings.database_url,
     poolclass=QueuePool,
-    pool_size=10,  # Maximum number of permanent connections
-    max_overflow=20,  # Maximum number of temporary connections
-    pool_timeout=30,  # Timeout for getting connection from pool
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_size=settings.db_pool_size,  # Maximum number of permanent connections
+    max_overflow=settings.db_max_overflow,  # Maximum number of temporary connections
+    pool_timeout=settings.db_pool_timeout_seconds,  # Fail fast instead of queueing behind a saturated pool
+    pool_recycle=settings.db_pool_recycle_seconds,  # Recycle connections before idle timeouts drop them
     pool_pre_ping=True,  # Verify connections before using them
     echo=settings.app_debug,  # Log SQL queries in debug mode
     future=True,  # Use SQLAlchemy 2.0 style
+    **DRIVER_ENGINE_KWARGS.get(make_url(settings.database_url).get_dialect().driver, {}),
 )
 
 # Session factory
@@ -39,6 +48,75 @@ SessionLocal = sessionmaker(
     future=True,
 )
 
+# Async drivers for the async engine (same database, non-blocking DBAPI)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def _async_database_url(database_url: str) -> str:
+    """Rewrite a sync database URL to use the matching async driver."""
+    scheme, separator, rest = database_url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme.split('+')[0], scheme)}{separator}{rest}"
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """
+    Async engine for services that await their queries (cover letters).
+
+    Created on first use so importing this module does not require the
+    async driver to be installed.
+    """
+    async_engine = create_async_engine(
+        _async_database_url(settings.database_url),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=5,
+        max_overflow=10,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=True,
+        echo=settings.app_debug,
+    )
+
+    if async_engine.dialect.name == "postgresql":
+        event.listen(async_engine.sync_engine, "connect", _disable_synchronous_commit)
+
+    return async_engine
+
+
+def _disable_synchronous_commit(dbapi_conn, connection_record) -> None:
+    """
+    Turn off synchronous_commit for async-engine connections.
+
+    Durability tradeoff: a commit returns before its WAL record is flushed, so
+    a server crash can lose the last few hundred ms of commits (never
+    corrupts data). Acceptable here because the async engine only serves
+    cover letters, which users can regenerate; users and other tables stay on
+    the sync engine with the default synchronous_commit=on.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("SET SESSION synchronous_commit TO off")
+    cursor.close()
+
+
+@lru_cache(maxsize=1)
+def get_async_session_factory() -> async_sessionmaker:
+    """
+    Async session factory (also the dependency for async SSE handlers, see
+    get_session_factory).
+
+    expire_on_commit=False: attributes stay loaded after commit, since lazy
+    refreshes are not possible outside an await.
+    """
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
 # Naming convention for constraints (helps with migrations)
 convention = {
     "ix": "ix_%(column_0_label)s",
@@ -106,6 +184,52 @@ def get_db() -> Generator[Session, None, None]:
         logger.debug("database_session_closed", operation="session_close")
 
 
+def get_session_factory() -> sessionmaker:
+    """
+    Dependency function for handlers that open their own sessions.
+
+    Streaming responses outlive yield-dependencies such as get_db, so SSE
+    handlers open a session inside the stream instead. Taking the factory as
+    a dependency keeps it overridable (tests).
+    """
+    return SessionLocal
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function for FastAPI to get async database sessions.
+
+    Yields:
+        Async database session
+
+    Example:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            return (await db.execute(select(Item))).scalars().all()
+    """
+    async with get_async_session_factory()() as db:
+        try:
+            logger.debug("database_session_created", operation="async_session_create")
+            yield db
+        except Exception as e:
+            logger.error(
+                "database_session_error",
+                operation="async_session_error",
+                error=str(e),
+                exc_info=True,
+            )
+            await db.rollback()
+            raise
+        finally:
+            logger.debug("database_session_closed", operation="async_session_close")
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections (application shutdown)."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
+
 def init_db() -> None:
     """
     Initialize database tables and create default test user.
@@ -114,7 +238,7 @@ def init_db() -> None:
     Should be called on application startup.
     """
     # Import models to register them with Base.metadata
-    from src.models import user, resume, cover_letter, job, interview  # noqa: F401
+    from src.models import user, resume, cover_letter, job, interview, interview_answer  # noqa: F401
     from src.models.user import User
 
     logger.info("database_initialization_started", operation="init_db")
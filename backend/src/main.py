@@ -19,7 +19,8 @@ from fastapi.exceptions import RequestValidationError
 import structlog
 
 from src.config import settings
-from src.database import init_db, check_db_connection
+from src.database import init_db, check_db_connection, dispose_async_engine
+from src.utils.cache import close_redis
 from src.utils.logging_config import configure_logging, get_logger
 
 # Configure logging on startup
@@ -71,6 +72,11 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    await dispose_async_engine()
+    await close_redis()
+    # Imported here: services must load after configure_logging (retry decorators bind loggers)
+    from src.services.resume_service import shutdown_extract_pool
+    shutdown_extract_pool()
     logger.info("application_shutdown", operation="shutdown")
 
 
@@ -85,6 +91,42 @@ app = FastAPI(
 )
 
 
+# Room for the multipart envelope (boundaries, part headers) around the file
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+# Upload Size Middleware (Constitution II: reject oversize bodies before reading them)
+@app.middleware("http")
+async def request_size_middleware(request: Request, call_next: Callable) -> Response:
+    """
+    Reject requests whose declared Content-Length exceeds the upload limit.
+
+    No endpoint accepts more than one resume file, so an oversize body is
+    answered with 413 before the multipart parser spools any of it. Bodies
+    without a Content-Length (chunked) are capped by ResumeService while streaming.
+    """
+    content_length = request.headers.get("content-length")
+    if (
+        content_length
+        and content_length.isdigit()
+        and int(content_length) > settings.max_upload_size_bytes + MULTIPART_OVERHEAD_BYTES
+    ):
+        logger.warning(
+            "request_too_large",
+            method=request.method,
+            path=request.url.path,
+            content_length=int(content_length),
+        )
+        return JSONResponse(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content={
+                "error": "Request too large",
+                "message": f"File too large. Maximum allowed: {settings.max_upload_size_mb}MB",
+            },
+        )
+    return await call_next(request)
+
+
 # CORS Middleware (Constitution III: Configured from environment)
 # Allow all origins for hackathon demo
 app.add_middleware(
@@ -10,6 +10,7 @@ from src.models.resume import Resume
 from src.models.cover_letter import CoverLetter
 from src.models.job import Job
 from src.models.interview import Interview
+from src.models.interview_answer import InterviewAnswer
 from src.models.application import Application, ApplicationStatus
 
-__all__ = ["User", "Resume", "CoverLetter", "Job", "Interview", "Application", "ApplicationStatus"]
+__all__ = ["User", "Resume", "CoverLetter", "Job", "Interview", "InterviewAnswer", "Application", "ApplicationStatus"]
@@ -9,7 +9,7 @@ T038: Cover Letter SQLAlchemy model
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Text, desc
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
@@ -21,6 +21,11 @@ class CoverLetter(Base):
     """Cover Letter model with AI generation results."""
 
     __tablename__ = "cover_letters"
+    __table_args__ = (
+        # Serves get_user_cover_letters (WHERE user_id = ? ORDER BY created_at DESC LIMIT n)
+        # as an ordered index range scan, no sort step
+        Index("ix_cover_letters_user_created", "user_id", desc("created_at")),
+    )
 
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -58,7 +63,7 @@ class CoverLetter(Base):
         nullable=False,
         default="pending",
         index=True,
-    )  # pending, generating, generated, failed
+    )  # pending, generating, queued, regenerating, generated, failed
 
     # Error tracking
     error_message = Column(Text, nullable=True)
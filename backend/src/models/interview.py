@@ -3,13 +3,15 @@ Interview model for PathPilot Mock Interview feature.
 
 Constitution Compliance:
 - Principle III: User Data Privacy - Linked to user, no PII in logs
-- Principle V: Code Quality - Structured data model with JSONB for questions/answers
+- Principle V: Code Quality - Structured data model with JSONB questions, answers in interview_answers
 
 T068: Interview SQLAlchemy model
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float
+from typing import Optional
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Text, Float, desc
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
@@ -21,6 +23,11 @@ class Interview(Base):
     """Interview session model with questions and evaluations."""
 
     __tablename__ = "interviews"
+    __table_args__ = (
+        # Serves get_user_interviews (WHERE user_id = ? ORDER BY created_at DESC LIMIT n)
+        # as an ordered index range scan, no sort step
+        Index("ix_interviews_user_created", "user_id", desc("created_at")),
+    )
 
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -58,28 +65,11 @@ class Interview(Base):
     # ]
     questions = Column(JSONB, nullable=True, default=[])
 
-    # User answers and evaluations
-    # Structure: [
-    #   {
-    #     "question_id": 1,
-    #     "answer_text": "...",
-    #     "answer_audio_url": "...",  # Optional audio recording
-    #     "answered_at": "ISO timestamp",
-    #     "duration_seconds": 90,
-    #     "evaluation": {
-    #       "score": 85,
-    #       "strengths": ["clear structure", ...],
-    #       "improvements": ["add specific examples", ...],
-    #       "feedback": "detailed feedback...",
-    #       "model_answer": "ideal answer example..."
-    #     }
-    #   }, ...
-    # ]
-    answers = Column(JSONB, nullable=True, default=[])
+    # User answers and evaluations are InterviewAnswer rows (answer_records)
 
     # Overall session stats
     total_score = Column(Float, nullable=True)  # Average of all answer scores
-    completed_questions = Column(Integer, default=0)
+    completed_questions = Column(Integer, default=0)  # Number of answer rows
 
     # Status tracking
     status = Column(
@@ -102,6 +92,12 @@ class Interview(Base):
     user = relationship("User", back_populates="interviews")
     resume = relationship("Resume", backref="interviews")
     job = relationship("Job", backref="interviews")
+    answer_records = relationship(
+        "InterviewAnswer",
+        back_populates="interview",
+        cascade="all, delete-orphan",
+        order_by="InterviewAnswer.question_id",
+    )
 
     def __repr__(self) -> str:
         return f"<Interview(id={self.id}, job={self.job_title}, status={self.status})>"
@@ -118,17 +114,26 @@ class Interview(Base):
         """Get total number of questions."""
         return len(self.questions) if self.questions else 0
 
+    @property
+    def answers(self) -> list:
+        """Answers as dicts, ordered by question ID (loads answer_records)."""
+        return [record.to_dict() for record in self.answer_records]
+
+    def get_question(self, question_id: int) -> Optional[dict]:
+        """Get a question by its ID, or None if it is not part of this interview."""
+        return next((q for q in (self.questions or []) if q.get("id") == question_id), None)
+
     def get_unanswered_questions(self) -> list:
         """Get questions that haven't been answered yet."""
         if not self.questions:
             return []
-        answered_ids = {a.get("question_id") for a in (self.answers or [])}
+        answered_ids = {record.question_id for record in self.answer_records}
         return [q for q in self.questions if q.get("id") not in answered_ids]
 
     def get_progress(self) -> dict:
         """Get interview progress."""
         total = self.get_question_count()
-        answered = len(self.answers) if self.answers else 0
+        answered = self.completed_questions or 0
         return {
             "total_questions": total,
             "answered": answered,
@@ -138,12 +143,10 @@ class Interview(Base):
 
     def calculate_total_score(self) -> float:
         """Calculate average score from all evaluations."""
-        if not self.answers:
-            return 0.0
         scores = [
-            a.get("evaluation", {}).get("score", 0)
-            for a in self.answers
-            if a.get("evaluation")
+            record.evaluation.get("score", 0)
+            for record in self.answer_records
+            if record.evaluation
         ]
         return round(sum(scores) / len(scores), 1) if scores else 0.0
 
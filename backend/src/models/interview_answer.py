@@ -0,0 +1,64 @@
+"""
+Interview answer model for PathPilot Mock Interview feature.
+
+Constitution Compliance:
+- Principle III: User Data Privacy - Owned by an interview, no PII in logs
+- Principle V: Code Quality - One row per answered question
+
+Answers live in their own table so submitting one answer writes one small row
+instead of rewriting the interview's whole answer list.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.database import Base
+
+
+class InterviewAnswer(Base):
+    """User answer to one interview question, with its evaluation."""
+
+    __tablename__ = "interview_answers"
+    __table_args__ = (
+        # One answer per question; also the upsert conflict target
+        UniqueConstraint("interview_id", "question_id"),
+    )
+
+    # Primary key
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Foreign keys
+    interview_id = Column(Integer, ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False)
+
+    # Question ID within the interview (Interview.questions[*].id)
+    question_id = Column(Integer, nullable=False)
+
+    answer_text = Column(Text, nullable=False)
+    answer_audio_url = Column(String(500), nullable=True)  # Optional audio recording
+    answered_at = Column(DateTime(timezone=True), nullable=False)
+
+    # Structure: {
+    #   "score": 85,
+    #   "strengths": ["clear structure", ...],
+    #   "improvements": ["add specific examples", ...],
+    #   "feedback": "detailed feedback...",
+    #   "model_answer": "ideal answer example..."
+    # }
+    evaluation = Column(JSONB, nullable=True)
+
+    # Relationships
+    interview = relationship("Interview", back_populates="answer_records")
+
+    def __repr__(self) -> str:
+        return f"<InterviewAnswer(interview_id={self.interview_id}, question_id={self.question_id})>"
+
+    def to_dict(self) -> dict:
+        """Answer in the API shape (answered_at as ISO timestamp)."""
+        return {
+            "question_id": self.question_id,
+            "answer_text": self.answer_text,
+            "answer_audio_url": self.answer_audio_url,
+            "answered_at": self.answered_at.isoformat() if self.answered_at else None,
+            "evaluation": self.evaluation,
+        }
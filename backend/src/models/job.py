@@ -9,10 +9,10 @@ T053: Job SQLAlchemy model for job discovery and recommendations
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float, Boolean, DDL, Index, desc, event
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.sql import column, func, text
 
 from src.database import Base
 
@@ -21,6 +21,21 @@ class Job(Base):
     """Job listing model for discovery and matching."""
 
     __tablename__ = "jobs"
+    # Server defaults (created_at) come back via INSERT ... RETURNING, so a
+    # saved job is complete after commit without a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Saved-jobs listing, ordered by score then recency. Partial: only
+        # saved rows are indexed, so it stays small and unsaved inserts skip
+        # it. PostgreSQL only: SQLite rejects NULLS LAST in an index.
+        Index(
+            "ix_jobs_saved_by_user",
+            "user_id",
+            desc("match_score").nullslast(),
+            desc("created_at"),
+            postgresql_where=text("is_saved"),
+        ).ddl_if(dialect="postgresql"),
+    )
 
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -105,3 +120,35 @@ class Job(Base):
         if not self.match_analysis:
             return []
         return self.match_analysis.get("missing_skills", [])
+
+
+# Columns read by get_summary(); list endpoints load only these
+JOB_SUMMARY_COLUMNS = (
+    Job.id,
+    Job.title,
+    Job.company,
+    Job.location,
+    Job.job_type,
+    Job.experience_level,
+    Job.match_score,
+    Job.is_saved,
+    Job.is_applied,
+    Job.source,
+    Job.created_at,
+)
+
+# Full-text search document over title/company/description, maintained by
+# PostgreSQL as a generated column with a GIN index (search_jobs). It is not
+# mapped: it is only used in filters, and SQLite (tests) has no equivalent.
+JOB_SEARCH_VECTOR = column("search_vector", TSVECTOR)
+
+event.listen(
+    Job.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE jobs ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(company, '') "
+        "|| ' ' || coalesce(description, ''))) STORED; "
+        "CREATE INDEX ix_jobs_search_vector ON jobs USING gin (search_vector)"
+    ).execute_if(dialect="postgresql"),
+)
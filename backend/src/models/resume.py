@@ -10,7 +10,7 @@ T022: Resume SQLAlchemy model with analysis_result JSONB field
 
 import hashlib
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, BigInteger
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, BigInteger, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
@@ -22,6 +22,10 @@ class Resume(Base):
     """Resume model with AI analysis results."""
 
     __tablename__ = "resumes"
+    __table_args__ = (
+        # Upload cache lookup (T026): one seek on (user, content hash, status)
+        Index("ix_resumes_user_hash_status", "user_id", "file_hash", "status"),
+    )
 
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -98,13 +102,15 @@ class Resume(Base):
         Returns:
             Dictionary with analysis summary
         """
-        if not self.analysis_result:
+        # One instrumented-attribute read instead of one per field
+        analysis = self.analysis_result
+        if not analysis:
             return {}
 
         return {
-            "strengths_count": len(self.analysis_result.get("strengths", [])),
-            "weaknesses_count": len(self.analysis_result.get("weaknesses", [])),
-            "recommendations_count": len(self.analysis_result.get("recommendations", [])),
-            "suitable_roles": self.analysis_result.get("suitable_roles", []),
+            "strengths_count": len(analysis.get("strengths", ())),
+            "weaknesses_count": len(analysis.get("weaknesses", ())),
+            "recommendations_count": len(analysis.get("recommendations", ())),
+            "suitable_roles": analysis.get("suitable_roles", []),
             "analyzed_at": self.analyzed_at.isoformat() if self.analyzed_at else None,
         }
@@ -11,16 +11,19 @@ T043: PUT /cover-letter/{id} endpoint
 T044: Logging + PII scrubbing
 """
 
+import json
+import logging
 import time
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.database import get_db
-from src.services.cover_letter_service import CoverLetterService
+from src.database import get_async_db, get_async_session_factory
+from src.services.cover_letter_service import CoverLetterService, run_queued_regenerations
 from src.utils.logging_config import get_logger
-from src.utils.privacy import scrub_all_pii
+from src.utils.privacy import scrub_all_pii_async
 
 logger = get_logger(__name__)
 
@@ -40,10 +43,22 @@ class CoverLetterGenerateRequest(BaseModel):
     custom_instructions: Optional[str] = Field(None, max_length=1000, description="Additional instructions")
 
 
+class CoverLetterBatchRequest(BaseModel):
+    """Request model for generating several cover letter variants at once."""
+    variants: List[CoverLetterGenerateRequest] = Field(
+        ..., min_length=1, max_length=10, description="Generation parameters per variant"
+    )
+
+
 class CoverLetterUpdateRequest(BaseModel):
     """Request model for cover letter update."""
     content: Optional[str] = Field(None, description="New content for manual edit")
     regenerate: bool = Field(False, description="If True, regenerate with AI")
+    priority: str = Field(
+        "high",
+        pattern="^(high|low)$",
+        description="Regeneration lane: high = inline, low = queued background batch",
+    )
 
 
 class CoverLetterResponse(BaseModel):
@@ -72,7 +87,7 @@ def get_current_user_id() -> int:
 @router.post("/generate", status_code=status.HTTP_201_CREATED)
 async def generate_cover_letter(
     request: CoverLetterGenerateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: int = Depends(get_current_user_id),
 ) -> Dict[str, Any]:
     """
@@ -98,17 +113,21 @@ async def generate_cover_letter(
     """
     start_time = time.time()
 
-    logger.info(
-        "cover_letter_generate_request",
-        operation="generate_cover_letter",
-        user_id=f"user-{user_id}",
-        job_title=scrub_all_pii(request.job_title),
-        company_name=scrub_all_pii(request.company_name),
-        has_job_description=bool(request.job_description),
-        resume_id=request.resume_id,
-        tone=request.tone,
-        length=request.length,
-    )
+    # PII scrubbing is regex-heavy; skip it when INFO is filtered out and
+    # run it off the event loop otherwise
+    if logger.isEnabledFor(logging.INFO):
+        safe_title, safe_company = await scrub_all_pii_async(request.job_title, request.company_name)
+        logger.info(
+            "cover_letter_generate_request",
+            operation="generate_cover_letter",
+            user_id=f"user-{user_id}",
+            job_title=safe_title,
+            company_name=safe_company,
+            has_job_description=bool(request.job_description),
+            resume_id=request.resume_id,
+            tone=request.tone,
+            length=request.length,
+        )
 
     try:
         service = CoverLetterService(db)
@@ -194,10 +213,156 @@ async def generate_cover_letter(
         )
 
 
+@router.post("/generate/stream")
+async def stream_cover_letter(
+    request: CoverLetterGenerateRequest,
+    session_factory: async_sessionmaker = Depends(get_async_session_factory),
+    user_id: int = Depends(get_current_user_id),
+) -> StreamingResponse:
+    """
+    Generate a cover letter and stream it as Server-Sent Events.
+
+    Events (each a "data: <json>" line):
+        {"type": "chunk", "text": str}  - repeated as text is generated
+        {"type": "done", "cover_letter_id": int, "status": str, "word_count": int}
+        {"type": "error", "cover_letter_id": int, "message": str}
+
+    Args:
+        request: Generation parameters
+        session_factory: Opens the stream's own database session
+        user_id: Current user ID
+    """
+    # PII scrubbing is regex-heavy; skip it when INFO is filtered out and
+    # run it off the event loop otherwise
+    if logger.isEnabledFor(logging.INFO):
+        safe_title, safe_company = await scrub_all_pii_async(request.job_title, request.company_name)
+        logger.info(
+            "cover_letter_stream_request",
+            operation="stream_cover_letter",
+            user_id=f"user-{user_id}",
+            job_title=safe_title,
+            company_name=safe_company,
+            resume_id=request.resume_id,
+        )
+
+    async def event_stream():
+        # Own session: yield-dependencies are closed before the body streams
+        async with session_factory() as db:
+            service = CoverLetterService(db)
+            async for event in service.stream_cover_letter(
+                user_id=user_id,
+                job_title=request.job_title,
+                company_name=request.company_name,
+                job_description=request.job_description,
+                resume_id=request.resume_id,
+                tone=request.tone,
+                length=request.length,
+                focus_areas=request.focus_areas,
+                custom_instructions=request.custom_instructions,
+            ):
+                yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/generate-batch", status_code=status.HTTP_201_CREATED)
+async def generate_cover_letter_batch(
+    request: CoverLetterBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+    user_id: int = Depends(get_current_user_id),
+) -> Dict[str, Any]:
+    """
+    Generate multiple cover letter variants concurrently.
+
+    Args:
+        request: List of generation parameters
+        db: Database session
+        user_id: Current user ID
+
+    Returns:
+        {
+            "cover_letters": [
+                {"cover_letter_id": int, "status": str, "content": str | null,
+                 "word_count": int, "error": str | null, ...}
+            ],
+            "count": int,
+            "failed_count": int,
+            "duration_ms": int
+        }
+    """
+    start_time = time.time()
+
+    logger.info(
+        "cover_letter_batch_request",
+        operation="generate_cover_letter_batch",
+        user_id=f"user-{user_id}",
+        batch_size=len(request.variants),
+    )
+
+    try:
+        service = CoverLetterService(db)
+
+        cover_letters = await service.generate_cover_letter_batch(
+            user_id=user_id,
+            specs=[variant.model_dump() for variant in request.variants],
+        )
+
+        duration_ms = int((time.time() - start_time) * 1000)
+
+        return {
+            "cover_letters": [
+                {
+                    "cover_letter_id": cl.id,
+                    "status": cl.status,
+                    "content": cl.content,
+                    "job_title": cl.job_title,
+                    "company_name": cl.company_name,
+                    "word_count": cl.get_word_count(),
+                    "version": cl.version,
+                    "error": cl.error_message,
+                }
+                for cl in cover_letters
+            ],
+            "count": len(cover_letters),
+            "failed_count": sum(1 for cl in cover_letters if cl.status == "failed"),
+            "duration_ms": duration_ms,
+        }
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(e)},
+        )
+
+    except Exception as e:
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.error(
+            "cover_letter_batch_error",
+            operation="generate_cover_letter_batch",
+            user_id=f"user-{user_id}",
+            duration_ms=duration_ms,
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "message": "An unexpected error occurred during batch cover letter generation",
+                "error": str(e),
+            },
+        )
+
+
 @router.get("/{cover_letter_id}")
 async def get_cover_letter(
     cover_letter_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: int = Depends(get_current_user_id),
 ) -> Dict[str, Any]:
     """
@@ -219,7 +384,7 @@ async def get_cover_letter(
     )
 
     service = CoverLetterService(db)
-    cover_letter = service.get_cover_letter_by_id(cover_letter_id, user_id)
+    cover_letter = await service.get_cover_letter_by_id(cover_letter_id, user_id)
 
     if not cover_letter:
         raise HTTPException(
@@ -246,7 +411,8 @@ async def get_cover_letter(
 async def update_cover_letter(
     cover_letter_id: int,
     request: CoverLetterUpdateRequest,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
     user_id: int = Depends(get_current_user_id),
 ) -> Dict[str, Any]:
     """
@@ -254,9 +420,13 @@ async def update_cover_letter(
 
     T043: Cover letter update endpoint
 
+    Low-priority regenerations return immediately with status "queued" and
+    are generated in the background.
+
     Args:
         cover_letter_id: Cover letter ID
         request: Update parameters
+        background_tasks: Schedules the queued regeneration batch
         db: Database session
         user_id: Current user ID
 
@@ -282,8 +452,12 @@ async def update_cover_letter(
             user_id=user_id,
             content=request.content,
             regenerate=request.regenerate,
+            priority=request.priority,
         )
 
+        if cover_letter.status == "queued":
+            background_tasks.add_task(run_queued_regenerations)
+
         duration_ms = int((time.time() - start_time) * 1000)
 
         logger.info(
@@ -301,7 +475,11 @@ async def update_cover_letter(
             "content": cover_letter.content,
             "version": cover_letter.version,
             "word_count": cover_letter.get_word_count(),
-            "message": "Cover letter updated successfully",
+            "message": (
+                "Cover letter regeneration queued"
+                if cover_letter.status == "queued"
+                else "Cover letter updated successfully"
+            ),
             "duration_ms": duration_ms,
         }
 
@@ -331,7 +509,7 @@ async def update_cover_letter(
 
 @router.get("/")
 async def list_cover_letters(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: int = Depends(get_current_user_id),
     limit: int = 20,
 ) -> Dict[str, Any]:
@@ -354,7 +532,7 @@ async def list_cover_letters(
     )
 
     service = CoverLetterService(db)
-    cover_letters = service.get_user_cover_letters(user_id, limit)
+    cover_letters = await service.get_user_cover_letters(user_id, limit)
 
     return {
         "cover_letters": [cl.get_summary() for cl in cover_letters],
@@ -10,13 +10,15 @@ T070: POST /interview/generate-questions endpoint
 T071: POST /interview/evaluate-answer endpoint
 """
 
+import json
 import time
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
 
-from src.database import get_db
+from src.database import get_db, get_session_factory
 from src.services.interview_service import InterviewService
 from src.utils.logging_config import get_logger
 from src.utils.privacy import scrub_all_pii
@@ -107,7 +109,7 @@ async def generate_interview_questions(
     Returns:
         Interview session with generated questions
     """
-    start_time = time.time()
+    start_time = time.monotonic()
 
     logger.info(
         "api_generate_questions_started",
@@ -134,7 +136,7 @@ async def generate_interview_questions(
             language=request.language,
         )
 
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = int((time.monotonic() - start_time) * 1000)
 
         logger.info(
             "api_generate_questions_completed",
@@ -178,6 +180,60 @@ async def generate_interview_questions(
         )
 
 
+@router.post("/generate-questions/stream")
+async def stream_interview_questions(
+    request: GenerateQuestionsRequest,
+    session_factory: sessionmaker = Depends(get_session_factory),
+    user_id: int = Depends(get_current_user_id),
+) -> StreamingResponse:
+    """
+    Generate mock interview questions and stream them as Server-Sent Events.
+
+    Events (each a "data: <json>" line):
+        {"type": "question", "question": dict}  - one per question, in order
+        {"type": "done", "interview_id": int, "status": str, "question_count": int}
+        {"type": "error", "interview_id": int, "message": str}
+
+    Args:
+        request: Generation parameters
+        session_factory: Opens the stream's own database session
+        user_id: Current user ID
+    """
+    logger.info(
+        "api_stream_questions_started",
+        operation="stream_questions",
+        user_id=f"user-{user_id}",
+        job_title=scrub_all_pii(request.job_title),
+        interview_type=request.interview_type,
+        question_count=request.question_count,
+    )
+
+    async def event_stream():
+        # Own session: yield-dependencies are closed before the body streams
+        with session_factory() as db:
+            service = InterviewService(db)
+            async for event in service.stream_interview(
+                user_id=user_id,
+                job_title=request.job_title,
+                company_name=request.company_name,
+                job_description=request.job_description,
+                resume_id=request.resume_id,
+                job_id=request.job_id,
+                interview_type=request.interview_type,
+                difficulty=request.difficulty,
+                question_count=request.question_count,
+                focus_areas=request.focus_areas,
+                language=request.language,
+            ):
+                yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/{interview_id}/evaluate-answer", status_code=status.HTTP_200_OK)
 async def evaluate_answer(
     interview_id: int,
@@ -194,12 +250,14 @@ async def evaluate_answer(
     - Score (0-100)
     - Strengths and improvements
     - Detailed feedback
-    - Model answer example
+
+    The model answer is fetched separately from
+    GET /interview/{interview_id}/answers/{question_id}/model-answer.
 
     Returns:
         Evaluation result with feedback
     """
-    start_time = time.time()
+    start_time = time.monotonic()
 
     logger.info(
         "api_evaluate_answer_started",
@@ -227,7 +285,7 @@ async def evaluate_answer(
             answer_audio_url=request.answer_audio_url,
         )
 
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = int((time.monotonic() - start_time) * 1000)
 
         logger.info(
             "api_evaluate_answer_completed",
@@ -266,6 +324,50 @@ async def evaluate_answer(
         )
 
 
+@router.get("/{interview_id}/answers/{question_id}/model-answer", status_code=status.HTTP_200_OK)
+async def get_model_answer(
+    interview_id: int,
+    question_id: int,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+) -> Dict[str, Any]:
+    """
+    Get the model answer for an answered question.
+
+    Generated on first request and stored with the answer, so answer
+    evaluation itself stays fast.
+    """
+    logger.info(
+        "api_get_model_answer",
+        operation="get_model_answer",
+        interview_id=interview_id,
+        question_id=question_id,
+    )
+
+    try:
+        service = InterviewService(db)
+        model_answer = await service.get_model_answer(interview_id, user_id, question_id)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"message": str(e)},
+        )
+    except Exception as e:
+        logger.error(
+            "api_get_model_answer_failed",
+            operation="get_model_answer",
+            error=str(e),
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"message": "Failed to generate model answer"},
+        )
+
+    return {"question_id": question_id, "model_answer": model_answer}
+
+
 @router.get("/{interview_id}", status_code=status.HTTP_200_OK)
 async def get_interview(
     interview_id: int,
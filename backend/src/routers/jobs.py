@@ -10,14 +10,16 @@ T057: POST /jobs/recommend endpoint
 T058: POST /jobs/match endpoint
 """
 
+import json
 import time
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
 
-from src.database import get_db
-from src.services.job_service import JobService
+from src.database import get_db, get_session_factory
+from src.services.job_service import JobService, RecommendationItem
 from src.utils.logging_config import get_logger
 from src.utils.privacy import scrub_all_pii
 
@@ -45,6 +47,24 @@ class JobMatchRequest(BaseModel):
     company: Optional[str] = Field(None, max_length=255, description="Company name")
 
 
+class JobMatchItem(BaseModel):
+    """One job in a batch match request."""
+    job_title: str = Field(..., min_length=1, max_length=255, description="Job title")
+    job_description: str = Field(..., min_length=10, max_length=10000, description="Job description")
+    company: Optional[str] = Field(None, max_length=255, description="Company name")
+
+
+class JobMatchBatchRequest(BaseModel):
+    """Request model for matching several jobs against one resume."""
+    resume_id: int = Field(..., description="Resume ID to analyze")
+    jobs: List[JobMatchItem] = Field(..., min_length=1, max_length=10, description="Jobs to analyze")
+
+
+class JobMatchRefreshRequest(BaseModel):
+    """Request model for re-scoring saved jobs."""
+    resume_id: int = Field(..., description="Resume ID to score saved jobs against")
+
+
 class JobSaveRequest(BaseModel):
     """Request model for saving a job."""
     title: str = Field(..., min_length=1, max_length=255)
@@ -55,6 +75,11 @@ class JobSaveRequest(BaseModel):
     url: Optional[str] = Field(None, max_length=1000)
 
 
+class JobRecommendSaveRequest(BaseModel):
+    """Request model for saving AI recommendations as jobs."""
+    recommendations: List[RecommendationItem] = Field(..., min_length=1, max_length=20)
+
+
 class JobSearchRequest(BaseModel):
     """Request model for job search."""
     query: Optional[str] = Field(None, max_length=255)
@@ -149,6 +174,55 @@ async def get_job_recommendations(
         )
 
 
+@router.post("/recommend/stream")
+async def stream_job_recommendations(
+    request: JobRecommendRequest,
+    session_factory: sessionmaker = Depends(get_session_factory),
+    user_id: int = Depends(get_current_user_id),
+) -> StreamingResponse:
+    """
+    Get job recommendations streamed as Server-Sent Events.
+
+    Events (each a "data: <json>" line):
+        {"type": "recommendation", "recommendation": dict}  - one per item, in order
+        {"type": "done", "count": int}
+        {"type": "error", "message": str}
+    """
+    logger.info(
+        "job_recommend_stream_request",
+        operation="stream_job_recommendations",
+        user_id=f"user-{user_id}",
+        resume_id=request.resume_id,
+        limit=request.limit,
+    )
+
+    preferences = {
+        "location": request.location,
+        "job_type": request.job_type,
+        "experience_level": request.experience_level,
+        "industry": request.industry,
+    }
+    preferences = {k: v for k, v in preferences.items() if v}
+
+    async def event_stream():
+        # Own session: yield-dependencies are closed before the body streams
+        with session_factory() as db:
+            service = JobService(db)
+            async for event in service.stream_job_recommendations(
+                user_id=user_id,
+                resume_id=request.resume_id,
+                job_preferences=preferences if preferences else None,
+                limit=request.limit,
+            ):
+                yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/match", status_code=status.HTTP_200_OK)
 async def analyze_job_match(
     request: JobMatchRequest,
@@ -221,6 +295,76 @@ async def analyze_job_match(
         )
 
 
+@router.post("/match/batch", status_code=status.HTTP_200_OK)
+async def analyze_job_matches(
+    request: JobMatchBatchRequest,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+) -> Dict[str, Any]:
+    """
+    Analyze several jobs against one resume in a single request.
+
+    Returns:
+        Match analyses in request order
+    """
+    start_time = time.time()
+
+    logger.info(
+        "job_match_batch_request",
+        operation="analyze_job_matches",
+        user_id=f"user-{user_id}",
+        resume_id=request.resume_id,
+        jobs_count=len(request.jobs),
+    )
+
+    try:
+        service = JobService(db)
+
+        analyses = await service.analyze_job_matches(
+            user_id=user_id,
+            resume_id=request.resume_id,
+            jobs=[job.model_dump() for job in request.jobs],
+        )
+
+        duration_ms = int((time.time() - start_time) * 1000)
+
+        logger.info(
+            "job_match_batch_success",
+            operation="analyze_job_matches",
+            user_id=f"user-{user_id}",
+            jobs_count=len(analyses),
+            duration_ms=duration_ms,
+        )
+
+        return {
+            "matches": [
+                {"analysis": analysis, "job_title": job.job_title, "company": job.company}
+                for job, analysis in zip(request.jobs, analyses)
+            ],
+            "count": len(analyses),
+            "duration_ms": duration_ms,
+        }
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(e)},
+        )
+
+    except Exception as e:
+        logger.error(
+            "job_match_batch_error",
+            operation="analyze_job_matches",
+            user_id=f"user-{user_id}",
+            error=str(e),
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"message": str(e)},
+        )
+
+
 @router.post("/save", status_code=status.HTTP_201_CREATED)
 async def save_job(
     request: JobSaveRequest,
@@ -267,6 +411,40 @@ async def save_job(
         )
 
 
+@router.post("/recommend/save", status_code=status.HTTP_201_CREATED)
+async def save_recommendations(
+    request: JobRecommendSaveRequest,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+) -> Dict[str, Any]:
+    """Save recommendations from /jobs/recommend to the user's job list."""
+    try:
+        service = JobService(db)
+
+        job_ids = service.save_recommendations_as_jobs(
+            user_id,
+            [rec.model_dump() for rec in request.recommendations],
+        )
+
+    except Exception as e:
+        logger.error(
+            "recommendations_save_error",
+            operation="save_recommendations",
+            error=str(e),
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"message": "Failed to save recommendations"},
+        )
+
+    return {
+        "job_ids": job_ids,
+        "count": len(job_ids),
+        "message": "Recommendations saved successfully",
+    }
+
+
 @router.get("/saved")
 async def get_saved_jobs(
     db: Session = Depends(get_db),
@@ -283,6 +461,30 @@ async def get_saved_jobs(
     }
 
 
+@router.post("/saved/refresh-matches", status_code=status.HTTP_200_OK)
+async def refresh_saved_job_matches(
+    request: JobMatchRefreshRequest,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+) -> Dict[str, Any]:
+    """Re-score all saved jobs against a resume (bulk match)."""
+    service = JobService(db)
+
+    try:
+        jobs = await service.refresh_saved_job_matches(user_id, request.resume_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(e)},
+        )
+
+    return {
+        "jobs": [job.get_summary() for job in jobs],
+        "count": len(jobs),
+        "resume_id": request.resume_id,
+    }
+
+
 @router.post("/search")
 async def search_jobs(
     request: JobSearchRequest,
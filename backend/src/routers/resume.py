@@ -8,15 +8,23 @@ Constitution Compliance:
 
 T027: POST /resume/upload endpoint
 T028: GET /resume/{id}/analysis endpoint
+
+Large files can skip the multipart parser: POST /resume/upload-url returns a
+presigned PUT URL, the client uploads straight to object storage, then
+POST /resume/ingest runs the same analysis pipeline on the stored object.
 """
 
 import time
-from typing import Dict, Any
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from src.config import settings
 from src.database import get_db
 from src.services.resume_service import ResumeService
+from src.services.storage_service import StorageService
 from src.utils.logging_config import get_logger
 from src.utils.privacy import scrub_all_pii
 
@@ -25,6 +33,56 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/resume", tags=["resume"])
 
 
+# Request Models
+class ResumeUploadUrlRequest(BaseModel):
+    """Request model for a presigned direct upload."""
+    filename: str = Field(..., min_length=1, max_length=255, description="Original filename (PDF or DOCX)")
+    content_type: str = Field(..., min_length=1, max_length=255, description="MIME type sent with the PUT")
+
+
+class ResumeIngestRequest(BaseModel):
+    """Request model for analyzing a directly uploaded resume."""
+    object_key: str = Field(..., min_length=1, max_length=512, description="Key returned by /resume/upload-url")
+    filename: Optional[str] = Field(None, max_length=255, description="Original filename")
+
+
+# Response Models (serialized by pydantic-core instead of jsonable_encoder)
+class AnalysisResult(BaseModel):
+    """Gemini resume analysis (see GeminiClient.analyze_resume_text)."""
+    # protected_namespaces=(): model_used is a data field, not pydantic's model_ API
+    model_config = ConfigDict(extra="allow", protected_namespaces=())
+
+    strengths: List[Any] = Field(default_factory=list)
+    weaknesses: List[Any] = Field(default_factory=list)
+    recommendations: List[Any] = Field(default_factory=list)
+    suitable_roles: List[Any] = Field(default_factory=list)
+    skills: List[Any] = Field(default_factory=list)
+    experience_years: Optional[Union[int, float]] = 0
+    ats_score: Optional[Dict[str, Any]] = None
+    analyzed_at: Optional[float] = None
+    model_used: Optional[str] = None
+
+
+class ResumeUploadResponse(BaseModel):
+    """Response model for resume upload/ingest."""
+    resume_id: int
+    status: str
+    analysis: Optional[AnalysisResult]
+    message: str
+    duration_ms: int
+
+
+class ResumeAnalysisResponse(BaseModel):
+    """Response model for resume analysis retrieval."""
+    resume_id: int
+    original_filename: str
+    status: str
+    analysis: Optional[AnalysisResult]
+    created_at: Optional[datetime]
+    analyzed_at: Optional[datetime]
+    error_message: Optional[str]
+
+
 def get_current_user_id() -> int:
     """
     Get current user ID from auth context.
@@ -39,12 +97,12 @@ def get_current_user_id() -> int:
     return 1
 
 
-@router.post("/upload", status_code=status.HTTP_201_CREATED)
+@router.post("/upload", status_code=status.HTTP_201_CREATED, response_model=ResumeUploadResponse)
 async def upload_resume(
     file: UploadFile = File(..., description="Resume file (PDF or DOCX, max 5MB)"),
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
-) -> Dict[str, Any]:
+) -> ResumeUploadResponse:
     """
     Upload and analyze resume.
 
@@ -109,13 +167,13 @@ async def upload_resume(
                 status=resume.status,
             )
 
-            return {
-                "resume_id": resume.id,
-                "status": resume.status,
-                "analysis": resume.analysis_result,
-                "message": "Resume analyzed successfully",
-                "duration_ms": duration_ms,
-            }
+            return ResumeUploadResponse(
+                resume_id=resume.id,
+                status=resume.status,
+                analysis=resume.analysis_result,
+                message="Resume analyzed successfully",
+                duration_ms=duration_ms,
+            )
         else:
             # Analysis failed
             logger.error(
@@ -175,12 +233,235 @@ async def upload_resume(
         )
 
 
-@router.get("/{resume_id}/analysis")
+@router.post("/upload-url")
+async def create_resume_upload_url(
+    request: ResumeUploadUrlRequest,
+    user_id: int = Depends(get_current_user_id),
+) -> Dict[str, Any]:
+    """
+    Create a presigned URL for uploading a resume directly to object storage.
+
+    The client PUTs the file to upload_url (with the same Content-Type), then
+    calls POST /resume/ingest with the returned object_key.
+
+    Args:
+        request: Filename and content type of the file to upload
+        user_id: Current user ID from auth
+
+    Returns:
+        {
+            "upload_url": str,
+            "object_key": str,
+            "method": "PUT",
+            "content_type": str,
+            "expires_in": int
+        }
+
+    Raises:
+        HTTPException 400: Invalid file type
+        HTTPException 503: Direct uploads not configured
+    """
+    logger.info(
+        "resume_upload_url_request",
+        operation="create_resume_upload_url",
+        user_id=f"user-{user_id}",
+        filename=scrub_all_pii(request.filename),
+        content_type=request.content_type,
+    )
+
+    if not settings.resume_upload_bucket:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"message": "Direct uploads are not configured; use POST /resume/upload"},
+        )
+
+    try:
+        # Reject unsupported types before handing out a URL
+        ResumeService.validate_file_type(request.filename, request.content_type)
+
+        return StorageService().create_upload_url(
+            user_id=user_id,
+            filename=request.filename,
+            content_type=request.content_type,
+        )
+
+    except ValueError as e:
+        logger.warning(
+            "resume_upload_url_validation_error",
+            operation="create_resume_upload_url",
+            user_id=f"user-{user_id}",
+            error=str(e),
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(e)},
+        )
+
+    except Exception as e:
+        logger.error(
+            "resume_upload_url_error",
+            operation="create_resume_upload_url",
+            user_id=f"user-{user_id}",
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "message": "An unexpected error occurred while creating the upload URL",
+                "error": str(e),
+            },
+        )
+
+
+@router.post("/ingest", status_code=status.HTTP_201_CREATED, response_model=ResumeUploadResponse)
+async def ingest_resume(
+    request: ResumeIngestRequest,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+) -> ResumeUploadResponse:
+    """
+    Analyze a resume that was uploaded directly to object storage.
+
+    Same response shape as POST /resume/upload.
+
+    Args:
+        request: Object key from /resume/upload-url and optional filename
+        db: Database session
+        user_id: Current user ID from auth
+
+    Returns:
+        Resume upload and analysis results (see POST /resume/upload)
+
+    Raises:
+        HTTPException 400: Invalid object key, file type or size
+        HTTPException 404: No uploaded object under the key
+        HTTPException 503: Direct uploads not configured
+        HTTPException 500: Analysis failed
+    """
+    start_time = time.time()
+
+    logger.info(
+        "resume_ingest_request",
+        operation="ingest_resume",
+        user_id=f"user-{user_id}",
+    )
+
+    if not settings.resume_upload_bucket:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"message": "Direct uploads are not configured; use POST /resume/upload"},
+        )
+
+    try:
+        resume_service = ResumeService(db)
+
+        resume = await resume_service.ingest_and_analyze_resume(
+            object_key=request.object_key,
+            user_id=user_id,
+            filename=request.filename,
+        )
+
+        duration_ms = int((time.time() - start_time) * 1000)
+
+        if resume.status != "analyzed":
+            logger.error(
+                "resume_ingest_failed",
+                operation="ingest_resume",
+                user_id=f"user-{user_id}",
+                resume_id=resume.id,
+                duration_ms=duration_ms,
+                status=resume.status,
+                error=resume.error_message,
+            )
+
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "message": "Resume analysis failed",
+                    "error": resume.error_message,
+                    "resume_id": resume.id,
+                },
+            )
+
+        logger.info(
+            "resume_ingest_success",
+            operation="ingest_resume",
+            user_id=f"user-{user_id}",
+            resume_id=resume.id,
+            duration_ms=duration_ms,
+            status=resume.status,
+        )
+
+        return ResumeUploadResponse(
+            resume_id=resume.id,
+            status=resume.status,
+            analysis=resume.analysis_result,
+            message="Resume analyzed successfully",
+            duration_ms=duration_ms,
+        )
+
+    except HTTPException:
+        raise
+
+    except FileNotFoundError as e:
+        logger.warning(
+            "resume_ingest_object_not_found",
+            operation="ingest_resume",
+            user_id=f"user-{user_id}",
+            error=str(e),
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"message": str(e)},
+        )
+
+    except ValueError as e:
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.warning(
+            "resume_ingest_validation_error",
+            operation="ingest_resume",
+            user_id=f"user-{user_id}",
+            duration_ms=duration_ms,
+            error=str(e),
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(e)},
+        )
+
+    except Exception as e:
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.error(
+            "resume_ingest_error",
+            operation="ingest_resume",
+            user_id=f"user-{user_id}",
+            duration_ms=duration_ms,
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "message": "An unexpected error occurred during resume ingest",
+                "error": str(e),
+            },
+        )
+
+
+@router.get("/{resume_id}/analysis", response_model=ResumeAnalysisResponse)
 async def get_resume_analysis(
     resume_id: int,
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
-) -> Dict[str, Any]:
+) -> ResumeAnalysisResponse:
     """
     Retrieve resume analysis results.
 
@@ -255,18 +536,16 @@ async def get_resume_analysis(
             status=resume.status,
         )
 
-        # Build response
-        response = {
-            "resume_id": resume.id,
-            "original_filename": scrub_all_pii(resume.original_filename),
-            "status": resume.status,
-            "analysis": resume.analysis_result if resume.is_analyzed() else None,
-            "created_at": resume.created_at.isoformat() if resume.created_at else None,
-            "analyzed_at": resume.analyzed_at.isoformat() if resume.analyzed_at else None,
-            "error_message": resume.error_message if resume.status == "failed" else None,
-        }
-
-        return response
+        # Build response (datetimes are ISO-encoded by the response model)
+        return ResumeAnalysisResponse(
+            resume_id=resume.id,
+            original_filename=scrub_all_pii(resume.original_filename),
+            status=resume.status,
+            analysis=resume.analysis_result if resume.is_analyzed() else None,
+            created_at=resume.created_at,
+            analyzed_at=resume.analyzed_at,
+            error_message=resume.error_message if resume.status == "failed" else None,
+        )
 
     except HTTPException:
         # Re-raise HTTP exceptions
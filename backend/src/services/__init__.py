@@ -6,7 +6,7 @@ Constitution Compliance:
 - Principle V: Code Quality - Structured logging in all services
 """
 
-from src.services.gemini_client import GeminiClient
+from src.services.gemini_client import GeminiClient, GEMINI_SEMAPHORE, get_gemini_client
 from src.services.resume_service import ResumeService
 
-__all__ = ["GeminiClient", "ResumeService"]
+__all__ = ["GeminiClient", "GEMINI_SEMAPHORE", "get_gemini_client", "ResumeService"]
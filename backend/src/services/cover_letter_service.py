@@ -10,21 +10,93 @@ T039: Cover Letter service
 T040-T041: Gemini cover letter generation prompts
 """
 
+import asyncio
+import logging
 import time
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
+from datetime import datetime, timezone
 
-from sqlalchemy.orm import Session
+import anyio
+from sqlalchemy import select, update
+from sqlalchemy.orm import load_only
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
+from src.database import get_async_session_factory
 from src.models.cover_letter import CoverLetter
 from src.models.resume import Resume
-from src.services.gemini_client import GeminiClient
+from src.services.gemini_client import ANALYSIS_MAX_OUTPUT_TOKENS, GeminiClient, get_gemini_client
+from src.utils.cache import cache_get, cache_set, make_cache_key
 from src.utils.logging_config import get_logger
-from src.utils.privacy import scrub_all_pii
+from src.utils.privacy import scrub_all_pii_async
 
 logger = get_logger(__name__)
 
+# Prompt building blocks (T040-T041), shared by every request
+COVER_LETTER_LENGTH_GUIDE = {
+    "short": "250-350 words (3 paragraphs)",
+    "medium": "350-500 words (4 paragraphs)",
+    "long": "500-700 words (5-6 paragraphs)",
+}
+
+# Output token cap per length (~1.3 tokens/word plus headroom so the
+# closing paragraph is never cut off)
+COVER_LETTER_MAX_OUTPUT_TOKENS = {
+    "short": 700,
+    "medium": 1000,
+    "long": 1400,
+}
+
+COVER_LETTER_TONE_GUIDE = {
+    "professional": "formal, polished, and business-appropriate",
+    "casual": "friendly yet professional, conversational but respectful",
+    "enthusiastic": "energetic and passionate, showing genuine excitement",
+}
+
+# Static instructions come first and are byte-identical across requests, so
+# Gemini's implicit prefix caching can reuse them; only the tail varies.
+COVER_LETTER_STATIC_PREFIX = """You are an expert career coach and professional writer. You write compelling cover letters for job applications.
+
+## Structure Guidelines
+1. **Opening**: Hook the reader with a compelling introduction that shows enthusiasm for the role
+2. **Body**: Highlight relevant skills and experiences that match the job requirements
+3. **Connection**: Show understanding of the company and how you can contribute
+4. **Closing**: Strong call to action expressing interest in an interview
+
+## Important Rules
+- Write in first person
+- Be specific and use concrete examples when possible
+- Avoid generic phrases like "I am writing to apply for..."
+- Show personality while maintaining professionalism
+- Tailor content specifically to this company and role
+- Do NOT include placeholder text like [Your Name] - write complete sentences
+- Output ONLY the cover letter text, no additional commentary
+
+Write a cover letter for the following job application.
+"""
+
+COVER_LETTER_CLOSING = """
+Write the cover letter now:
+"""
+
+
+@lru_cache(maxsize=512)
+def _render_resume_section(
+    skills: Tuple[str, ...],
+    experience_years: Any,
+    strengths: Tuple[str, ...],
+    suitable_roles: Tuple[str, ...],
+) -> str:
+    """Render the candidate background block once per distinct resume summary."""
+    return f"""
+## Candidate Background (from resume)
+- **Skills**: {', '.join(skills)}
+- **Experience**: {experience_years} years
+- **Strengths**: {'; '.join(strengths)}
+- **Suitable Roles**: {', '.join(suitable_roles)}
+"""
+
 
 class CoverLetterService:
     """
@@ -38,15 +110,15 @@ class CoverLetterService:
     DEFAULT_TONE = "professional"
     DEFAULT_LENGTH = "medium"
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """
         Initialize cover letter service.
 
         Args:
-            db: Database session
+            db: Async database session (every query/commit is awaited)
         """
         self.db = db
-        self.gemini_client = GeminiClient()
+        self.gemini_client = get_gemini_client()
 
     async def generate_cover_letter(
         self,
@@ -84,35 +156,45 @@ class CoverLetterService:
             ValueError: If invalid parameters
             Exception: If generation fails
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        logger.info(
-            "cover_letter_generation_started",
-            operation="generate_cover_letter",
-            user_id=f"user-{user_id}",
-            job_title=scrub_all_pii(job_title),
-            company_name=scrub_all_pii(company_name),
-            has_job_description=bool(job_description),
-            resume_id=resume_id,
-            tone=tone,
-            length=length,
-        )
+        # PII scrubbing is regex-heavy; skip it when INFO is filtered out and
+        # run it off the event loop otherwise
+        if logger.isEnabledFor(logging.INFO):
+            safe_title, safe_company = await scrub_all_pii_async(job_title, company_name)
+            logger.info(
+                "cover_letter_generation_started",
+                operation="generate_cover_letter",
+                user_id=f"user-{user_id}",
+                job_title=safe_title,
+                company_name=safe_company,
+                has_job_description=bool(job_description),
+                resume_id=resume_id,
+                tone=tone,
+                length=length,
+            )
 
         try:
             # Validate tone and length
-            if tone not in ["professional", "casual", "enthusiastic"]:
+            if tone not in COVER_LETTER_TONE_GUIDE:
                 tone = self.DEFAULT_TONE
-            if length not in ["short", "medium", "long"]:
+            if length not in COVER_LETTER_LENGTH_GUIDE:
                 length = self.DEFAULT_LENGTH
 
             # Get resume data if provided
             resume_summary = None
+            unanalyzed_resume = None
             if resume_id:
-                resume = self._get_user_resume(user_id, resume_id)
-                if resume and resume.analysis_result:
+                resume = await self._get_user_resume(user_id, resume_id, analyzed_only=False)
+                if resume and resume.is_analyzed():
                     resume_summary = self._extract_resume_summary(resume)
+                elif resume:
+                    # Not analyzed yet: fetch the text and analyze + write in one fused call
+                    await self.db.refresh(resume, ["extracted_text"])
+                    if resume.extracted_text:
+                        unanalyzed_resume = resume
 
-            # Create cover letter record
+            # Build the record in memory; it is persisted once, after generation
             cover_letter = CoverLetter(
                 user_id=user_id,
                 resume_id=resume_id,
@@ -128,37 +210,48 @@ class CoverLetterService:
                     "resume_summary": resume_summary,
                 },
             )
-            self.db.add(cover_letter)
-            self.db.commit()
-            self.db.refresh(cover_letter)
-
-            logger.info(
-                "cover_letter_record_created",
-                operation="generate_cover_letter",
-                user_id=f"user-{user_id}",
-                cover_letter_id=cover_letter.id,
-            )
 
             # Generate content with Gemini
             try:
-                generated_content = self._generate_with_gemini(
-                    job_title=job_title,
-                    company_name=company_name,
-                    job_description=job_description,
-                    resume_summary=resume_summary,
-                    tone=tone,
-                    length=length,
-                    focus_areas=focus_areas,
-                    custom_instructions=custom_instructions,
-                    user_id=user_id,
-                )
+                if unanalyzed_resume is not None:
+                    generated_content, resume_summary = await self._analyze_and_write_with_gemini(
+                        resume=unanalyzed_resume,
+                        job_title=job_title,
+                        company_name=company_name,
+                        job_description=job_description,
+                        tone=tone,
+                        length=length,
+                        focus_areas=focus_areas,
+                        custom_instructions=custom_instructions,
+                        user_id=user_id,
+                    )
+                else:
+                    generated_content = await self._generate_with_gemini(
+                        job_title=job_title,
+                        company_name=company_name,
+                        job_description=job_description,
+                        resume_summary=resume_summary,
+                        tone=tone,
+                        length=length,
+                        focus_areas=focus_areas,
+                        custom_instructions=custom_instructions,
+                        user_id=user_id,
+                    )
 
                 cover_letter.content = generated_content
                 cover_letter.status = "generated"
-                cover_letter.generated_at = datetime.utcnow()
-                cover_letter.generation_params["model_used"] = self.gemini_client.model_name
-                cover_letter.generation_params["generated_at"] = time.time()
-                self.db.commit()
+                # One wall-clock read for the column and the params timestamp
+                generated_at = datetime.now(timezone.utc)
+                cover_letter.generated_at = generated_at
+                # Final params built once (no in-place JSONB mutation)
+                cover_letter.generation_params = {
+                    **cover_letter.generation_params,
+                    "resume_summary": resume_summary,
+                    "model_used": self.gemini_client.model_name,
+                    "generated_at": generated_at.timestamp(),
+                }
+                self.db.add(cover_letter)
+                await self.db.commit()
 
                 logger.info(
                     "cover_letter_generation_success",
@@ -169,12 +262,14 @@ class CoverLetterService:
                 )
 
             except Exception as e:
+                # Keep a record of the failure (single commit on this path too)
                 cover_letter.status = "failed"
                 cover_letter.error_message = f"Generation failed: {str(e)}"
-                self.db.commit()
+                self.db.add(cover_letter)
+                await self.db.commit()
                 raise
 
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.monotonic() - start_time) * 1000)
 
             logger.info(
                 "cover_letter_generation_completed",
@@ -197,7 +292,7 @@ class CoverLetterService:
             return cover_letter
 
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.monotonic() - start_time) * 1000)
             logger.error(
                 "cover_letter_generation_failed",
                 operation="generate_cover_letter",
@@ -209,7 +304,132 @@ class CoverLetterService:
             )
             raise
 
-    def _generate_with_gemini(
+    async def generate_cover_letter_batch(
+        self,
+        user_id: int,
+        specs: List[Dict[str, Any]],
+    ) -> List[CoverLetter]:
+        """
+        Generate several cover letters concurrently (e.g. tone x focus variants).
+
+        All Gemini calls are issued at once with asyncio.gather, so N variants
+        take roughly one round trip instead of N. Outbound concurrency is still
+        capped by GEMINI_SEMAPHORE inside GeminiClient. Every row is persisted
+        with a single add_all/commit.
+
+        Args:
+            user_id: User ID
+            specs: List of generation specs, each with the keyword arguments of
+                generate_cover_letter (job_title, company_name, job_description,
+                resume_id, tone, length, focus_areas, custom_instructions)
+
+        Returns:
+            CoverLetter objects in the same order as specs; a failed variant
+            has status "failed" and an error_message
+
+        Raises:
+            ValueError: If specs is empty
+        """
+        if not specs:
+            raise ValueError("At least one cover letter spec is required")
+
+        start_time = time.monotonic()
+
+        logger.info(
+            "cover_letter_batch_started",
+            operation="generate_cover_letter_batch",
+            user_id=f"user-{user_id}",
+            batch_size=len(specs),
+        )
+
+        # Resolve each referenced resume once, not once per variant
+        resume_summaries: Dict[int, Optional[Dict[str, Any]]] = {}
+        for resume_id in {spec.get("resume_id") for spec in specs if spec.get("resume_id")}:
+            resume = await self._get_user_resume(user_id, resume_id)
+            resume_summaries[resume_id] = (
+                self._extract_resume_summary(resume) if resume and resume.analysis_result else None
+            )
+
+        normalized = []
+        for spec in specs:
+            tone = spec.get("tone") or self.DEFAULT_TONE
+            length = spec.get("length") or self.DEFAULT_LENGTH
+            normalized.append({
+                "job_title": spec["job_title"],
+                "company_name": spec["company_name"],
+                "job_description": spec.get("job_description"),
+                "resume_id": spec.get("resume_id"),
+                "resume_summary": resume_summaries.get(spec.get("resume_id")),
+                "tone": tone if tone in COVER_LETTER_TONE_GUIDE else self.DEFAULT_TONE,
+                "length": length if length in COVER_LETTER_LENGTH_GUIDE else self.DEFAULT_LENGTH,
+                "focus_areas": spec.get("focus_areas"),
+                "custom_instructions": spec.get("custom_instructions"),
+            })
+
+        results = await asyncio.gather(
+            *[
+                self._generate_with_gemini(
+                    job_title=item["job_title"],
+                    company_name=item["company_name"],
+                    job_description=item["job_description"],
+                    resume_summary=item["resume_summary"],
+                    tone=item["tone"],
+                    length=item["length"],
+                    focus_areas=item["focus_areas"],
+                    custom_instructions=item["custom_instructions"],
+                    user_id=user_id,
+                )
+                for item in normalized
+            ],
+            return_exceptions=True,
+        )
+
+        generated_at = datetime.now(timezone.utc)
+        cover_letters = []
+        for item, result in zip(normalized, results):
+            cover_letter = CoverLetter(
+                user_id=user_id,
+                resume_id=item["resume_id"],
+                job_title=item["job_title"],
+                company_name=item["company_name"],
+                job_description=item["job_description"],
+                generation_params={
+                    "tone": item["tone"],
+                    "length": item["length"],
+                    "focus_areas": item["focus_areas"] or [],
+                    "custom_instructions": item["custom_instructions"],
+                    "resume_summary": item["resume_summary"],
+                    "model_used": self.gemini_client.model_name,
+                    "generated_at": generated_at.timestamp(),
+                },
+            )
+            if isinstance(result, Exception):
+                cover_letter.status = "failed"
+                cover_letter.error_message = f"Generation failed: {str(result)}"
+            else:
+                cover_letter.content = result
+                cover_letter.status = "generated"
+                cover_letter.generated_at = generated_at
+            cover_letters.append(cover_letter)
+
+        self.db.add_all(cover_letters)
+        await self.db.commit()
+
+        duration_ms = int((time.monotonic() - start_time) * 1000)
+        failed_count = sum(1 for cl in cover_letters if cl.status == "failed")
+
+        logger.info(
+            "cover_letter_batch_completed",
+            operation="generate_cover_letter_batch",
+            user_id=f"user-{user_id}",
+            batch_size=len(cover_letters),
+            failed_count=failed_count,
+            duration_ms=duration_ms,
+        )
+
+        return cover_letters
+
+    async def _generate_with_gemini(
         self,
         job_title: str,
         company_name: str,
@@ -220,12 +440,17 @@ class CoverLetterService:
         focus_areas: Optional[List[str]],
         custom_instructions: Optional[str],
         user_id: int,
+        use_cache: bool = False,
     ) -> str:
         """
         Generate cover letter content using Gemini.
 
         T040-T041: Prompt engineering for cover letter generation
 
+        Args:
+            use_cache: Reuse the result of an identical earlier prompt from
+                Redis (regenerations only; first generations always call Gemini)
+
         Returns:
             Generated cover letter text
         """
@@ -240,6 +465,21 @@ class CoverLetterService:
             custom_instructions=custom_instructions,
         )
 
+        cache_key = None
+        if use_cache and settings.cover_letter_cache_enabled:
+            cache_key = make_cache_key(
+                "cover_letter",
+                {"model": self.gemini_client.model_name, "prompt": prompt},
+            )
+            cached = await cache_get(cache_key)
+            if cached is not None:
+                logger.info(
+                    "cover_letter_cache_hit",
+                    operation="generate_with_gemini",
+                    user_id=f"user-{user_id}",
+                )
+                return cached
+
         logger.info(
             "gemini_cover_letter_request",
             operation="generate_with_gemini",
@@ -247,19 +487,233 @@ class CoverLetterService:
             prompt_length=len(prompt),
         )
 
-        # Call Gemini API
-        response = self.gemini_client.model.generate_content(prompt)
-
-        # Clean response
-        content = response.text.strip()
+        # Call Gemini API (async, bounded by GEMINI_SEMAPHORE)
+        response_text = await self.gemini_client.generate_content(
+            prompt,
+            generation_config={"max_output_tokens": self._max_output_tokens(length)},
+        )
+        content = self._clean_generated_content(response_text)
 
-        # Remove markdown code blocks if present
-        if content.startswith("```"):
-            lines = content.split("\n")
-            content = "\n".join(lines[1:-1] if lines[-1] == "```" else lines[1:])
+        if cache_key is not None:
+            await cache_set(cache_key, content, settings.cover_letter_cache_ttl_seconds)
 
         return content
 
+    @staticmethod
+    def _max_output_tokens(length: str) -> int:
+        """Output token cap for a cover letter of the given length."""
+        return COVER_LETTER_MAX_OUTPUT_TOKENS.get(length, COVER_LETTER_MAX_OUTPUT_TOKENS["medium"])
+
+    @staticmethod
+    def _clean_generated_content(response_text: str) -> str:
+        """Strip whitespace and a surrounding markdown code block, if present."""
+        return GeminiClient._strip_code_fences(response_text)
+
+    async def stream_cover_letter(
+        self,
+        user_id: int,
+        job_title: str,
+        company_name: str,
+        job_description: Optional[str] = None,
+        resume_id: Optional[int] = None,
+        tone: str = "professional",
+        length: str = "medium",
+        focus_areas: Optional[List[str]] = None,
+        custom_instructions: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a cover letter, yielding text as Gemini streams it.
+
+        Same prompt and record lifecycle as generate_cover_letter, but the
+        caller sees the first tokens in ~1s. Chunks are only buffered in
+        memory; the full text is cleaned and committed once at the end.
+        Unanalyzed resumes are not personalized here (the fused
+        analyze-and-write path returns JSON and cannot be streamed).
+
+        Yields:
+            {"type": "chunk", "text": str} for each chunk, then a final
+            {"type": "done", "cover_letter_id", "status", "word_count"}
+            or {"type": "error", "cover_letter_id", "message"}
+        """
+        start_time = time.monotonic()
+
+        if tone not in COVER_LETTER_TONE_GUIDE:
+            tone = self.DEFAULT_TONE
+        if length not in COVER_LETTER_LENGTH_GUIDE:
+            length = self.DEFAULT_LENGTH
+
+        resume_summary = None
+        if resume_id:
+            resume = await self._get_user_resume(user_id, resume_id)
+            if resume and resume.analysis_result:
+                resume_summary = self._extract_resume_summary(resume)
+
+        cover_letter = CoverLetter(
+            user_id=user_id,
+            resume_id=resume_id,
+            job_title=job_title,
+            company_name=company_name,
+            job_description=job_description,
+            status="generating",
+            generation_params={
+                "tone": tone,
+                "length": length,
+                "focus_areas": focus_areas or [],
+                "custom_instructions": custom_instructions,
+                "resume_summary": resume_summary,
+                "model_used": self.gemini_client.model_name,
+            },
+        )
+        # The INSERT returns id and server defaults itself; no refresh SELECT
+        self.db.add(cover_letter)
+        await self.db.commit()
+
+        prompt = self._build_cover_letter_prompt(
+            job_title=job_title,
+            company_name=company_name,
+            job_description=job_description,
+            resume_summary=resume_summary,
+            tone=tone,
+            length=length,
+            focus_areas=focus_areas,
+            custom_instructions=custom_instructions,
+        )
+
+        logger.info(
+            "cover_letter_stream_started",
+            operation="stream_cover_letter",
+            user_id=f"user-{user_id}",
+            cover_letter_id=cover_letter.id,
+            prompt_length=len(prompt),
+        )
+
+        chunks: List[str] = []
+        try:
+            async for text in self.gemini_client.stream_content(
+                prompt,
+                generation_config={"max_output_tokens": self._max_output_tokens(length)},
+            ):
+                chunks.append(text)
+                yield {"type": "chunk", "text": text}
+
+            cover_letter.content = self._clean_generated_content("".join(chunks))
+            cover_letter.status = "generated"
+            generated_at = datetime.now(timezone.utc)
+            cover_letter.generated_at = generated_at
+            cover_letter.generation_params = {
+                **cover_letter.generation_params,
+                "generated_at": generated_at.timestamp(),
+            }
+            await self.db.commit()
+
+        except Exception as e:
+            cover_letter.status = "failed"
+            cover_letter.error_message = f"Generation failed: {str(e)}"
+            await self.db.commit()
+
+            logger.error(
+                "cover_letter_stream_failed",
+                operation="stream_cover_letter",
+                user_id=f"user-{user_id}",
+                cover_letter_id=cover_letter.id,
+                duration_ms=int((time.monotonic() - start_time) * 1000),
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
+            )
+
+            yield {"type": "error", "cover_letter_id": cover_letter.id, "message": str(e)}
+            return
+
+        except BaseException:
+            # Client disconnected: Starlette cancels the stream (CancelledError)
+            # or it is closed (GeneratorExit). Neither is an Exception, and the
+            # committed row must not stay "generating".
+            with anyio.CancelScope(shield=True):
+                await self.db.rollback()
+                cover_letter.status = "failed"
+                cover_letter.error_message = "Generation cancelled: client disconnected"
+                await self.db.commit()
+
+            logger.warning(
+                "cover_letter_stream_cancelled",
+                operation="stream_cover_letter",
+                user_id=f"user-{user_id}",
+                cover_letter_id=cover_letter.id,
+                duration_ms=int((time.monotonic() - start_time) * 1000),
+            )
+            raise
+
+        logger.info(
+            "cover_letter_stream_completed",
+            operation="stream_cover_letter",
+            user_id=f"user-{user_id}",
+            cover_letter_id=cover_letter.id,
+            duration_ms=int((time.monotonic() - start_time) * 1000),
+            word_count=cover_letter.get_word_count(),
+        )
+
+        yield {
+            "type": "done",
+            "cover_letter_id": cover_letter.id,
+            "status": cover_letter.status,
+            "word_count": cover_letter.get_word_count(),
+        }
+
+    async def _analyze_and_write_with_gemini(
+        self,
+        resume: Resume,
+        job_title: str,
+        company_name: str,
+        job_description: Optional[str],
+        tone: str,
+        length: str,
+        focus_areas: Optional[List[str]],
+        custom_instructions: Optional[str],
+        user_id: int,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Analyze an unanalyzed resume and write the cover letter in one Gemini call.
+
+        The analysis is stored on the resume (so later requests reuse it); its
+        summary is returned for the cover letter's generation_params, so
+        regeneration stays personalized.
+
+        Returns:
+            Tuple of (generated cover letter text, resume summary)
+        """
+        writing_instructions = self._build_cover_letter_prompt(
+            job_title=job_title,
+            company_name=company_name,
+            job_description=job_description,
+            resume_summary=None,
+            tone=tone,
+            length=length,
+            focus_areas=focus_areas,
+            custom_instructions=custom_instructions,
+        )
+
+        logger.info(
+            "gemini_analyze_and_write_request",
+            operation="analyze_and_write_with_gemini",
+            user_id=f"user-{user_id}",
+            resume_id=resume.id,
+        )
+
+        result = await self.gemini_client.analyze_and_write(
+            resume_text=resume.extracted_text,
+            writing_instructions=writing_instructions,
+            user_id=user_id,
+            max_output_tokens=ANALYSIS_MAX_OUTPUT_TOKENS + self._max_output_tokens(length),
+        )
+
+        resume.analysis_result = result["analysis"]
+        resume.status = "analyzed"
+        resume.error_message = None
+        resume.analyzed_at = datetime.now(timezone.utc)
+
+        return result["cover_letter"], self._extract_resume_summary(resume)
+
     def _build_cover_letter_prompt(
         self,
         job_title: str,
@@ -276,22 +730,8 @@ class CoverLetterService:
 
         T040-T041: Optimized prompt engineering
         """
-        # Length guidelines
-        length_guide = {
-            "short": "250-350 words (3 paragraphs)",
-            "medium": "350-500 words (4 paragraphs)",
-            "long": "500-700 words (5-6 paragraphs)",
-        }
-
-        # Tone guidelines
-        tone_guide = {
-            "professional": "formal, polished, and business-appropriate",
-            "casual": "friendly yet professional, conversational but respectful",
-            "enthusiastic": "energetic and passionate, showing genuine excitement",
-        }
-
-        prompt = f"""You are an expert career coach and professional writer. Write a compelling cover letter for the following job application.
-
+        # Static prefix first (cache-friendly), then the per-request details
+        prompt = COVER_LETTER_STATIC_PREFIX + f"""
 ## Job Details
 - **Position**: {job_title}
 - **Company**: {company_name}
@@ -304,18 +744,17 @@ class CoverLetterService:
 """
 
         if resume_summary:
-            prompt += f"""
-## Candidate Background (from resume)
-- **Skills**: {', '.join(resume_summary.get('skills', [])[:15])}
-- **Experience**: {resume_summary.get('experience_years', 0)} years
-- **Strengths**: {'; '.join(resume_summary.get('strengths', [])[:3])}
-- **Suitable Roles**: {', '.join(resume_summary.get('suitable_roles', [])[:3])}
-"""
+            prompt += _render_resume_section(
+                tuple(resume_summary.get("skills", [])[:15]),
+                resume_summary.get("experience_years", 0),
+                tuple(resume_summary.get("strengths", [])[:3]),
+                tuple(resume_summary.get("suitable_roles", [])[:3]),
+            )
 
         prompt += f"""
 ## Writing Requirements
-- **Tone**: {tone_guide.get(tone, tone_guide['professional'])}
-- **Length**: {length_guide.get(length, length_guide['medium'])}
+- **Tone**: {COVER_LETTER_TONE_GUIDE.get(tone, COVER_LETTER_TONE_GUIDE['professional'])}
+- **Length**: {COVER_LETTER_LENGTH_GUIDE.get(length, COVER_LETTER_LENGTH_GUIDE['medium'])}
 """
 
         if focus_areas:
@@ -324,37 +763,27 @@ class CoverLetterService:
         if custom_instructions:
             prompt += f"- **Additional Instructions**: {custom_instructions}\n"
 
-        prompt += """
-## Structure Guidelines
-1. **Opening**: Hook the reader with a compelling introduction that shows enthusiasm for the role
-2. **Body**: Highlight relevant skills and experiences that match the job requirements
-3. **Connection**: Show understanding of the company and how you can contribute
-4. **Closing**: Strong call to action expressing interest in an interview
-
-## Important Rules
-- Write in first person
-- Be specific and use concrete examples when possible
-- Avoid generic phrases like "I am writing to apply for..."
-- Show personality while maintaining professionalism
-- Tailor content specifically to this company and role
-- Do NOT include placeholder text like [Your Name] - write complete sentences
-- Output ONLY the cover letter text, no additional commentary
-
-Write the cover letter now:
-"""
+        prompt += COVER_LETTER_CLOSING
         return prompt
 
-    def _get_user_resume(self, user_id: int, resume_id: int) -> Optional[Resume]:
-        """Get user's resume by ID."""
-        return (
-            self.db.query(Resume)
-            .filter(
+    async def _get_user_resume(self, user_id: int, resume_id: int, analyzed_only: bool = True) -> Optional[Resume]:
+        """
+        Get user's resume by ID (only analyzed resumes unless analyzed_only=False).
+
+        Loads only the columns cover letters read; extracted_text and file
+        metadata stay unloaded (see generate_cover_letter for the fused path).
+        """
+        stmt = (
+            select(Resume)
+            .options(load_only(Resume.id, Resume.status, Resume.analysis_result))
+            .where(
                 Resume.id == resume_id,
                 Resume.user_id == user_id,
-                Resume.status == "analyzed",
             )
-            .first()
         )
+        if analyzed_only:
+            stmt = stmt.where(Resume.status == "analyzed")
+        return (await self.db.execute(stmt)).scalars().first()
 
     def _extract_resume_summary(self, resume: Resume) -> Dict[str, Any]:
         """Extract relevant summary from resume analysis."""
@@ -374,6 +803,7 @@ Write the cover letter now:
         user_id: int,
         content: Optional[str] = None,
         regenerate: bool = False,
+        priority: str = "high",
     ) -> CoverLetter:
         """
         Update or regenerate a cover letter.
@@ -385,18 +815,24 @@ Write the cover letter now:
             user_id: User ID
             content: New content (for manual edit)
             regenerate: If True, regenerate with AI
+            priority: "high" regenerates inline; "low" only queues the
+                regeneration for process_queued_regenerations
 
         Returns:
             Updated CoverLetter object
         """
-        cover_letter = self.get_cover_letter_by_id(cover_letter_id, user_id)
-        if not cover_letter:
-            raise ValueError(f"Cover letter {cover_letter_id} not found")
+        if regenerate and priority == "low":
+            # Non-interactive lane: picked up by the background batch worker
+            event = "cover_letter_regeneration_queued"
+            values = {"status": "queued"}
+        elif regenerate:
+            # Regenerate with same parameters (needs the stored row first)
+            cover_letter = await self.get_cover_letter_by_id(cover_letter_id, user_id)
+            if not cover_letter:
+                raise ValueError(f"Cover letter {cover_letter_id} not found")
 
-        if regenerate:
-            # Regenerate with same parameters
             params = cover_letter.generation_params or {}
-            generated_content = self._generate_with_gemini(
+            generated_content = await self._generate_with_gemini(
                 job_title=cover_letter.job_title,
                 company_name=cover_letter.company_name,
                 job_description=cover_letter.job_description,
@@ -406,52 +842,184 @@ Write the cover letter now:
                 focus_areas=params.get("focus_areas"),
                 custom_instructions=params.get("custom_instructions"),
                 user_id=user_id,
+                use_cache=True,
             )
-            cover_letter.content = generated_content
-            cover_letter.version += 1
-            cover_letter.generated_at = datetime.utcnow()
-
-            logger.info(
-                "cover_letter_regenerated",
-                operation="update_cover_letter",
-                user_id=f"user-{user_id}",
-                cover_letter_id=cover_letter_id,
-                new_version=cover_letter.version,
-            )
+            event = "cover_letter_regenerated"
+            values = {
+                "content": generated_content,
+                "version": CoverLetter.version + 1,
+                "generated_at": datetime.now(timezone.utc),
+            }
         elif content:
             # Manual edit
-            cover_letter.content = content
-            cover_letter.version += 1
+            event = "cover_letter_manually_edited"
+            values = {"content": content, "version": CoverLetter.version + 1}
+        else:
+            cover_letter = await self.get_cover_letter_by_id(cover_letter_id, user_id)
+            if not cover_letter:
+                raise ValueError(f"Cover letter {cover_letter_id} not found")
+            return cover_letter
 
-            logger.info(
-                "cover_letter_manually_edited",
-                operation="update_cover_letter",
-                user_id=f"user-{user_id}",
-                cover_letter_id=cover_letter_id,
-                new_version=cover_letter.version,
+        # UPDATE ... RETURNING: one round trip instead of UPDATE + refresh SELECT
+        result = await self.db.execute(
+            update(CoverLetter)
+            .where(
+                CoverLetter.id == cover_letter_id,
+                CoverLetter.user_id == user_id,
             )
+            .values(**values)
+            .returning(CoverLetter)
+        )
+        cover_letter = result.scalars().first()
+        if not cover_letter:
+            raise ValueError(f"Cover letter {cover_letter_id} not found")
+        await self.db.commit()
+
+        logger.info(
+            event,
+            operation="update_cover_letter",
+            user_id=f"user-{user_id}",
+            cover_letter_id=cover_letter_id,
+            new_version=cover_letter.version,
+        )
 
-        self.db.commit()
-        self.db.refresh(cover_letter)
         return cover_letter
 
-    def get_cover_letter_by_id(self, cover_letter_id: int, user_id: int) -> Optional[CoverLetter]:
+    async def process_queued_regenerations(self, limit: int = 20) -> int:
+        """
+        Regenerate queued cover letters as one concurrent batch.
+
+        Low-priority regenerations are drained here together instead of each
+        holding an interactive request open; all results are saved with a
+        single commit.
+
+        Every low-priority PUT schedules its own drain, so rows are claimed
+        first (queued -> regenerating in one UPDATE ... RETURNING, skipping
+        rows another worker has locked): concurrent drains never generate the
+        same row twice. The version bump is done in SQL, not from the loaded
+        value.
+
+        Args:
+            limit: Maximum number of queued cover letters to process
+
+        Returns:
+            Number of cover letters processed
+        """
+        next_queued = (
+            select(CoverLetter.id)
+            .where(CoverLetter.status == "queued")
+            .order_by(CoverLetter.updated_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        queued = (
+            await self.db.execute(
+                update(CoverLetter)
+                .where(
+                    CoverLetter.id.in_(next_queued.scalar_subquery()),
+                    CoverLetter.status == "queued",
+                )
+                .values(status="regenerating")
+                .returning(CoverLetter)
+            )
+        ).scalars().all()
+        await self.db.commit()
+        if not queued:
+            return 0
+
+        start_time = time.monotonic()
+
+        results = await asyncio.gather(
+            *[
+                self._generate_with_gemini(
+                    job_title=cl.job_title,
+                    company_name=cl.company_name,
+                    job_description=cl.job_description,
+                    resume_summary=(cl.generation_params or {}).get("resume_summary"),
+                    tone=(cl.generation_params or {}).get("tone", self.DEFAULT_TONE),
+                    length=(cl.generation_params or {}).get("length", self.DEFAULT_LENGTH),
+                    focus_areas=(cl.generation_params or {}).get("focus_areas"),
+                    custom_instructions=(cl.generation_params or {}).get("custom_instructions"),
+                    user_id=cl.user_id,
+                    use_cache=True,
+                )
+                for cl in queued
+            ],
+            return_exceptions=True,
+        )
+
+        generated_at = datetime.now(timezone.utc)
+        for cover_letter, result in zip(queued, results):
+            if isinstance(result, Exception):
+                values = {
+                    "status": "failed",
+                    "error_message": f"Regeneration failed: {str(result)}",
+                }
+            else:
+                values = {
+                    "content": result,
+                    "version": CoverLetter.version + 1,
+                    "status": "generated",
+                    "error_message": None,
+                    "generated_at": generated_at,
+                }
+            await self.db.execute(
+                update(CoverLetter)
+                .where(
+                    CoverLetter.id == cover_letter.id,
+                    CoverLetter.status == "regenerating",
+                )
+                .values(**values)
+            )
+
+        await self.db.commit()
+
+        logger.info(
+            "cover_letter_queue_processed",
+            operation="process_queued_regenerations",
+            processed_count=len(queued),
+            failed_count=sum(1 for r in results if isinstance(r, Exception)),
+            duration_ms=int((time.monotonic() - start_time) * 1000),
+        )
+
+        return len(queued)
+
+    async def get_cover_letter_by_id(self, cover_letter_id: int, user_id: int) -> Optional[CoverLetter]:
         """Get cover letter by ID for specific user."""
-        return (
-            self.db.query(CoverLetter)
-            .filter(
+        result = await self.db.execute(
+            select(CoverLetter).where(
                 CoverLetter.id == cover_letter_id,
                 CoverLetter.user_id == user_id,
             )
-            .first()
         )
+        return result.scalars().first()
 
-    def get_user_cover_letters(self, user_id: int, limit: int = 20) -> List[CoverLetter]:
+    async def get_user_cover_letters(self, user_id: int, limit: int = 20) -> List[CoverLetter]:
         """Get all cover letters for a user."""
-        return (
-            self.db.query(CoverLetter)
-            .filter(CoverLetter.user_id == user_id)
+        result = await self.db.execute(
+            select(CoverLetter)
+            .where(CoverLetter.user_id == user_id)
             .order_by(CoverLetter.created_at.desc())
             .limit(limit)
-            .all()
         )
+        return list(result.scalars().all())
+
+
+async def run_queued_regenerations(limit: int = 20) -> None:
+    """
+    Background entry point: drain queued regenerations with a fresh session.
+
+    Scheduled via FastAPI BackgroundTasks after a low-priority regenerate
+    request, since the request's own session is closed by then.
+    """
+    async with get_async_session_factory()() as db:
+        try:
+            await CoverLetterService(db).process_queued_regenerations(limit=limit)
+        except Exception as e:
+            await db.rollback()
+            logger.error(
+                "cover_letter_queue_failed",
+                operation="run_queued_regenerations",
+                error=str(e),
+                exc_info=True,
+            )
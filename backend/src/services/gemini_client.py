@@ -10,9 +10,14 @@ T023: Gemini API client for resume analysis with structured output
 T025: Prompt engineering for resume analysis
 """
 
+import asyncio
 import json
+import re
 import time
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, AsyncIterator, List, Optional, Type, TypeVar, Union
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 import google.generativeai as genai
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
@@ -22,6 +27,259 @@ from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Process-wide cap on in-flight Gemini calls (Constitution II: API Resilience).
+# Excess callers wait here instead of piling onto the upstream and tripping 429s.
+GEMINI_SEMAPHORE = asyncio.Semaphore(settings.gemini_concurrency)
+
+# Opening markdown fence (```json); matched only at the start of the reply.
+# The closing fence is an endswith check: an end-anchored regex would be
+# retried at every offset of a reply that can be tens of KB.
+_FENCE_OPEN_RE = re.compile(r"```[a-zA-Z]*")
+
+# Appended when a reply was not parseable JSON; format errors are fixed by
+# re-asking right away, not by backing off (see wait_for_gemini_error)
+JSON_REPROMPT_SUFFIX = (
+    "\n\nThe previous reply was not valid JSON in the requested format. "
+    "Respond with ONLY the JSON object."
+)
+JSON_MAX_REPROMPTS = 2
+
+# Per-call output caps (generation_config override); the model-level
+# max_output_tokens stays as the ceiling for callers that pass nothing
+ANALYSIS_MAX_OUTPUT_TOKENS = 2048
+
+# Cap on the resume section of a prompt (see truncate_to_token_budget). A real
+# resume is a few thousand tokens; a text-heavy 5MB upload could otherwise run
+# past the model's input limit or make one analysis very expensive.
+RESUME_TEXT_TOKEN_BUDGET = 30000
+
+# Hangul and CJK characters are roughly one Gemini token each; other text
+# averages ~4 characters per token. Used for local prompt budgeting only.
+_WIDE_CHAR_RE = re.compile(r"[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u4e00-\u9fff\uac00-\ud7a3]")
+
+# T025: Output schema and scoring rules for resume analysis, shared by the
+# standalone analysis prompt and the fused analyze-and-write prompt
+RESUME_ANALYSIS_FORMAT = """{
+  "strengths": [
+    "List 3-5 key strengths demonstrated in this resume",
+    "Focus on specific skills, achievements, and experiences"
+  ],
+  "weaknesses": [
+    "List 2-4 areas for improvement",
+    "Be constructive and specific"
+  ],
+  "recommendations": [
+    "List 3-5 actionable recommendations to improve the resume",
+    "Be specific and prioritize high-impact changes"
+  ],
+  "suitable_roles": [
+    "List 3-5 job titles this candidate would be well-suited for",
+    "Based on their experience and skills"
+  ],
+  "skills": [
+    "Extract all technical and professional skills mentioned",
+    "Include programming languages, tools, frameworks, soft skills"
+  ],
+  "experience_years": <estimate total years of professional experience as integer>,
+  "ats_score": {
+    "overall": <0-100 integer score>,
+    "format_score": <0-100 integer - document structure, readability, standard sections>,
+    "keyword_score": <0-100 integer - relevant industry keywords and skills>,
+    "content_score": <0-100 integer - quantified achievements, action verbs, clarity>,
+    "issues": [
+      "List specific ATS compatibility issues found",
+      "E.g., 'Missing contact information', 'No quantified achievements'"
+    ],
+    "missing_keywords": [
+      "List important keywords that should be added",
+      "Based on the candidate's apparent target industry/role"
+    ],
+    "format_suggestions": [
+      "Specific formatting improvements for better ATS parsing"
+    ]
+  }
+}"""
+
+RESUME_ANALYSIS_CRITERIA = """
+ATS Scoring Criteria:
+- Format Score (0-100): Standard sections (Contact, Experience, Education, Skills), clean formatting, no tables/graphics, consistent date formats
+- Keyword Score (0-100): Industry-relevant keywords, technical skills, certifications, action verbs
+- Content Score (0-100): Quantified achievements (numbers, percentages), clear job titles, measurable results
+
+Important:
+- Be honest but constructive in your feedback
+- Focus on actionable insights
+- Consider industry standards and best practices
+- ATS scores should reflect real-world ATS compatibility
+- Return ONLY the JSON object, no additional text or markdown formatting
+"""
+
+# Static prefixes of the two resume prompts (role, task, output schema, rules).
+# The resume and any per-request instructions follow the prefix, so Gemini's
+# implicit prefix caching can reuse it across users.
+RESUME_ANALYSIS_PROMPT_PREFIX = f"""You are an expert career coach, resume analyst, and ATS (Applicant Tracking System) specialist. Analyze the resume at the end of this prompt and provide a comprehensive, structured analysis including ATS compatibility scoring.
+
+Please provide your analysis in the following JSON format (respond with ONLY valid JSON, no markdown formatting):
+
+{RESUME_ANALYSIS_FORMAT}
+{RESUME_ANALYSIS_CRITERIA}"""
+
+ANALYZE_AND_WRITE_PROMPT_PREFIX = f"""You are an expert career coach, resume analyst, and ATS (Applicant Tracking System) specialist. Complete two tasks in one response:
+1. Analyze the resume at the end of this prompt, including ATS compatibility scoring.
+2. Write the cover letter described in the cover letter instructions, based on this resume.
+
+Respond with ONLY valid JSON (no markdown formatting) in the following format:
+
+{{
+  "analysis": {RESUME_ANALYSIS_FORMAT},
+  "cover_letter": "<the complete cover letter text only, paragraphs separated by \\n\\n>"
+}}
+{RESUME_ANALYSIS_CRITERIA}"""
+
+
+class ATSScore(BaseModel):
+    """ATS compatibility block of a resume analysis."""
+    model_config = ConfigDict(extra="allow")
+
+    overall: Optional[Union[int, float]] = None
+    format_score: Union[int, float] = 50
+    keyword_score: Union[int, float] = 50
+    content_score: Union[int, float] = 50
+    issues: List[Any] = Field(default_factory=list)
+    missing_keywords: List[Any] = Field(default_factory=list)
+    format_suggestions: List[Any] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _fill_overall(self) -> "ATSScore":
+        if self.overall is None:
+            self.overall = int((self.format_score + self.keyword_score + self.content_score) / 3)
+        return self
+
+
+def _default_ats_score() -> ATSScore:
+    return ATSScore(overall=50, issues=["ATS analysis not available"])
+
+
+class ResumeAnalysis(BaseModel):
+    """
+    Validated shape of RESUME_ANALYSIS_FORMAT.
+
+    Missing fields get the same defaults the API has always returned;
+    unknown fields are kept.
+    """
+    model_config = ConfigDict(extra="allow")
+
+    strengths: List[Any] = Field(default_factory=list)
+    weaknesses: List[Any] = Field(default_factory=list)
+    recommendations: List[Any] = Field(default_factory=list)
+    suitable_roles: List[Any] = Field(default_factory=list)
+    skills: List[Any] = Field(default_factory=list)
+    experience_years: Union[int, float] = 0
+    ats_score: ATSScore = Field(default_factory=_default_ats_score)
+
+
+class AnalyzeAndWriteResult(BaseModel):
+    """Validated reply of the fused analyze-and-write prompt."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    analysis: ResumeAnalysis = Field(default_factory=ResumeAnalysis)
+    cover_letter: str = Field(min_length=1)
+
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+def truncate_to_token_budget(text: str, max_tokens: int) -> str:
+    """
+    Cut text to at most ~max_tokens Gemini tokens.
+
+    Uses a local estimate (wide characters 1 token, others 1/4) instead of the
+    count_tokens API, which would add a network round trip per prompt. The
+    estimate errs high for both Korean and Latin text, so the result lands at
+    or under the budget.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+
+    Returns:
+        Longest prefix of text within the budget
+    """
+    if len(text) <= max_tokens:
+        return text  # Fits even if every character is a full token
+
+    # Cost in quarter tokens: 1 per character plus 3 more per wide character
+    budget = max_tokens * 4
+    text = text[:budget]
+    extra = 0
+    for match in _WIDE_CHAR_RE.finditer(text):
+        position = match.start()
+        if position + extra >= budget:
+            break
+        extra += 3
+        if position + 1 + extra > budget:
+            return text[:position]
+    return text[:budget - extra]
+
+
+async def iter_json_array_items(chunks: AsyncIterator[str]) -> AsyncIterator[Any]:
+    """
+    Yield each element of a streamed top-level JSON array as soon as it closes.
+
+    Text before the opening bracket (e.g. a ```json fence) and after the
+    closing one is skipped. The source is always drained, so the stream it
+    comes from finishes normally.
+
+    Raises:
+        orjson.JSONDecodeError: If an element is not valid JSON
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    finished = False
+    item: List[str] = []
+
+    async for chunk in chunks:
+        if finished:
+            continue
+        for ch in chunk:
+            if depth == 0:
+                if ch == "[":
+                    depth = 1
+                continue
+
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in "[{":
+                depth += 1
+            elif ch in "]}":
+                depth -= 1
+                if depth == 0:
+                    text = "".join(item).strip()
+                    if text:
+                        yield orjson.loads(text)
+                    finished = True
+                    break
+            elif ch == "," and depth == 1:
+                yield orjson.loads("".join(item))
+                item = []
+                continue
+
+            item.append(ch)
+
+    # Stream ended inside the array (truncated output): the partial element
+    # fails to decode unless it happens to be complete
+    text = "".join(item).strip()
+    if depth > 0 and text:
+        yield orjson.loads(text)
+
 
 class GeminiClient:
     """
@@ -59,12 +317,81 @@ class GeminiClient:
             model=self.model_name,
         )
 
-    async def generate_content(self, prompt: str) -> str:
+    async def _generate_async(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None):
+        """
+        Single non-blocking Gemini call, bounded by GEMINI_SEMAPHORE.
+
+        The per-call timeout keeps a hung upstream from pinning a
+        semaphore slot; retries (if any) wrap this call from the outside.
+
+        Args:
+            prompt: Text prompt for Gemini
+            generation_config: Per-call overrides merged over the model defaults
+
+        Returns:
+            Raw Gemini response
+        """
+        async with GEMINI_SEMAPHORE:
+            return await asyncio.wait_for(
+                self.model.generate_content_async(prompt, generation_config=generation_config),
+                timeout=settings.gemini_timeout_seconds,
+            )
+
+    async def _generate_json(
+        self,
+        prompt: str,
+        schema: Type[SchemaT],
+        max_reprompts: int = JSON_MAX_REPROMPTS,
+        generation_config: Optional[Dict[str, Any]] = None,
+    ) -> SchemaT:
+        """
+        Gemini call that must return a JSON object matching a schema.
+
+        A reply that does not parse or validate is re-asked immediately with
+        JSON_REPROMPT_SUFFIX (up to max_reprompts times) instead of going
+        through the retry decorator's backoff.
+
+        Args:
+            prompt: Text prompt for Gemini
+            schema: Pydantic model the reply must validate against
+            max_reprompts: Extra attempts after an invalid reply
+            generation_config: Per-call overrides merged over the model defaults
+
+        Returns:
+            Validated schema instance
+
+        Raises:
+            json.JSONDecodeError: If the last reply is not JSON
+            ValidationError: If the last reply does not match the schema
+        """
+        current_prompt = prompt
+        for attempt in range(max_reprompts + 1):
+            response = await self._generate_async(current_prompt, generation_config)
+            response_text = self._strip_code_fences(response.text)
+            try:
+                return schema.model_validate(orjson.loads(response_text))
+            except (json.JSONDecodeError, ValidationError) as e:
+                if attempt == max_reprompts:
+                    raise
+                logger.warning(
+                    "gemini_json_reprompt",
+                    operation="generate_json",
+                    attempt=attempt + 1,
+                    error=str(e),
+                    response_preview=response_text[:200],
+                )
+                current_prompt = prompt + JSON_REPROMPT_SUFFIX
+
+    async def generate_content(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> str:
         """
         Generic content generation method for prompts.
 
+        Uses the async Gemini API so the event loop keeps serving other
+        requests during the LLM round trip.
+
         Args:
             prompt: Text prompt for Gemini
+            generation_config: Per-call overrides, e.g. {"max_output_tokens": 800}
 
         Returns:
             Generated text response
@@ -78,7 +405,7 @@ class GeminiClient:
         )
 
         try:
-            response = self.model.generate_content(prompt)
+            response = await self._generate_async(prompt, generation_config)
             result = response.text
 
             duration_ms = int((time.time() - start_time) * 1000)
@@ -102,8 +429,69 @@ class GeminiClient:
             )
             raise
 
+    async def stream_content(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated text chunk by chunk as Gemini produces it.
+
+        Holds a GEMINI_SEMAPHORE slot for the duration of the stream. Not
+        retried: a retry after chunks were already sent would duplicate text.
+        The first response and each later chunk must arrive within
+        gemini_timeout_seconds, so a stalled upstream stream fails and frees
+        its slot instead of holding it until the client goes away.
+
+        Args:
+            prompt: Text prompt for Gemini
+            generation_config: Per-call overrides merged over the model defaults
+
+        Yields:
+            Text chunks in generation order
+        """
+        start_time = time.time()
+        total_length = 0
+
+        logger.info(
+            "gemini_stream_started",
+            operation="stream_content",
+            prompt_length=len(prompt),
+        )
+
+        async with GEMINI_SEMAPHORE:
+            response = await asyncio.wait_for(
+                self.model.generate_content_async(
+                    prompt, generation_config=generation_config, stream=True
+                ),
+                timeout=settings.gemini_timeout_seconds,
+            )
+            chunks = response.__aiter__()
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(
+                        chunks.__anext__(), timeout=settings.gemini_timeout_seconds
+                    )
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    raise asyncio.TimeoutError(
+                        f"Gemini stream stalled: no chunk for {settings.gemini_timeout_seconds}s"
+                    ) from None
+                text = chunk.text
+                if text:
+                    total_length += len(text)
+                    yield text
+
+        logger.info(
+            "gemini_stream_completed",
+            operation="stream_content",
+            duration_ms=int((time.time() - start_time) * 1000),
+            response_length=total_length,
+        )
+
     @retry_gemini_api(max_attempts=3, timeout=30.0)
-    def analyze_resume_text(self, resume_text: str, user_id: Optional[int] = None) -> Dict[str, Any]:
+    async def analyze_resume_text(self, resume_text: str, user_id: Optional[int] = None) -> Dict[str, Any]:
         """
         Analyze resume text using Gemini and return structured results.
 
@@ -145,11 +533,15 @@ class GeminiClient:
             # T025: Prompt engineering for structured resume analysis
             prompt = self._build_resume_analysis_prompt(resume_text)
 
-            # Call Gemini API (with retry logic from decorator)
-            response = self.model.generate_content(prompt)
-
-            # Parse response
-            analysis = self._parse_analysis_response(response.text)
+            # Call Gemini API (with retry logic from decorator) and parse response
+            try:
+                analysis = (await self._generate_json(
+                    prompt,
+                    ResumeAnalysis,
+                    generation_config={"max_output_tokens": ANALYSIS_MAX_OUTPUT_TOKENS},
+                )).model_dump()
+            except (json.JSONDecodeError, ValidationError) as e:
+                analysis = self._fallback_analysis(e)
 
             # Add metadata
             analysis["analyzed_at"] = time.time()
@@ -191,80 +583,112 @@ class GeminiClient:
             )
             raise
 
-    def _build_resume_analysis_prompt(self, resume_text: str) -> str:
+    @retry_gemini_api(max_attempts=3, timeout=30.0)
+    async def analyze_and_write(
+        self,
+        resume_text: str,
+        writing_instructions: str,
+        user_id: Optional[int] = None,
+        max_output_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
-        Build prompt for resume analysis.
+        Analyze a resume and write a cover letter in a single Gemini call.
 
-        T025: Prompt engineering for structured, actionable analysis.
-        ATS Score: Comprehensive ATS compatibility scoring
+        Replaces the analyze → write chain (two round trips, two prompt
+        passes) when a cover letter is requested for a not-yet-analyzed resume.
+
+        Args:
+            resume_text: Extracted resume text
+            writing_instructions: Cover letter prompt (job details, tone, length)
+            user_id: Optional user ID for logging (anonymized)
+            max_output_tokens: Output cap covering analysis and letter (optional)
+
+        Returns:
+            {
+                "analysis": {...same structure as analyze_resume_text...},
+                "cover_letter": "str"
+            }
+
+        Raises:
+            ValueError: If the response is not valid JSON or has no cover letter
+        """
+        start_time = time.time()
+
+        logger.info(
+            "analyze_and_write_started",
+            operation="analyze_and_write",
+            user_id=f"user-{user_id}" if user_id else "anonymous",
+            model=self.model_name,
+            text_length=len(resume_text),
+        )
+
+        prompt = self._build_analyze_and_write_prompt(resume_text, writing_instructions)
+
+        try:
+            result = await self._generate_json(
+                prompt,
+                AnalyzeAndWriteResult,
+                generation_config={"max_output_tokens": max_output_tokens} if max_output_tokens else None,
+            )
+        except (json.JSONDecodeError, ValidationError) as e:
+            raise ValueError(f"Invalid fused analyze-and-write response: {e}")
+
+        cover_letter = result.cover_letter
+        analysis = result.analysis.model_dump()
+        analysis["analyzed_at"] = time.time()
+        analysis["model_used"] = self.model_name
+
+        logger.info(
+            "analyze_and_write_completed",
+            operation="analyze_and_write",
+            user_id=f"user-{user_id}" if user_id else "anonymous",
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
+
+        return {"analysis": analysis, "cover_letter": cover_letter}
+
+    def _build_analyze_and_write_prompt(self, resume_text: str, writing_instructions: str) -> str:
+        """
+        Build the fused resume analysis + cover letter prompt.
+
+        Prompt layout: ANALYZE_AND_WRITE_PROMPT_PREFIX (static) first, then the
+        cover letter instructions and the resume.
 
         Args:
             resume_text: Resume content
+            writing_instructions: Cover letter prompt
 
         Returns:
             Formatted prompt for Gemini
         """
-        prompt = f"""You are an expert career coach, resume analyst, and ATS (Applicant Tracking System) specialist. Analyze the following resume and provide a comprehensive, structured analysis including ATS compatibility scoring.
+        return ANALYZE_AND_WRITE_PROMPT_PREFIX + f"""
+Cover Letter Instructions:
+{writing_instructions}
 
 Resume Content:
-{resume_text}
+{truncate_to_token_budget(resume_text, RESUME_TEXT_TOKEN_BUDGET)}
+"""
 
-Please provide your analysis in the following JSON format (respond with ONLY valid JSON, no markdown formatting):
+    def _build_resume_analysis_prompt(self, resume_text: str) -> str:
+        """
+        Build prompt for resume analysis.
 
-{{
-  "strengths": [
-    "List 3-5 key strengths demonstrated in this resume",
-    "Focus on specific skills, achievements, and experiences"
-  ],
-  "weaknesses": [
-    "List 2-4 areas for improvement",
-    "Be constructive and specific"
-  ],
-  "recommendations": [
-    "List 3-5 actionable recommendations to improve the resume",
-    "Be specific and prioritize high-impact changes"
-  ],
-  "suitable_roles": [
-    "List 3-5 job titles this candidate would be well-suited for",
-    "Based on their experience and skills"
-  ],
-  "skills": [
-    "Extract all technical and professional skills mentioned",
-    "Include programming languages, tools, frameworks, soft skills"
-  ],
-  "experience_years": <estimate total years of professional experience as integer>,
-  "ats_score": {{
-    "overall": <0-100 integer score>,
-    "format_score": <0-100 integer - document structure, readability, standard sections>,
-    "keyword_score": <0-100 integer - relevant industry keywords and skills>,
-    "content_score": <0-100 integer - quantified achievements, action verbs, clarity>,
-    "issues": [
-      "List specific ATS compatibility issues found",
-      "E.g., 'Missing contact information', 'No quantified achievements'"
-    ],
-    "missing_keywords": [
-      "List important keywords that should be added",
-      "Based on the candidate's apparent target industry/role"
-    ],
-    "format_suggestions": [
-      "Specific formatting improvements for better ATS parsing"
-    ]
-  }}
-}}
+        T025: Prompt engineering for structured, actionable analysis.
+        ATS Score: Comprehensive ATS compatibility scoring
 
-ATS Scoring Criteria:
-- Format Score (0-100): Standard sections (Contact, Experience, Education, Skills), clean formatting, no tables/graphics, consistent date formats
-- Keyword Score (0-100): Industry-relevant keywords, technical skills, certifications, action verbs
-- Content Score (0-100): Quantified achievements (numbers, percentages), clear job titles, measurable results
+        Prompt layout: RESUME_ANALYSIS_PROMPT_PREFIX (static) first, then the
+        resume.
 
-Important:
-- Be honest but constructive in your feedback
-- Focus on actionable insights
-- Consider industry standards and best practices
-- ATS scores should reflect real-world ATS compatibility
-- Return ONLY the JSON object, no additional text or markdown formatting
+        Args:
+            resume_text: Resume content
+
+        Returns:
+            Formatted prompt for Gemini
+        """
+        return RESUME_ANALYSIS_PROMPT_PREFIX + f"""
+Resume Content:
+{truncate_to_token_budget(resume_text, RESUME_TEXT_TOKEN_BUDGET)}
 """
-        return prompt
 
     def _parse_analysis_response(self, response_text: str) -> Dict[str, Any]:
         """
@@ -274,82 +698,56 @@ Important:
             response_text: Raw response from Gemini
 
         Returns:
-            Parsed analysis dictionary
-
-        Raises:
-            ValueError: If response cannot be parsed
+            Validated analysis dictionary, or the fallback structure if the
+            response is not valid JSON
         """
         try:
-            # Remove markdown code blocks if present
-            response_text = response_text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            response_text = response_text.strip()
-
-            # Parse JSON
-            analysis = json.loads(response_text)
-
-            # Validate required fields
-            required_fields = ["strengths", "weaknesses", "recommendations", "suitable_roles", "skills"]
-            for field in required_fields:
-                if field not in analysis:
-                    logger.warning(
-                        "analysis_missing_field",
-                        operation="parse_analysis",
-                        field=field,
-                    )
-                    analysis[field] = []
-
-            # Ensure experience_years is present
-            if "experience_years" not in analysis:
-                analysis["experience_years"] = 0
-
-            # Ensure ats_score is present with default structure
-            if "ats_score" not in analysis:
-                analysis["ats_score"] = {
-                    "overall": 50,
-                    "format_score": 50,
-                    "keyword_score": 50,
-                    "content_score": 50,
-                    "issues": ["ATS analysis not available"],
-                    "missing_keywords": [],
-                    "format_suggestions": []
-                }
-            else:
-                # Validate ats_score sub-fields
-                ats = analysis["ats_score"]
-                if "overall" not in ats:
-                    ats["overall"] = int((ats.get("format_score", 50) + ats.get("keyword_score", 50) + ats.get("content_score", 50)) / 3)
-                if "issues" not in ats:
-                    ats["issues"] = []
-                if "missing_keywords" not in ats:
-                    ats["missing_keywords"] = []
-                if "format_suggestions" not in ats:
-                    ats["format_suggestions"] = []
-
-            return analysis
+            response_text = self._strip_code_fences(response_text)
+            return ResumeAnalysis.model_validate(orjson.loads(response_text)).model_dump()
+
+        except (json.JSONDecodeError, ValidationError) as e:
+            return self._fallback_analysis(e)
+
+    @staticmethod
+    def _fallback_analysis(error: ValueError) -> Dict[str, Any]:
+        """Fallback structure returned when the analysis cannot be parsed."""
+        logger.error(
+            "analysis_parse_failed",
+            operation="parse_analysis",
+            error=str(error),
+            error_type=type(error).__name__,
+        )
+        return {
+            "strengths": ["Unable to parse analysis"],
+            "weaknesses": [],
+            "recommendations": ["Please try uploading your resume again"],
+            "suitable_roles": [],
+            "skills": [],
+            "experience_years": 0,
+            "parse_error": str(error),
+        }
+
+    @staticmethod
+    def _strip_code_fences(response_text: str) -> str:
+        """Remove a surrounding ```json ... ``` markdown block if present."""
+        text = response_text.strip()
+        if match := _FENCE_OPEN_RE.match(text):
+            text = text[match.end():]
+        if text.endswith("```"):
+            text = text[:-3]
+        return text.strip()
+
+
+@lru_cache(maxsize=1)
+def get_gemini_client() -> GeminiClient:
+    """
+    Process-wide GeminiClient.
 
-        except json.JSONDecodeError as e:
-            logger.error(
-                "analysis_parse_failed",
-                operation="parse_analysis",
-                error=str(e),
-                response_preview=response_text[:200],
-            )
-            # Return fallback structure
-            return {
-                "strengths": ["Unable to parse analysis"],
-                "weaknesses": [],
-                "recommendations": ["Please try uploading your resume again"],
-                "suitable_roles": [],
-                "skills": [],
-                "experience_years": 0,
-                "parse_error": str(e),
-            }
+    genai.configure() sets module-global state and GenerativeModel holds no
+    per-request state, so one instance can serve every request instead of
+    rebuilding the model (and safety settings) on each service construction.
+    """
+    return GeminiClient()
 
 
 # Example usage
@@ -383,7 +781,9 @@ if __name__ == "__main__":
 
     # Test analysis
     try:
-        result = client.analyze_resume_text(sample_resume)
+        import asyncio
+
+        result = asyncio.run(client.analyze_resume_text(sample_resume))
         print("\n=== Analysis Result ===")
         print(json.dumps(result, indent=2))
     except Exception as e:
@@ -9,23 +9,240 @@ Constitution Compliance:
 T069: Interview service for question generation and answer evaluation
 """
 
+import asyncio
+import hashlib
+import re
 import time
-import json
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
-from sqlalchemy.orm import Session
+import orjson
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, defer
 
 from src.config import settings
 from src.models.interview import Interview
+from src.models.interview_answer import InterviewAnswer
 from src.models.resume import Resume
 from src.models.job import Job
-from src.services.gemini_client import GeminiClient
+from src.services.gemini_client import (
+    GeminiClient,
+    get_gemini_client,
+    iter_json_array_items,
+    truncate_to_token_budget,
+)
+from src.utils.cache import cache_get, cache_set, make_cache_key
 from src.utils.logging_config import get_logger
 from src.utils.privacy import scrub_all_pii
 
 logger = get_logger(__name__)
 
+# INSERT constructs with ON CONFLICT support, by dialect (PostgreSQL in
+# production, SQLite for development and tests)
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# First fenced block in a model response (```json ... ``` or bare ``` ... ```)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
+
+# Response language directive, looked up (not interpolated) per request
+LANGUAGE_INSTRUCTIONS = {
+    "ko": "한국어로 답변해주세요.",
+    "en": "Please respond in English.",
+}
+
+# Token budgets for user-supplied prompt sections, estimated locally (see
+# truncate_to_token_budget); they keep the full question prompt under ~2K tokens
+JOB_DESCRIPTION_TOKEN_BUDGET = 1000
+FOCUS_AREAS_TOKEN_BUDGET = 100
+
+# Prompt wording for the validated difficulty / interview type values. The
+# prompt body is Korean for every response language, so there is one map each.
+DIFFICULTY_DESCRIPTIONS = {
+    "entry": "신입/주니어 레벨 (1-2년 경력)",
+    "mid": "중급 레벨 (3-5년 경력)",
+    "senior": "시니어 레벨 (6년 이상 경력)",
+}
+
+INTERVIEW_TYPE_DESCRIPTIONS = {
+    "behavioral": "행동 면접 질문 (과거 경험, 상황 대처)",
+    "technical": "기술 면접 질문 (기술 지식, 문제 해결)",
+    "mixed": "행동 면접과 기술 면접 혼합",
+}
+
+# Static part of the question generation prompt (role, language, output
+# schema, guidance), one byte-identical prefix per response language.
+# Everything request-specific is appended after it, so Gemini's implicit
+# prefix caching can reuse the prefix across users.
+_QUESTION_PROMPT_PREFIX_TEMPLATE = """당신은 전문 면접관입니다. 아래 채용 정보에 맞는 면접 질문을 생성해주세요.
+
+{lang_instruction}
+
+## 출력 형식
+다음 JSON 형식으로 정확히 출력해주세요:
+
+```json
+[
+  {{
+    "id": 1,
+    "question": "질문 내용",
+    "type": "behavioral" 또는 "technical" 또는 "situational",
+    "difficulty": 1-5 (숫자),
+    "expected_topics": ["예상 답변 주제1", "주제2"],
+    "time_limit_seconds": 120,
+    "tips": "답변 팁"
+  }}
+]
+```
+
+질문은 구체적이고 실무 중심으로 작성해주세요. STAR 기법으로 답변할 수 있는 질문을 포함해주세요.
+
+"""
+
+# Generic questions used when Gemini's reply cannot be parsed
+# ("{job_title}" is filled in by _get_fallback_questions)
+_FALLBACK_QUESTIONS_KO = (
+    {
+        "question": "{job_title} 직무에 지원하게 된 동기가 무엇인가요?",
+        "type": "behavioral",
+        "expected_topics": ["동기", "열정", "경력 목표"],
+    },
+    {
+        "question": "가장 도전적이었던 프로젝트 경험을 말씀해주세요.",
+        "type": "behavioral",
+        "expected_topics": ["문제 해결", "팀워크", "성과"],
+    },
+    {
+        "question": "팀에서 갈등이 발생했을 때 어떻게 해결하셨나요?",
+        "type": "situational",
+        "expected_topics": ["커뮤니케이션", "협업", "리더십"],
+    },
+    {
+        "question": "본인의 강점과 약점은 무엇이라고 생각하시나요?",
+        "type": "behavioral",
+        "expected_topics": ["자기인식", "성장", "개선"],
+    },
+    {
+        "question": "5년 후 본인의 모습을 어떻게 그리고 계신가요?",
+        "type": "behavioral",
+        "expected_topics": ["경력 계획", "목표", "성장"],
+    },
+)
+
+_FALLBACK_QUESTIONS_EN = (
+    {
+        "question": "Why are you interested in the {job_title} position?",
+        "type": "behavioral",
+        "expected_topics": ["motivation", "passion", "career goals"],
+    },
+    {
+        "question": "Tell me about your most challenging project experience.",
+        "type": "behavioral",
+        "expected_topics": ["problem solving", "teamwork", "results"],
+    },
+    {
+        "question": "How do you handle conflicts within a team?",
+        "type": "situational",
+        "expected_topics": ["communication", "collaboration", "leadership"],
+    },
+    {
+        "question": "What are your strengths and weaknesses?",
+        "type": "behavioral",
+        "expected_topics": ["self-awareness", "growth", "improvement"],
+    },
+    {
+        "question": "Where do you see yourself in 5 years?",
+        "type": "behavioral",
+        "expected_topics": ["career plan", "goals", "growth"],
+    },
+)
+
+QUESTION_PROMPT_PREFIX = {
+    language: _QUESTION_PROMPT_PREFIX_TEMPLATE.format(lang_instruction=instruction)
+    for language, instruction in LANGUAGE_INSTRUCTIONS.items()
+}
+
+# Fingerprint of each static prefix, part of the question cache key: editing
+# the prompt invalidates previously cached question sets automatically
+QUESTION_PROMPT_VERSION = {
+    language: hashlib.blake2b(prefix.encode(), digest_size=8).hexdigest()
+    for language, prefix in QUESTION_PROMPT_PREFIX.items()
+}
+
+# Static part of the answer evaluation prompt: criteria and schema first,
+# the question/answer under evaluation last
+_EVALUATION_PROMPT_PREFIX_TEMPLATE = """당신은 전문 면접관입니다. 아래 면접 답변을 평가해주세요.
+
+{lang_instruction}
+
+## 평가 기준
+1. 답변의 구체성 (예시, 수치, 경험 포함 여부)
+2. STAR 기법 활용 (Situation, Task, Action, Result)
+3. 직무 관련성
+4. 논리적 구조
+5. 커뮤니케이션 명확성
+
+## 출력 형식
+다음 JSON 형식으로 정확히 출력해주세요:
+
+```json
+{{
+  "score": 0-100 (숫자),
+  "strengths": ["강점1", "강점2"],
+  "improvements": ["개선점1", "개선점2"],
+  "feedback": "상세 피드백 (2-3문장)"
+}}
+```
+
+"""
+
+EVALUATION_PROMPT_PREFIX = {
+    language: _EVALUATION_PROMPT_PREFIX_TEMPLATE.format(lang_instruction=instruction)
+    for language, instruction in LANGUAGE_INSTRUCTIONS.items()
+}
+
+# Static part of the model answer prompt. Model answers are generated on
+# demand (GET .../model-answer), not with every evaluation: they are the
+# longest output and do not affect the score.
+_MODEL_ANSWER_PROMPT_PREFIX_TEMPLATE = """당신은 전문 면접 코치입니다. 아래 면접 질문에 대한 모범 답변 예시를 작성해주세요.
+
+{lang_instruction}
+
+## 작성 기준
+1. STAR 기법 활용 (Situation, Task, Action, Result)
+2. 구체적인 예시와 수치 포함
+3. 3-4문장 분량
+
+모범 답변 본문만 출력해주세요 (JSON, 제목, 마크다운 없이).
+
+"""
+
+MODEL_ANSWER_PROMPT_PREFIX = {
+    language: _MODEL_ANSWER_PROMPT_PREFIX_TEMPLATE.format(lang_instruction=instruction)
+    for language, instruction in LANGUAGE_INSTRUCTIONS.items()
+}
+
+# Per-call output caps; headroom covers the model's thinking tokens
+EVALUATION_MAX_OUTPUT_TOKENS = 1024
+MODEL_ANSWER_MAX_OUTPUT_TOKENS = 1024
+
+
+def _normalize_text(text: Optional[str]) -> str:
+    """Case- and whitespace-insensitive form of free text, for cache keys."""
+    return " ".join((text or "").lower().split())
+
+
+def _parse_json_response(response: str) -> Any:
+    """
+    Parse the JSON payload of a Gemini response, unwrapping a code fence if present.
+
+    Raises:
+        orjson.JSONDecodeError: If the payload is not valid JSON
+    """
+    match = _JSON_FENCE_RE.search(response)
+    return orjson.loads(match.group(1) if match else response.strip())
+
 
 class InterviewService:
     """
@@ -48,7 +265,7 @@ class InterviewService:
             db: Database session
         """
         self.db = db
-        self.gemini_client = GeminiClient()
+        self.gemini_client = get_gemini_client()
 
     async def generate_interview(
         self,
@@ -87,7 +304,7 @@ class InterviewService:
             ValueError: If invalid parameters
             Exception: If generation fails
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         logger.info(
             "interview_generation_started",
@@ -100,75 +317,59 @@ class InterviewService:
         )
 
         try:
-            # Validate parameters
-            if interview_type not in ["behavioral", "technical", "mixed"]:
-                interview_type = self.DEFAULT_INTERVIEW_TYPE
-            if difficulty not in ["entry", "mid", "senior"]:
-                difficulty = self.DEFAULT_DIFFICULTY
-            question_count = max(1, min(10, question_count))
-
-            # Get resume data if provided
-            resume_summary = None
-            if resume_id:
-                resume = self._get_user_resume(user_id, resume_id)
-                if resume and resume.analysis_result:
-                    resume_summary = self._extract_resume_summary(resume)
-
-            # Get job data if provided
-            if job_id and not job_description:
-                job = self.db.query(Job).filter(Job.id == job_id, Job.user_id == user_id).first()
-                if job:
-                    job_description = job.description
-                    if not company_name:
-                        company_name = job.company
-
-            # Create interview record
-            interview = Interview(
+            recent_key = self._recent_generation_key(
                 user_id=user_id,
-                resume_id=resume_id,
-                job_id=job_id,
                 job_title=job_title,
                 company_name=company_name,
                 job_description=job_description,
-                status="generating",
-                config={
-                    "interview_type": interview_type,
-                    "difficulty": difficulty,
-                    "question_count": question_count,
-                    "focus_areas": focus_areas or [],
-                    "language": language,
-                },
+                resume_id=resume_id,
+                job_id=job_id,
+                interview_type=interview_type,
+                difficulty=difficulty,
+                question_count=question_count,
+                focus_areas=focus_areas,
+                language=language,
             )
-            self.db.add(interview)
-            self.db.commit()
-            self.db.refresh(interview)
+            interview = await self._clone_recent_interview(user_id, recent_key)
+            if interview is not None:
+                return interview
 
-            logger.info(
-                "interview_record_created",
-                operation="generate_interview",
-                interview_id=interview.id,
+            interview, resume_summary = await self._prepare_interview(
+                user_id=user_id,
+                job_title=job_title,
+                company_name=company_name,
+                job_description=job_description,
+                resume_id=resume_id,
+                job_id=job_id,
+                interview_type=interview_type,
+                difficulty=difficulty,
+                question_count=question_count,
+                focus_areas=focus_areas,
+                language=language,
             )
 
             # Generate questions with Gemini
             try:
                 questions = await self._generate_questions_with_gemini(
-                    job_title=job_title,
-                    company_name=company_name,
-                    job_description=job_description,
-                    resume_summary=resume_summary,
-                    interview_type=interview_type,
-                    difficulty=difficulty,
-                    question_count=question_count,
-                    focus_areas=focus_areas,
-                    language=language,
+                    **self._question_params(interview, resume_summary)
                 )
 
                 # Update interview with questions
                 interview.questions = questions
                 interview.status = "ready"
-                self.db.commit()
+                self.db.add(interview)
+                self._commit_keep_loaded()
 
-                duration_ms = int((time.time() - start_time) * 1000)
+                logger.info(
+                    "interview_record_created",
+                    operation="generate_interview",
+                    interview_id=interview.id,
+                )
+
+                if recent_key is not None:
+                    await cache_set(recent_key, str(interview.id), settings.interview_recent_ttl_seconds)
+
+                duration_ms = int((time.monotonic() - start_time) * 1000)
                 logger.info(
                     "interview_generation_completed",
                     operation="generate_interview",
@@ -178,15 +379,18 @@ class InterviewService:
                 )
 
             except Exception as e:
+                # Keep the failed attempt on record
+                self.db.rollback()
                 interview.status = "failed"
                 interview.error_message = str(e)
+                self.db.add(interview)
                 self.db.commit()
                 raise
 
             return interview
 
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.monotonic() - start_time) * 1000)
             logger.error(
                 "interview_generation_failed",
                 operation="generate_interview",
@@ -196,6 +400,329 @@ class InterviewService:
             )
             raise
 
+    async def stream_interview(
+        self,
+        user_id: int,
+        job_title: str,
+        company_name: Optional[str] = None,
+        job_description: Optional[str] = None,
+        resume_id: Optional[int] = None,
+        job_id: Optional[int] = None,
+        interview_type: str = "mixed",
+        difficulty: str = "mid",
+        question_count: int = 5,
+        focus_areas: Optional[List[str]] = None,
+        language: str = "ko",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate mock interview questions, yielding each one as Gemini streams it.
+
+        Same inputs and record lifecycle as generate_interview, but the first
+        question reaches the caller as soon as its JSON object is complete
+        instead of after the whole set. The record is committed once at the end.
+
+        Yields:
+            {"type": "question", "question": dict} per question, then a final
+            {"type": "done", "interview_id", "status", "question_count"}
+            or {"type": "error", "interview_id", "message"}
+        """
+        start_time = time.monotonic()
+
+        logger.info(
+            "interview_stream_started",
+            operation="stream_interview",
+            user_id=f"user-{user_id}",
+            job_title=scrub_all_pii(job_title),
+            interview_type=interview_type,
+            difficulty=difficulty,
+            question_count=question_count,
+        )
+
+        recent_key = self._recent_generation_key(
+            user_id=user_id,
+            job_title=job_title,
+            company_name=company_name,
+            job_description=job_description,
+            resume_id=resume_id,
+            job_id=job_id,
+            interview_type=interview_type,
+            difficulty=difficulty,
+            question_count=question_count,
+            focus_areas=focus_areas,
+            language=language,
+        )
+        interview = await self._clone_recent_interview(user_id, recent_key)
+        if interview is not None:
+            for question in interview.questions:
+                yield {"type": "question", "question": question}
+            yield {
+                "type": "done",
+                "interview_id": interview.id,
+                "status": interview.status,
+                "question_count": len(interview.questions),
+            }
+            return
+
+        interview, resume_summary = await self._prepare_interview(
+            user_id=user_id,
+            job_title=job_title,
+            company_name=company_name,
+            job_description=job_description,
+            resume_id=resume_id,
+            job_id=job_id,
+            interview_type=interview_type,
+            difficulty=difficulty,
+            question_count=question_count,
+            focus_areas=focus_areas,
+            language=language,
+        )
+
+        questions: List[Dict[str, Any]] = []
+        try:
+            async for question in self._stream_questions_with_gemini(
+                **self._question_params(interview, resume_summary)
+            ):
+                questions.append(question)
+                yield {"type": "question", "question": question}
+
+            interview.questions = questions
+            interview.status = "ready"
+            self.db.add(interview)
+            self._commit_keep_loaded()
+
+            if recent_key is not None:
+                await cache_set(recent_key, str(interview.id), settings.interview_recent_ttl_seconds)
+
+        except Exception as e:
+            # Keep the failed attempt on record
+            self.db.rollback()
+            interview.status = "failed"
+            interview.error_message = str(e)
+            self.db.add(interview)
+            self.db.commit()
+
+            logger.error(
+                "interview_stream_failed",
+                operation="stream_interview",
+                interview_id=interview.id,
+                error=str(e),
+                duration_ms=int((time.monotonic() - start_time) * 1000),
+                exc_info=True,
+            )
+
+            yield {"type": "error", "interview_id": interview.id, "message": str(e)}
+            return
+
+        except BaseException:
+            # Client disconnected: Starlette cancels the stream (CancelledError)
+            # or it is closed (GeneratorExit). Neither is an Exception; keep
+            # the abandoned attempt on record as failed, like other failures
+            # (unless it was already saved as ready and only the cache write
+            # was interrupted).
+            if interview.status != "ready":
+                self.db.rollback()
+                interview.status = "failed"
+                interview.error_message = "Generation cancelled: client disconnected"
+                self.db.add(interview)
+                self.db.commit()
+
+                logger.warning(
+                    "interview_stream_cancelled",
+                    operation="stream_interview",
+                    interview_id=interview.id,
+                    duration_ms=int((time.monotonic() - start_time) * 1000),
+                )
+            raise
+
+        logger.info(
+            "interview_stream_completed",
+            operation="stream_interview",
+            interview_id=interview.id,
+            question_count=len(questions),
+            duration_ms=int((time.monotonic() - start_time) * 1000),
+        )
+
+        yield {
+            "type": "done",
+            "interview_id": interview.id,
+            "status": interview.status,
+            "question_count": len(questions),
+        }
+
+    async def _prepare_interview(
+        self,
+        user_id: int,
+        job_title: str,
+        company_name: Optional[str],
+        job_description: Optional[str],
+        resume_id: Optional[int],
+        job_id: Optional[int],
+        interview_type: str,
+        difficulty: str,
+        question_count: int,
+        focus_areas: Optional[List[str]],
+        language: str,
+    ) -> Tuple[Interview, Optional[Dict[str, Any]]]:
+        """
+        Validate the configuration, load resume/job context and build the
+        (not yet persisted) Interview record.
+
+        The record is written once, after generation: no transaction is held
+        open across the Gemini call and nothing reads "generating".
+
+        Returns:
+            Tuple of (interview, resume summary or None)
+        """
+        # Validate parameters
+        if interview_type not in ["behavioral", "technical", "mixed"]:
+            interview_type = self.DEFAULT_INTERVIEW_TYPE
+        if difficulty not in ["entry", "mid", "senior"]:
+            difficulty = self.DEFAULT_DIFFICULTY
+        question_count = max(1, min(10, question_count))
+
+        # Resume and job lookups are independent: run them concurrently
+        resume_summary, job_details = await asyncio.gather(
+            self._fetch_resume_summary(user_id, resume_id),
+            self._fetch_job_details(user_id, None if job_description else job_id),
+        )
+
+        if job_details:
+            job_description = job_details["description"]
+            if not company_name:
+                company_name = job_details["company"]
+
+        interview = Interview(
+            user_id=user_id,
+            resume_id=resume_id,
+            job_id=job_id,
+            job_title=job_title,
+            company_name=company_name,
+            job_description=job_description,
+            status="generating",
+            config={
+                "interview_type": interview_type,
+                "difficulty": difficulty,
+                "question_count": question_count,
+                "focus_areas": focus_areas or [],
+                "language": language,
+            },
+        )
+        return interview, resume_summary
+
+    def _commit_keep_loaded(self) -> None:
+        """
+        Commit a newly generated interview without expiring it.
+
+        The interview is read again right after the commit (response body, SSE
+        done event); with the default expire_on_commit that read reloads the
+        whole row. Nothing server-side changes it here: the INSERT returns
+        the primary key and server defaults. Other commits keep the session's
+        expire-on-commit behaviour.
+        """
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            self.db.commit()
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+
+    @staticmethod
+    def _question_params(interview: Interview, resume_summary: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Question generation inputs for a prepared interview."""
+        config = interview.config
+        return {
+            "job_title": interview.job_title,
+            "company_name": interview.company_name,
+            "job_description": interview.job_description,
+            "resume_summary": resume_summary,
+            "interview_type": config["interview_type"],
+            "difficulty": config["difficulty"],
+            "question_count": config["question_count"],
+            "focus_areas": config["focus_areas"] or None,
+            "language": config["language"],
+        }
+
+    def _recent_generation_key(
+        self,
+        user_id: int,
+        job_title: str,
+        company_name: Optional[str],
+        job_description: Optional[str],
+        resume_id: Optional[int],
+        job_id: Optional[int],
+        interview_type: str,
+        difficulty: str,
+        question_count: int,
+        focus_areas: Optional[List[str]],
+        language: str,
+    ) -> Optional[str]:
+        """
+        Per-user key for a generation request, or None if caching is disabled.
+
+        Keyed on the raw request (before resume/job lookups) so a repeat is
+        detected without touching the database. Raw text is only hashed.
+        """
+        if not settings.interview_cache_enabled:
+            return None
+
+        return make_cache_key("interview_recent", {
+            "user_id": user_id,
+            "job_title": _normalize_text(job_title),
+            "company_name": _normalize_text(company_name),
+            "job_description": job_description or "",
+            "resume_id": resume_id,
+            "job_id": job_id,
+            "interview_type": interview_type,
+            "difficulty": difficulty,
+            "question_count": question_count,
+            "focus_areas": sorted({_normalize_text(area) for area in focus_areas or []}),
+            "language": language,
+        })
+
+    async def _clone_recent_interview(self, user_id: int, recent_key: Optional[str]) -> Optional[Interview]:
+        """
+        Copy the user's identical interview from the last few minutes into a
+        new session, or return None.
+
+        Double-clicks and quick resubmits get a fresh session with the same
+        questions instead of another Gemini call. Only the source interview ID
+        is cached, never its content.
+        """
+        if recent_key is None:
+            return None
+
+        source_id = await cache_get(recent_key)
+        if source_id is None:
+            return None
+
+        source = self.get_interview(int(source_id), user_id)
+        if not source or not source.questions:
+            return None
+
+        interview = Interview(
+            user_id=user_id,
+            resume_id=source.resume_id,
+            job_id=source.job_id,
+            job_title=source.job_title,
+            company_name=source.company_name,
+            job_description=source.job_description,
+            status="ready",
+            config=dict(source.config or {}),
+            questions=list(source.questions),
+        )
+        self.db.add(interview)
+        self._commit_keep_loaded()
+
+        logger.info(
+            "interview_generation_cache_hit",
+            operation="generate_interview",
+            interview_id=interview.id,
+            source_interview_id=source.id,
+            question_count=len(interview.questions),
+        )
+
+        return interview
+
     async def evaluate_answer(
         self,
         interview_id: int,
@@ -221,7 +748,7 @@ class InterviewService:
             ValueError: If interview or question not found
             Exception: If evaluation fails
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         logger.info(
             "answer_evaluation_started",
@@ -243,13 +770,7 @@ class InterviewService:
             if not interview.questions:
                 raise ValueError("Interview has no questions")
 
-            # Find the question
-            question = None
-            for q in interview.questions:
-                if q.get("id") == question_id:
-                    question = q
-                    break
-
+            question = interview.get_question(question_id)
             if not question:
                 raise ValueError(f"Question {question_id} not found in interview")
 
@@ -266,38 +787,44 @@ class InterviewService:
                 language=interview.config.get("language", "ko"),
             )
 
-            # Store the answer
-            answer_record = {
-                "question_id": question_id,
-                "answer_text": answer_text,
-                "answer_audio_url": answer_audio_url,
-                "answered_at": datetime.utcnow().isoformat(),
-                "evaluation": evaluation,
-            }
-
-            # Update or append answer
-            answers = interview.answers or []
-            existing_idx = next(
-                (i for i, a in enumerate(answers) if a.get("question_id") == question_id),
-                None
+            # Store the answer: one-row upsert, re-answering replaces the previous answer
+            insert = _UPSERT_INSERTS[self.db.get_bind().dialect.name]
+            insert_stmt = insert(InterviewAnswer).values(
+                interview_id=interview.id,
+                question_id=question_id,
+                answer_text=answer_text,
+                answer_audio_url=answer_audio_url,
+                answered_at=datetime.utcnow(),
+                evaluation=evaluation,
             )
-            if existing_idx is not None:
-                answers[existing_idx] = answer_record
-            else:
-                answers.append(answer_record)
+            self.db.execute(insert_stmt.on_conflict_do_update(
+                index_elements=[InterviewAnswer.interview_id, InterviewAnswer.question_id],
+                set_={
+                    "answer_text": insert_stmt.excluded.answer_text,
+                    "answer_audio_url": insert_stmt.excluded.answer_audio_url,
+                    "answered_at": insert_stmt.excluded.answered_at,
+                    "evaluation": insert_stmt.excluded.evaluation,
+                },
+            ))
 
-            interview.answers = answers
-            interview.completed_questions = len(answers)
+            # Answer count and average score in one aggregate query
+            answered_count, average_score = self.db.query(
+                func.count(InterviewAnswer.id),
+                func.avg(InterviewAnswer.evaluation["score"].as_float()),
+            ).filter(
+                InterviewAnswer.interview_id == interview.id,
+            ).one()
+            interview.completed_questions = answered_count
 
             # Check if all questions answered
-            if len(answers) >= len(interview.questions):
+            if answered_count >= len(interview.questions):
                 interview.status = "completed"
                 interview.completed_at = datetime.utcnow()
-                interview.total_score = interview.calculate_total_score()
+                interview.total_score = round(float(average_score or 0), 1)
 
             self.db.commit()
 
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.monotonic() - start_time) * 1000)
             logger.info(
                 "answer_evaluation_completed",
                 operation="evaluate_answer",
@@ -316,7 +843,7 @@ class InterviewService:
             }
 
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.monotonic() - start_time) * 1000)
             logger.error(
                 "answer_evaluation_failed",
                 operation="evaluate_answer",
@@ -339,110 +866,195 @@ class InterviewService:
         language: str,
     ) -> List[Dict[str, Any]]:
         """Generate interview questions using Gemini AI."""
+        cache_key = self._question_cache_key(
+            job_title, company_name, job_description, resume_summary,
+            interview_type, difficulty, question_count, focus_areas, language,
+        )
+        if cache_key is not None:
+            cached = await cache_get(cache_key)
+            if cached is not None:
+                logger.info(
+                    "interview_questions_cache_hit",
+                    operation="generate_questions",
+                    question_count=question_count,
+                )
+                return orjson.loads(cached)
+
+        prompt = self._build_question_prompt(
+            job_title, company_name, job_description, resume_summary,
+            interview_type, difficulty, question_count, focus_areas, language,
+        )
+
+        # Call Gemini
+        response = await self.gemini_client.generate_content(prompt)
 
-        # Build the prompt
-        lang_instruction = "한국어로 답변해주세요." if language == "ko" else "Please respond in English."
+        # Parse JSON response
+        try:
+            questions = _parse_json_response(response)
 
-        difficulty_desc = {
-            "entry": "신입/주니어 레벨 (1-2년 경력)",
-            "mid": "중급 레벨 (3-5년 경력)",
-            "senior": "시니어 레벨 (6년 이상 경력)",
-        }.get(difficulty, "중급 레벨")
+            # Validate and normalize questions
+            validated_questions = [
+                self._normalize_question(i, q)
+                for i, q in enumerate(questions[:question_count], 1)
+            ]
 
-        type_desc = {
-            "behavioral": "행동 면접 질문 (과거 경험, 상황 대처)",
-            "technical": "기술 면접 질문 (기술 지식, 문제 해결)",
-            "mixed": "행동 면접과 기술 면접 혼합",
-        }.get(interview_type, "혼합")
+            if cache_key is not None:
+                await cache_set(
+                    cache_key,
+                    orjson.dumps(validated_questions).decode(),
+                    settings.interview_cache_ttl_seconds,
+                )
 
-        prompt = f"""당신은 전문 면접관입니다. 다음 조건에 맞는 면접 질문을 {question_count}개 생성해주세요.
+            return validated_questions
 
-{lang_instruction}
+        except orjson.JSONDecodeError as e:
+            logger.error(
+                "question_json_parse_failed",
+                operation="generate_questions",
+                error=str(e),
+            )
+            # Return fallback questions
+            return list(self._get_fallback_questions(job_title, question_count, language))
+
+    async def _stream_questions_with_gemini(
+        self,
+        job_title: str,
+        company_name: Optional[str],
+        job_description: Optional[str],
+        resume_summary: Optional[Dict[str, Any]],
+        interview_type: str,
+        difficulty: str,
+        question_count: int,
+        focus_areas: Optional[List[str]],
+        language: str,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream interview questions from Gemini, one normalized question at a time.
+
+        Cache, prompt and fallback behaviour match _generate_questions_with_gemini.
+        If the stream turns out not to be valid JSON, the questions already
+        yielded are kept and the rest come from the fallback set.
+        """
+        cache_key = self._question_cache_key(
+            job_title, company_name, job_description, resume_summary,
+            interview_type, difficulty, question_count, focus_areas, language,
+        )
+        if cache_key is not None:
+            cached = await cache_get(cache_key)
+            if cached is not None:
+                logger.info(
+                    "interview_questions_cache_hit",
+                    operation="stream_questions",
+                    question_count=question_count,
+                )
+                for question in orjson.loads(cached):
+                    yield question
+                return
 
-## 채용 정보
+        prompt = self._build_question_prompt(
+            job_title, company_name, job_description, resume_summary,
+            interview_type, difficulty, question_count, focus_areas, language,
+        )
+
+        questions: List[Dict[str, Any]] = []
+        parse_failed = False
+        try:
+            async for item in iter_json_array_items(self.gemini_client.stream_content(prompt)):
+                # Keep draining past the requested count so the stream closes cleanly
+                if len(questions) < question_count:
+                    question = self._normalize_question(len(questions) + 1, item)
+                    questions.append(question)
+                    yield question
+
+        except orjson.JSONDecodeError as e:
+            logger.error(
+                "question_json_parse_failed",
+                operation="stream_questions",
+                error=str(e),
+            )
+            parse_failed = True
+
+        if parse_failed or not questions:
+            fallback = self._get_fallback_questions(job_title, question_count, language)
+            for question in fallback[len(questions):]:
+                yield question
+            return
+
+        if cache_key is not None:
+            await cache_set(
+                cache_key,
+                orjson.dumps(questions).decode(),
+                settings.interview_cache_ttl_seconds,
+            )
+
+    def _build_question_prompt(
+        self,
+        job_title: str,
+        company_name: Optional[str],
+        job_description: Optional[str],
+        resume_summary: Optional[Dict[str, Any]],
+        interview_type: str,
+        difficulty: str,
+        question_count: int,
+        focus_areas: Optional[List[str]],
+        language: str,
+    ) -> str:
+        """
+        Build the question generation prompt.
+
+        Prompt layout: QUESTION_PROMPT_PREFIX (static) first, then the
+        request-specific job/resume/focus sections.
+        """
+        difficulty_desc = DIFFICULTY_DESCRIPTIONS.get(difficulty, DIFFICULTY_DESCRIPTIONS["mid"])
+        type_desc = INTERVIEW_TYPE_DESCRIPTIONS.get(interview_type, INTERVIEW_TYPE_DESCRIPTIONS["mixed"])
+
+        # Sections are collected and joined once (f-strings are compiled at
+        # import; repeated += would copy the growing prompt per section)
+        sections = [
+            QUESTION_PROMPT_PREFIX.get(language, QUESTION_PROMPT_PREFIX["en"]),
+            f"""## 채용 정보
 - 직무: {job_title}
 - 회사: {company_name or '미지정'}
 - 난이도: {difficulty_desc}
 - 면접 유형: {type_desc}
+- 질문 개수: {question_count}개
 
-"""
+""",
+        ]
 
         if job_description:
-            prompt += f"""## 직무 설명
-{job_description[:2000]}
+            sections.append(f"""## 직무 설명
+{truncate_to_token_budget(job_description, JOB_DESCRIPTION_TOKEN_BUDGET)}
 
-"""
+""")
 
         if resume_summary:
-            prompt += f"""## 지원자 이력서 요약
+            sections.append(f"""## 지원자 이력서 요약
 - 기술 스택: {', '.join(resume_summary.get('skills', [])[:10])}
 - 경력: {resume_summary.get('experience_summary', 'N/A')}
 
-"""
+""")
 
         if focus_areas:
-            prompt += f"""## 집중 영역
-{', '.join(focus_areas)}
+            sections.append(f"""## 집중 영역
+{truncate_to_token_budget(', '.join(focus_areas), FOCUS_AREAS_TOKEN_BUDGET)}
 
-"""
+""")
 
-        prompt += """## 출력 형식
-다음 JSON 형식으로 정확히 출력해주세요:
+        return "".join(sections)
 
-```json
-[
-  {
-    "id": 1,
-    "question": "질문 내용",
-    "type": "behavioral" 또는 "technical" 또는 "situational",
-    "difficulty": 1-5 (숫자),
-    "expected_topics": ["예상 답변 주제1", "주제2"],
-    "time_limit_seconds": 120,
-    "tips": "답변 팁"
-  }
-]
-```
-
-질문은 구체적이고 실무 중심으로 작성해주세요. STAR 기법으로 답변할 수 있는 질문을 포함해주세요.
-"""
-
-        # Call Gemini
-        response = await self.gemini_client.generate_content(prompt)
-
-        # Parse JSON response
-        try:
-            # Extract JSON from response
-            response_text = response.strip()
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0]
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0]
-
-            questions = json.loads(response_text)
-
-            # Validate and normalize questions
-            validated_questions = []
-            for i, q in enumerate(questions[:question_count], 1):
-                validated_questions.append({
-                    "id": i,
-                    "question": q.get("question", ""),
-                    "type": q.get("type", "behavioral"),
-                    "difficulty": min(5, max(1, int(q.get("difficulty", 3)))),
-                    "expected_topics": q.get("expected_topics", []),
-                    "time_limit_seconds": q.get("time_limit_seconds", 120),
-                    "tips": q.get("tips", ""),
-                })
-
-            return validated_questions
-
-        except json.JSONDecodeError as e:
-            logger.error(
-                "question_json_parse_failed",
-                operation="generate_questions",
-                error=str(e),
-            )
-            # Return fallback questions
-            return self._get_fallback_questions(job_title, question_count, language)
+    @staticmethod
+    def _normalize_question(question_id: int, q: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize one generated question to the stored shape."""
+        return {
+            "id": question_id,
+            "question": q.get("question", ""),
+            "type": q.get("type", "behavioral"),
+            "difficulty": min(5, max(1, int(q.get("difficulty", 3)))),
+            "expected_topics": q.get("expected_topics", []),
+            "time_limit_seconds": q.get("time_limit_seconds", 120),
+            "tips": q.get("tips", ""),
+        }
 
     async def _evaluate_with_gemini(
         self,
@@ -451,15 +1063,14 @@ class InterviewService:
         job_title: str,
         language: str,
     ) -> Dict[str, Any]:
-        """Evaluate an answer using Gemini AI."""
-
-        lang_instruction = "한국어로 답변해주세요." if language == "ko" else "Please respond in English."
-
-        prompt = f"""당신은 전문 면접관입니다. 다음 면접 답변을 평가해주세요.
-
-{lang_instruction}
+        """
+        Evaluate an answer using Gemini AI (score and feedback only).
 
-## 면접 질문
+        Prompt layout: EVALUATION_PROMPT_PREFIX (static) first, then the
+        question, expected topics, job and answer.
+        """
+        prompt = EVALUATION_PROMPT_PREFIX.get(language, EVALUATION_PROMPT_PREFIX["en"])
+        prompt += f"""## 면접 질문
 {question.get('question', '')}
 
 ## 예상 답변 주제
@@ -470,40 +1081,17 @@ class InterviewService:
 
 ## 지원자 답변
 {answer_text}
-
-## 평가 기준
-1. 답변의 구체성 (예시, 수치, 경험 포함 여부)
-2. STAR 기법 활용 (Situation, Task, Action, Result)
-3. 직무 관련성
-4. 논리적 구조
-5. 커뮤니케이션 명확성
-
-## 출력 형식
-다음 JSON 형식으로 정확히 출력해주세요:
-
-```json
-{{
-  "score": 0-100 (숫자),
-  "strengths": ["강점1", "강점2"],
-  "improvements": ["개선점1", "개선점2"],
-  "feedback": "상세 피드백 (2-3문장)",
-  "model_answer": "모범 답변 예시 (3-4문장)"
-}}
-```
 """
 
         # Call Gemini
-        response = await self.gemini_client.generate_content(prompt)
+        response = await self.gemini_client.generate_content(
+            prompt,
+            generation_config={"max_output_tokens": EVALUATION_MAX_OUTPUT_TOKENS},
+        )
 
         # Parse JSON response
         try:
-            response_text = response.strip()
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0]
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0]
-
-            evaluation = json.loads(response_text)
+            evaluation = _parse_json_response(response)
 
             # Normalize evaluation
             return {
@@ -511,10 +1099,10 @@ class InterviewService:
                 "strengths": evaluation.get("strengths", [])[:5],
                 "improvements": evaluation.get("improvements", [])[:5],
                 "feedback": evaluation.get("feedback", "평가를 완료했습니다."),
-                "model_answer": evaluation.get("model_answer", ""),
+                "model_answer": "",  # Filled on demand by get_model_answer
             }
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(
                 "evaluation_json_parse_failed",
                 operation="evaluate_answer",
@@ -528,12 +1116,105 @@ class InterviewService:
                 "model_answer": "",
             }
 
-    def _get_user_resume(self, user_id: int, resume_id: int) -> Optional[Resume]:
-        """Get user's resume."""
-        return self.db.query(Resume).filter(
-            Resume.id == resume_id,
-            Resume.user_id == user_id,
-        ).first()
+    async def _model_answer_with_gemini(
+        self,
+        question: Dict[str, Any],
+        job_title: str,
+        language: str,
+    ) -> str:
+        """
+        Write a model answer for a question using Gemini AI.
+
+        Prompt layout: MODEL_ANSWER_PROMPT_PREFIX (static) first, then the
+        question, expected topics and job.
+        """
+        prompt = MODEL_ANSWER_PROMPT_PREFIX.get(language, MODEL_ANSWER_PROMPT_PREFIX["en"])
+        prompt += f"""## 면접 질문
+{question.get('question', '')}
+
+## 예상 답변 주제
+{', '.join(question.get('expected_topics', []))}
+
+## 직무
+{job_title}
+"""
+
+        response = await self.gemini_client.generate_content(
+            prompt,
+            generation_config={"max_output_tokens": MODEL_ANSWER_MAX_OUTPUT_TOKENS},
+        )
+        return GeminiClient._strip_code_fences(response).strip()
+
+    def _question_cache_key(
+        self,
+        job_title: str,
+        company_name: Optional[str],
+        job_description: Optional[str],
+        resume_summary: Optional[Dict[str, Any]],
+        interview_type: str,
+        difficulty: str,
+        question_count: int,
+        focus_areas: Optional[List[str]],
+        language: str,
+    ) -> Optional[str]:
+        """
+        Cache key for a generic question set, or None if the request is not cacheable.
+
+        Only generic requests (no job description, no resume) are cached: they
+        yield interchangeable question sets. Case, whitespace and focus-area
+        order are normalized away so trivially different spellings of the
+        same request share one entry.
+        """
+        if not settings.interview_cache_enabled or job_description or resume_summary:
+            return None
+
+        return make_cache_key("interview_questions", {
+            "model": self.gemini_client.model_name,
+            "prompt_version": QUESTION_PROMPT_VERSION.get(language, QUESTION_PROMPT_VERSION["en"]),
+            "job_title": _normalize_text(job_title),
+            "company_name": _normalize_text(company_name),
+            "interview_type": interview_type,
+            "difficulty": difficulty,
+            "question_count": question_count,
+            "focus_areas": sorted({_normalize_text(area) for area in focus_areas or []}),
+            "language": language,
+        })
+
+    async def _fetch_resume_summary(self, user_id: int, resume_id: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        Get the analysis summary of a user's resume (None if absent or unanalyzed).
+
+        Runs in a worker thread on its own short-lived session (a Session must
+        not be shared across threads), so it can overlap with other lookups.
+        """
+        if not resume_id:
+            return None
+
+        def fetch() -> Optional[Dict[str, Any]]:
+            with Session(self.db.get_bind()) as session:
+                resume = session.query(Resume).filter(
+                    Resume.id == resume_id,
+                    Resume.user_id == user_id,
+                ).first()
+                if resume and resume.analysis_result:
+                    return self._extract_resume_summary(resume)
+                return None
+
+        return await asyncio.to_thread(fetch)
+
+    async def _fetch_job_details(self, user_id: int, job_id: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Get description and company of a user's saved job (same threading as _fetch_resume_summary)."""
+        if not job_id:
+            return None
+
+        def fetch() -> Optional[Dict[str, Any]]:
+            with Session(self.db.get_bind()) as session:
+                job = session.query(Job).filter(Job.id == job_id, Job.user_id == user_id).first()
+                if job:
+                    return {"description": job.description, "company": job.company}
+                return None
+
+        return await asyncio.to_thread(fetch)
 
     def _extract_resume_summary(self, resume: Resume) -> Dict[str, Any]:
         """Extract summary from resume analysis."""
@@ -548,84 +1229,90 @@ class InterviewService:
             "strengths": analysis.get("strengths", []),
         }
 
+    @staticmethod
+    @lru_cache(maxsize=256)
     def _get_fallback_questions(
-        self,
         job_title: str,
         count: int,
         language: str,
-    ) -> List[Dict[str, Any]]:
-        """Get fallback questions if Gemini fails."""
-
-        if language == "ko":
-            fallback = [
-                {
-                    "question": f"{job_title} 직무에 지원하게 된 동기가 무엇인가요?",
-                    "type": "behavioral",
-                    "expected_topics": ["동기", "열정", "경력 목표"],
-                },
-                {
-                    "question": "가장 도전적이었던 프로젝트 경험을 말씀해주세요.",
-                    "type": "behavioral",
-                    "expected_topics": ["문제 해결", "팀워크", "성과"],
-                },
-                {
-                    "question": "팀에서 갈등이 발생했을 때 어떻게 해결하셨나요?",
-                    "type": "situational",
-                    "expected_topics": ["커뮤니케이션", "협업", "리더십"],
-                },
-                {
-                    "question": "본인의 강점과 약점은 무엇이라고 생각하시나요?",
-                    "type": "behavioral",
-                    "expected_topics": ["자기인식", "성장", "개선"],
-                },
-                {
-                    "question": "5년 후 본인의 모습을 어떻게 그리고 계신가요?",
-                    "type": "behavioral",
-                    "expected_topics": ["경력 계획", "목표", "성장"],
-                },
-            ]
-        else:
-            fallback = [
-                {
-                    "question": f"Why are you interested in the {job_title} position?",
-                    "type": "behavioral",
-                    "expected_topics": ["motivation", "passion", "career goals"],
-                },
-                {
-                    "question": "Tell me about your most challenging project experience.",
-                    "type": "behavioral",
-                    "expected_topics": ["problem solving", "teamwork", "results"],
-                },
-                {
-                    "question": "How do you handle conflicts within a team?",
-                    "type": "situational",
-                    "expected_topics": ["communication", "collaboration", "leadership"],
-                },
-                {
-                    "question": "What are your strengths and weaknesses?",
-                    "type": "behavioral",
-                    "expected_topics": ["self-awareness", "growth", "improvement"],
-                },
-                {
-                    "question": "Where do you see yourself in 5 years?",
-                    "type": "behavioral",
-                    "expected_topics": ["career plan", "goals", "growth"],
-                },
-            ]
+    ) -> Tuple[Dict[str, Any], ...]:
+        """
+        Get fallback questions if Gemini fails.
+
+        Cached per (job_title, count, language); the returned question
+        dicts are shared and must be treated as read-only.
+        """
+        fallback = _FALLBACK_QUESTIONS_KO if language == "ko" else _FALLBACK_QUESTIONS_EN
 
-        questions = []
-        for i, q in enumerate(fallback[:count], 1):
-            questions.append({
+        return tuple(
+            {
                 "id": i,
-                "question": q["question"],
+                "question": q["question"].format(job_title=job_title),
                 "type": q["type"],
                 "difficulty": 3,
                 "expected_topics": q["expected_topics"],
                 "time_limit_seconds": 120,
                 "tips": "",
-            })
+            }
+            for i, q in enumerate(fallback[:count], 1)
+        )
 
-        return questions
+    async def get_model_answer(self, interview_id: int, user_id: int, question_id: int) -> str:
+        """
+        Get the model answer for an answered question, generating it on first request.
+
+        The generated text is stored in the answer's evaluation, so later
+        requests (and the interview detail view) reuse it.
+
+        Args:
+            interview_id: Interview session ID
+            user_id: User ID
+            question_id: Question ID within the interview
+
+        Returns:
+            Model answer text
+
+        Raises:
+            ValueError: If the interview, question or answer is not found
+        """
+        interview = self.get_interview(interview_id, user_id)
+        if not interview:
+            raise ValueError(f"Interview {interview_id} not found")
+
+        question = interview.get_question(question_id)
+        if not question:
+            raise ValueError(f"Question {question_id} not found in interview")
+
+        answer = self.db.query(InterviewAnswer).filter(
+            InterviewAnswer.interview_id == interview_id,
+            InterviewAnswer.question_id == question_id,
+        ).first()
+        if not answer:
+            raise ValueError(f"Question {question_id} has not been answered yet")
+
+        evaluation = answer.evaluation or {}
+        if evaluation.get("model_answer"):
+            return evaluation["model_answer"]
+
+        start_time = time.monotonic()
+        model_answer = await self._model_answer_with_gemini(
+            question=question,
+            job_title=interview.job_title,
+            language=interview.config.get("language", "ko"),
+        )
+
+        answer.evaluation = {**evaluation, "model_answer": model_answer}
+        self.db.commit()
+
+        logger.info(
+            "model_answer_generated",
+            operation="get_model_answer",
+            interview_id=interview_id,
+            question_id=question_id,
+            duration_ms=int((time.monotonic() - start_time) * 1000),
+        )
+
+        return model_answer
 
     def get_interview(self, interview_id: int, user_id: int) -> Optional[Interview]:
         """Get interview by ID."""
@@ -640,7 +1327,16 @@ class InterviewService:
         limit: int = 10,
         offset: int = 0,
     ) -> List[Interview]:
-        """Get user's interview history."""
-        return self.db.query(Interview).filter(
+        """
+        Get user's interview history.
+
+        History rows are only rendered through Interview.get_summary(), which
+        never touches the resume/job relationships, so they stay lazy (eager
+        loading would add queries, not remove them). The job description is
+        deferred since summaries don't show it.
+        """
+        return self.db.query(Interview).options(
+            defer(Interview.job_description),
+        ).filter(
             Interview.user_id == user_id,
         ).order_by(Interview.created_at.desc()).offset(offset).limit(limit).all()
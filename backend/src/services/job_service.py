@@ -10,23 +10,203 @@ T054: Job service for search and recommendations
 T055-T056: Gemini job matching prompts
 """
 
+import asyncio
+import re
 import time
 import json
-from typing import Optional, Dict, Any, List
+from typing import AsyncIterator, Optional, Dict, Any, List, Union
 from datetime import datetime
 
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, RootModel, ValidationError, field_validator
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import func, insert, or_, select
 
 from src.config import settings
-from src.models.job import Job
+from src.models.job import Job, JOB_SEARCH_VECTOR, JOB_SUMMARY_COLUMNS
 from src.models.resume import Resume
-from src.services.gemini_client import GeminiClient
+from src.services.gemini_client import GeminiClient, get_gemini_client, iter_json_array_items
+from src.utils.cache import cache_get, cache_get_many, cache_set, make_cache_key
 from src.utils.logging_config import get_logger
 from src.utils.privacy import scrub_all_pii
 
 logger = get_logger(__name__)
 
+# Static parts of the Gemini prompts (role, task, output schema, rules). Each
+# prompt starts with its byte-identical prefix and the candidate/job specific
+# sections follow, so Gemini's implicit prefix caching can reuse the prefix
+# across users.
+RECOMMENDATION_PROMPT_PREFIX = """You are an expert career advisor and job matching specialist. Based on the candidate's resume analysis, recommend suitable job positions.
+
+## Task
+Generate the requested number of specific job recommendations that would be a great match for the candidate profile below.
+
+For each recommendation, provide:
+1. A specific job title
+2. Type of company (startup, large corporation, etc.)
+3. Industry
+4. Match score (0-100)
+5. Why this role is a good match
+6. Skills that match
+7. Skills the candidate might need to develop
+
+## Output Format
+Return ONLY a valid JSON array with this structure (no markdown, no additional text):
+[
+  {
+    "title": "Job Title",
+    "company_type": "Startup / Mid-size / Enterprise",
+    "industry": "Industry name",
+    "location": "Recommended location or Remote",
+    "job_type": "full-time / part-time / contract / internship",
+    "experience_level": "entry / mid / senior",
+    "match_score": 85,
+    "match_reason": "Brief explanation of why this is a good match",
+    "matching_skills": ["skill1", "skill2"],
+    "skills_to_develop": ["skill3"],
+    "sample_companies": ["Company1", "Company2", "Company3"]
+  }
+]
+
+Important:
+- Be specific with job titles (not generic)
+- Match scores should be realistic (70-95 range for good matches)
+- Consider the candidate's experience level
+- Provide actionable recommendations
+"""
+
+MATCH_PROMPT_PREFIX = """You are an expert job matching specialist. Analyze how well the candidate below matches the job posting below.
+
+## Task
+Analyze the match and provide:
+1. Overall match score (0-100)
+2. Skills that match the job requirements
+3. Skills the candidate is missing
+4. Strengths relevant to this role
+5. Areas where the candidate could improve
+6. Overall recommendation
+
+## Output Format
+Return ONLY valid JSON (no markdown):
+{
+  "match_score": 85,
+  "match_level": "Strong Match" | "Good Match" | "Moderate Match" | "Weak Match",
+  "matching_skills": ["skill1", "skill2"],
+  "missing_skills": ["skill3", "skill4"],
+  "relevant_strengths": ["strength1"],
+  "improvement_areas": ["area1"],
+  "recommendation": "Brief recommendation about applying",
+  "key_requirements_met": ["req1", "req2"],
+  "key_requirements_missing": ["req3"]
+}
+"""
+
+BULK_MATCH_PROMPT_PREFIX = """You are an expert job matching specialist. Analyze how well the candidate below matches each of the numbered job postings below.
+
+## Task
+For every posting, provide an overall match score (0-100), the matching and missing skills, and a one-sentence recommendation.
+
+## Output Format
+Return ONLY a valid JSON array with one object per posting, in posting order (no markdown):
+[
+  {
+    "job_index": 1,
+    "match_score": 85,
+    "match_level": "Strong Match" | "Good Match" | "Moderate Match" | "Weak Match",
+    "matching_skills": ["skill1", "skill2"],
+    "missing_skills": ["skill3"],
+    "recommendation": "Brief recommendation about applying"
+  }
+]
+"""
+
+
+
+class RecommendationItem(BaseModel):
+    """
+    Validated shape of one RECOMMENDATION_PROMPT_PREFIX array item.
+
+    Missing fields get the defaults the API has always returned; unknown
+    fields are dropped.
+    """
+    title: str = "Unknown Position"
+    company_type: str = "Various"
+    industry: str = "Technology"
+    location: str = "Various"
+    job_type: str = "full-time"
+    experience_level: str = "mid"
+    match_score: Union[int, float] = 70
+    match_reason: str = "Good skill match"
+    matching_skills: List[Any] = Field(default_factory=list)
+    skills_to_develop: List[Any] = Field(default_factory=list)
+    sample_companies: List[Any] = Field(default_factory=list)
+
+    @field_validator("match_score")
+    @classmethod
+    def _clamp_score(cls, value: Union[int, float]) -> Union[int, float]:
+        return min(100, max(0, value))
+
+
+class RecommendationList(RootModel[List[RecommendationItem]]):
+    """Validated reply of the recommendation prompt."""
+
+
+class JobMatchAnalysis(BaseModel):
+    """Validated shape of the MATCH_PROMPT_PREFIX reply (unknown fields are kept)."""
+    model_config = ConfigDict(extra="allow")
+
+    match_score: Union[int, float]
+    match_level: str = "Moderate Match"
+    matching_skills: List[Any] = Field(default_factory=list)
+    missing_skills: List[Any] = Field(default_factory=list)
+    relevant_strengths: List[Any] = Field(default_factory=list)
+    improvement_areas: List[Any] = Field(default_factory=list)
+    recommendation: str = ""
+
+    @field_validator("match_score")
+    @classmethod
+    def _clamp_score(cls, value: Union[int, float]) -> Union[int, float]:
+        return min(100, max(0, value))
+
+
+# Saved jobs scored per bulk match call, and description length per posting
+BULK_MATCH_CHUNK_SIZE = 10
+BULK_MATCH_DESCRIPTION_CHARS = 1000
+
+# Job description length in the single-job match prompt
+MATCH_DESCRIPTION_CHARS = 2000
+
+# Skills listed in the candidate profile section
+PROFILE_SKILL_LIMIT = 20
+
+_PARENTHETICAL_RE = re.compile(r"\s*[(\[][^)\]]*[)\]]")
+_SENTENCE_END_RE = re.compile(r"[.!?。](?=\s)|\n")
+
+
+def _truncate_at_sentence(text: str, max_chars: int) -> str:
+    """
+    Cut text to at most max_chars, ending on a sentence or line boundary.
+
+    Falls back to the hard cut if the last boundary would drop more than
+    half of the allowed length.
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    boundary = None
+    for boundary in _SENTENCE_END_RE.finditer(cut):
+        pass
+    if boundary is not None and boundary.end() >= max_chars // 2:
+        return cut[:boundary.end()].rstrip()
+    return cut
+
+
+def _fit_column(column: Any, value: Any) -> Optional[str]:
+    """Value as text cut to a String column's length (None stays None)."""
+    if value is None:
+        return None
+    return str(value)[:column.type.length]
+
 
 class JobService:
     """
@@ -39,7 +219,7 @@ class JobService:
     def __init__(self, db: Session):
         """Initialize job service."""
         self.db = db
-        self.gemini_client = GeminiClient()
+        self.gemini_client = get_gemini_client()
 
     async def search_jobs(
         self,
@@ -76,44 +256,67 @@ class JobService:
             job_type=job_type,
         )
 
-        # Build query
-        db_query = self.db.query(Job).filter(Job.user_id == user_id)
+        if not any((query, location, job_type, experience_level)):
+            # Plain "my jobs" listing, the common case: no predicates to build
+            jobs = self.get_saved_jobs(user_id, limit)
+        else:
+            stmt = self._filtered_jobs_select(user_id, query, location, job_type, experience_level, limit)
+            # Results are only rendered with get_summary(), so the text columns stay unloaded
+            jobs = list(self.db.scalars(stmt.options(load_only(*JOB_SUMMARY_COLUMNS))))
+
+        logger.info(
+            "job_search_completed",
+            operation="search_jobs",
+            user_id=f"user-{user_id}",
+            results_count=len(jobs),
+        )
+
+        return jobs
+
+    def _filtered_jobs_select(
+        self,
+        user_id: int,
+        query: Optional[str],
+        location: Optional[str],
+        job_type: Optional[str],
+        experience_level: Optional[str],
+        limit: int,
+    ):
+        """
+        Saved jobs of a user narrowed by the search filters.
+
+        Builds on _saved_jobs_select, so PostgreSQL can walk the partial
+        ix_jobs_saved_by_user index in order and apply the filters on top.
+        """
+        stmt = self._saved_jobs_select(user_id, limit)
 
         if query:
-            search_term = f"%{query}%"
-            db_query = db_query.filter(
-                or_(
-                    Job.title.ilike(search_term),
-                    Job.company.ilike(search_term),
-                    Job.description.ilike(search_term),
+            if self.db.get_bind().dialect.name == "postgresql":
+                # Uses the GIN index on the generated search_vector column
+                stmt = stmt.where(
+                    JOB_SEARCH_VECTOR.op("@@")(func.plainto_tsquery("english", query))
+                )
+            else:
+                # SQLite (tests) has no full-text column
+                search_term = f"%{query}%"
+                stmt = stmt.where(
+                    or_(
+                        Job.title.ilike(search_term),
+                        Job.company.ilike(search_term),
+                        Job.description.ilike(search_term),
+                    )
                 )
-            )
 
         if location:
-            db_query = db_query.filter(Job.location.ilike(f"%{location}%"))
+            stmt = stmt.where(Job.location.ilike(f"%{location}%"))
 
         if job_type:
-            db_query = db_query.filter(Job.job_type == job_type)
+            stmt = stmt.where(Job.job_type == job_type)
 
         if experience_level:
-            db_query = db_query.filter(Job.experience_level == experience_level)
-
-        # Order by match score (if available) then by created date
-        jobs = (
-            db_query
-            .order_by(Job.match_score.desc().nullslast(), Job.created_at.desc())
-            .limit(limit)
-            .all()
-        )
+            stmt = stmt.where(Job.experience_level == experience_level)
 
-        logger.info(
-            "job_search_completed",
-            operation="search_jobs",
-            user_id=f"user-{user_id}",
-            results_count=len(jobs),
-        )
-
-        return jobs
+        return stmt
 
     async def get_job_recommendations(
         self,
@@ -146,19 +349,42 @@ class JobService:
         )
 
         # Get resume analysis
-        resume = self._get_user_resume(user_id, resume_id)
-        if not resume or not resume.analysis_result:
+        analysis = self._get_resume_analysis(user_id, resume_id)
+        if not analysis:
             raise ValueError(f"Resume {resume_id} not found or not analyzed")
 
         try:
+            # Canonicalized once; the cache key and the prompt both use it
+            skills = self._canonicalize_skills(analysis.get("skills", []))
+            cache_key = self._recommendation_cache_key(analysis, skills, job_preferences, limit)
+            if cache_key is not None:
+                cached = await cache_get(cache_key)
+                if cached is not None:
+                    logger.info(
+                        "job_recommendations_cache_hit",
+                        operation="get_job_recommendations",
+                        user_id=f"user-{user_id}",
+                        duration_ms=int((time.time() - start_time) * 1000),
+                    )
+                    return orjson.loads(cached)
+
             # Generate recommendations using Gemini
-            recommendations = self._generate_recommendations_with_gemini(
-                resume=resume,
+            recommendations = await self._generate_recommendations_with_gemini(
+                analysis=analysis,
+                skills=skills,
                 preferences=job_preferences,
                 limit=limit,
                 user_id=user_id,
             )
 
+            # Parse fallbacks are not cached
+            if cache_key is not None and not any("parse_error" in rec for rec in recommendations):
+                await cache_set(
+                    cache_key,
+                    orjson.dumps(recommendations).decode(),
+                    settings.job_recommendation_cache_ttl_seconds,
+                )
+
             duration_ms = int((time.time() - start_time) * 1000)
 
             logger.info(
@@ -192,145 +418,117 @@ class JobService:
             )
             raise
 
-    def _generate_recommendations_with_gemini(
+    async def stream_job_recommendations(
         self,
-        resume: Resume,
-        preferences: Optional[Dict[str, Any]],
-        limit: int,
         user_id: int,
-    ) -> List[Dict[str, Any]]:
+        resume_id: int,
+        job_preferences: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Generate job recommendations using Gemini AI.
+        Get job recommendations, yielding each one as Gemini streams it.
 
-        T055-T056: Prompt engineering for job recommendations
+        Same inputs and cache as get_job_recommendations, but the first
+        recommendation reaches the caller as soon as its JSON object is
+        complete. The set is cached only if the whole stream parsed.
+
+        Yields:
+            {"type": "recommendation", "recommendation": dict} per item, then
+            {"type": "done", "count": int} or {"type": "error", "message": str}
         """
-        prompt = self._build_recommendation_prompt(resume, preferences, limit)
+        start_time = time.time()
 
         logger.info(
-            "gemini_job_recommendation_request",
-            operation="generate_recommendations",
+            "job_recommendations_stream_started",
+            operation="stream_job_recommendations",
             user_id=f"user-{user_id}",
-            prompt_length=len(prompt),
+            resume_id=resume_id,
         )
 
-        # Call Gemini API
-        response = self.gemini_client.model.generate_content(prompt)
+        analysis = self._get_resume_analysis(user_id, resume_id)
+        if not analysis:
+            yield {"type": "error", "message": f"Resume {resume_id} not found or not analyzed"}
+            return
+
+        skills = self._canonicalize_skills(analysis.get("skills", []))
+        cache_key = self._recommendation_cache_key(analysis, skills, job_preferences, limit)
+        cached = await cache_get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            recommendations = orjson.loads(cached)
+            for recommendation in recommendations:
+                yield {"type": "recommendation", "recommendation": recommendation}
+            yield {"type": "done", "count": len(recommendations)}
+            return
+
+        prompt = self._build_recommendation_prompt(analysis, skills, job_preferences, limit)
+        recommendations = []
+        try:
+            async for item in iter_json_array_items(self.gemini_client.stream_content(prompt)):
+                try:
+                    recommendation = RecommendationItem.model_validate(item).model_dump()
+                except ValidationError:
+                    continue
+                recommendations.append(recommendation)
+                yield {"type": "recommendation", "recommendation": recommendation}
+        except Exception as e:
+            logger.error(
+                "job_recommendations_stream_failed",
+                operation="stream_job_recommendations",
+                user_id=f"user-{user_id}",
+                error=str(e),
+                duration_ms=int((time.time() - start_time) * 1000),
+                exc_info=True,
+            )
+            yield {"type": "error", "message": str(e)}
+            return
+
+        if cache_key is not None and recommendations:
+            await cache_set(
+                cache_key,
+                orjson.dumps(recommendations).decode(),
+                settings.job_recommendation_cache_ttl_seconds,
+            )
 
-        # Parse response
-        recommendations = self._parse_recommendations_response(response.text)
+        logger.info(
+            "job_recommendations_stream_completed",
+            operation="stream_job_recommendations",
+            user_id=f"user-{user_id}",
+            recommendations_count=len(recommendations),
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
 
-        return recommendations
+        yield {"type": "done", "count": len(recommendations)}
 
-    def _build_recommendation_prompt(
+    async def _generate_recommendations_with_gemini(
         self,
-        resume: Resume,
+        analysis: Dict[str, Any],
+        skills: List[str],
         preferences: Optional[Dict[str, Any]],
         limit: int,
-    ) -> str:
-        """Build prompt for job recommendations."""
-        analysis = resume.analysis_result
-
-        prompt = f"""You are an expert career advisor and job matching specialist. Based on the candidate's resume analysis, recommend suitable job positions.
-
-## Candidate Profile
-- **Skills**: {', '.join(analysis.get('skills', [])[:20])}
-- **Experience**: {analysis.get('experience_years', 0)} years
-- **Strengths**: {'; '.join(analysis.get('strengths', [])[:3])}
-- **Suitable Roles (from analysis)**: {', '.join(analysis.get('suitable_roles', [])[:5])}
-"""
-
-        if preferences:
-            prompt += f"""
-## Job Preferences
-- **Preferred Location**: {preferences.get('location', 'Any')}
-- **Job Type**: {preferences.get('job_type', 'Any')}
-- **Experience Level**: {preferences.get('experience_level', 'Any')}
-- **Industry**: {preferences.get('industry', 'Any')}
-"""
-
-        prompt += f"""
-## Task
-Generate {limit} specific job recommendations that would be a great match for this candidate.
-
-For each recommendation, provide:
-1. A specific job title
-2. Type of company (startup, large corporation, etc.)
-3. Industry
-4. Match score (0-100)
-5. Why this role is a good match
-6. Skills that match
-7. Skills the candidate might need to develop
+        user_id: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate job recommendations using Gemini AI.
 
-## Output Format
-Return ONLY a valid JSON array with this structure (no markdown, no additional text):
-[
-  {{
-    "title": "Job Title",
-    "company_type": "Startup / Mid-size / Enterprise",
-    "industry": "Industry name",
-    "location": "Recommended location or Remote",
-    "job_type": "full-time / part-time / contract / internship",
-    "experience_level": "entry / mid / senior",
-    "match_score": 85,
-    "match_reason": "Brief explanation of why this is a good match",
-    "matching_skills": ["skill1", "skill2"],
-    "skills_to_develop": ["skill3"],
-    "sample_companies": ["Company1", "Company2", "Company3"]
-  }}
-]
+        T055-T056: Prompt engineering for job recommendations
+        """
+        prompt = self._build_recommendation_prompt(analysis, skills, preferences, limit)
 
-Important:
-- Be specific with job titles (not generic)
-- Match scores should be realistic (70-95 range for good matches)
-- Consider the candidate's experience level
-- Provide actionable recommendations
-"""
-        return prompt
+        logger.info(
+            "gemini_job_recommendation_request",
+            operation="generate_recommendations",
+            user_id=f"user-{user_id}",
+            prompt_length=len(prompt),
+        )
 
-    def _parse_recommendations_response(self, response_text: str) -> List[Dict[str, Any]]:
-        """Parse Gemini response into recommendations list."""
+        # Call Gemini API; a reply that does not validate is re-asked (JSON_MAX_REPROMPTS)
         try:
-            # Clean response
-            text = response_text.strip()
-            if text.startswith("```json"):
-                text = text[7:]
-            if text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-
-            # Parse JSON
-            recommendations = json.loads(text)
-
-            if not isinstance(recommendations, list):
-                recommendations = [recommendations]
-
-            # Validate and normalize each recommendation
-            validated = []
-            for rec in recommendations:
-                validated.append({
-                    "title": rec.get("title", "Unknown Position"),
-                    "company_type": rec.get("company_type", "Various"),
-                    "industry": rec.get("industry", "Technology"),
-                    "location": rec.get("location", "Various"),
-                    "job_type": rec.get("job_type", "full-time"),
-                    "experience_level": rec.get("experience_level", "mid"),
-                    "match_score": min(100, max(0, rec.get("match_score", 70))),
-                    "match_reason": rec.get("match_reason", "Good skill match"),
-                    "matching_skills": rec.get("matching_skills", []),
-                    "skills_to_develop": rec.get("skills_to_develop", []),
-                    "sample_companies": rec.get("sample_companies", []),
-                })
-
-            return validated
-
-        except json.JSONDecodeError as e:
+            recommendations = await self.gemini_client._generate_json(prompt, RecommendationList)
+        except (json.JSONDecodeError, ValidationError) as e:
             logger.error(
                 "recommendations_parse_failed",
                 operation="parse_recommendations",
                 error=str(e),
-                response_preview=response_text[:200],
             )
             # Return fallback
             return [{
@@ -348,6 +546,106 @@ Important:
                 "parse_error": str(e),
             }]
 
+        return [item.model_dump() for item in recommendations.root]
+
+    def _recommendation_cache_key(
+        self,
+        analysis: Dict[str, Any],
+        skills: List[str],
+        preferences: Optional[Dict[str, Any]],
+        limit: int,
+    ) -> Optional[str]:
+        """
+        Cache key for recommendations, or None if caching is disabled.
+
+        Built from a canonical form of exactly the profile fields the prompt
+        uses: list order and case are normalized away, so re-analyses that
+        only reorder skills or roles still hit. Keys are content hashes, so
+        no profile data is stored in the key.
+        """
+        if not settings.job_recommendation_cache_enabled:
+            return None
+
+        def canonical(values: List[str]) -> List[str]:
+            return sorted({" ".join(str(v).lower().split()) for v in values})
+
+        return make_cache_key("job_recommendations", {
+            "model": self.gemini_client.model_name,
+            "skills": skills,
+            "experience_years": analysis.get("experience_years", 0),
+            "strengths": canonical(analysis.get("strengths", [])[:3]),
+            "suitable_roles": canonical(analysis.get("suitable_roles", [])[:5]),
+            "preferences": {k: v for k, v in (preferences or {}).items() if v},
+            "limit": limit,
+        })
+
+    @staticmethod
+    def _canonicalize_skills(skills: List[Any]) -> List[str]:
+        """
+        Compact skill list for prompts and cache keys.
+
+        Lowercases, drops parenthetical qualifiers ("Python (advanced)" ->
+        "python"), collapses whitespace and removes duplicates, then keeps the
+        first PROFILE_SKILL_LIMIT in resume order and sorts them, so the
+        prompt does not depend on the order the analysis listed them in.
+        """
+        canonical = (
+            " ".join(_PARENTHETICAL_RE.sub("", str(skill)).lower().split())
+            for skill in skills
+        )
+        unique = [skill for skill in dict.fromkeys(canonical) if skill]
+        return sorted(unique[:PROFILE_SKILL_LIMIT])
+
+    def _build_recommendation_prompt(
+        self,
+        analysis: Dict[str, Any],
+        skills: List[str],
+        preferences: Optional[Dict[str, Any]],
+        limit: int,
+    ) -> str:
+        """
+        Build prompt for job recommendations.
+
+        Prompt layout: RECOMMENDATION_PROMPT_PREFIX (static) first, then the
+        candidate profile, preferences and requested count.
+        """
+        sections = [
+            RECOMMENDATION_PROMPT_PREFIX,
+            self._candidate_profile_section(analysis, skills),
+            f"- **Suitable Roles (from analysis)**: {', '.join(analysis.get('suitable_roles', [])[:5])}\n",
+        ]
+
+        if preferences:
+            sections.append(f"""
+## Job Preferences
+- **Preferred Location**: {preferences.get('location', 'Any')}
+- **Job Type**: {preferences.get('job_type', 'Any')}
+- **Experience Level**: {preferences.get('experience_level', 'Any')}
+- **Industry**: {preferences.get('industry', 'Any')}
+""")
+
+        sections.append(f"""
+## Request
+Generate {limit} job recommendations.
+""")
+        return "".join(sections)
+
+    @staticmethod
+    def _candidate_profile_section(analysis: Dict[str, Any], skills: List[str]) -> str:
+        """
+        Candidate profile section shared by the recommendation and match prompts.
+
+        Built once per request; the batch and bulk match paths reuse it for
+        every job instead of re-joining the skill lists per posting. skills
+        is the request's _canonicalize_skills result, computed once.
+        """
+        return f"""
+## Candidate Profile
+- **Skills**: {', '.join(skills)}
+- **Experience**: {analysis.get('experience_years', 0)} years
+- **Strengths**: {'; '.join(analysis.get('strengths', [])[:3])}
+"""
+
     async def analyze_job_match(
         self,
         user_id: int,
@@ -379,19 +677,20 @@ Important:
             job_title=scrub_all_pii(job_title),
         )
 
-        # Get resume
-        resume = self._get_user_resume(user_id, resume_id)
-        if not resume or not resume.analysis_result:
+        # Get resume analysis
+        analysis = self._get_resume_analysis(user_id, resume_id)
+        if not analysis:
             raise ValueError(f"Resume {resume_id} not found or not analyzed")
 
         try:
-            # Analyze match using Gemini
-            analysis = self._analyze_match_with_gemini(
-                resume=resume,
-                job_title=job_title,
-                job_description=job_description,
-                company=company,
-                user_id=user_id,
+            skills = self._canonicalize_skills(analysis.get("skills", []))
+            result = await self._match_resume(
+                self._candidate_profile_section(analysis, skills),
+                skills,
+                job_title,
+                job_description,
+                company,
+                user_id,
             )
 
             duration_ms = int((time.time() - start_time) * 1000)
@@ -400,11 +699,11 @@ Important:
                 "job_match_analysis_completed",
                 operation="analyze_job_match",
                 user_id=f"user-{user_id}",
-                match_score=analysis.get("match_score"),
+                match_score=result.get("match_score"),
                 duration_ms=duration_ms,
             )
 
-            return analysis
+            return result
 
         except Exception as e:
             logger.error(
@@ -416,71 +715,191 @@ Important:
             )
             raise
 
-    def _analyze_match_with_gemini(
+    async def analyze_job_matches(
         self,
-        resume: Resume,
+        user_id: int,
+        resume_id: int,
+        jobs: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze several jobs against one resume concurrently.
+
+        The resume is loaded once and the Gemini calls overlap (bounded by
+        the client's semaphore), so N jobs take about one round trip
+        instead of N.
+
+        Args:
+            user_id: User ID
+            resume_id: Resume ID
+            jobs: Dicts with job_title, job_description and optional company
+
+        Returns:
+            Match analyses in the same order as jobs
+        """
+        start_time = time.time()
+
+        logger.info(
+            "job_match_batch_started",
+            operation="analyze_job_matches",
+            user_id=f"user-{user_id}",
+            resume_id=resume_id,
+            jobs_count=len(jobs),
+        )
+
+        analysis = self._get_resume_analysis(user_id, resume_id)
+        if not analysis:
+            raise ValueError(f"Resume {resume_id} not found or not analyzed")
+
+        skills = self._canonicalize_skills(analysis.get("skills", []))
+        profile = self._candidate_profile_section(analysis, skills)
+        analyses = await asyncio.gather(*(
+            self._match_resume(
+                profile,
+                skills,
+                job["job_title"],
+                job["job_description"],
+                job.get("company"),
+                user_id,
+            )
+            for job in jobs
+        ))
+
+        logger.info(
+            "job_match_batch_completed",
+            operation="analyze_job_matches",
+            user_id=f"user-{user_id}",
+            jobs_count=len(jobs),
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
+
+        return list(analyses)
+
+    async def _match_resume(
+        self,
+        profile: str,
+        skills: List[str],
         job_title: str,
         job_description: str,
         company: Optional[str],
         user_id: int,
     ) -> Dict[str, Any]:
-        """Analyze job match using Gemini."""
-        analysis = resume.analysis_result
+        """
+        Match analysis for one job.
+
+        skills are the canonical resume skills (_canonicalize_skills).
+        Obvious non-matches are answered locally (_prefiltered_match), then
+        the prompt cache is tried before Gemini.
+        """
+        prefiltered = self._prefiltered_match(skills, job_title, job_description)
+        if prefiltered is not None:
+            logger.info(
+                "job_match_prefiltered",
+                operation="analyze_job_match",
+                user_id=f"user-{user_id}",
+                skills_count=len(skills),
+            )
+            return prefiltered
 
-        prompt = f"""You are an expert job matching specialist. Analyze how well this candidate matches the job posting.
+        prompt = self._build_match_prompt(profile, job_title, job_description, company)
 
-## Candidate Profile
-- **Skills**: {', '.join(analysis.get('skills', [])[:20])}
-- **Experience**: {analysis.get('experience_years', 0)} years
-- **Strengths**: {'; '.join(analysis.get('strengths', [])[:3])}
+        cache_key = None
+        if settings.job_match_cache_enabled:
+            cache_key = make_cache_key(
+                "job_match",
+                {"model": self.gemini_client.model_name, "prompt": prompt},
+            )
+            cached = await cache_get(cache_key)
+            if cached is not None:
+                logger.info(
+                    "job_match_cache_hit",
+                    operation="analyze_job_match",
+                    user_id=f"user-{user_id}",
+                )
+                return orjson.loads(cached)
+
+        # Analyze match using Gemini
+        result = await self._analyze_match_with_gemini(prompt=prompt, user_id=user_id)
+
+        # Parse fallbacks are not cached
+        if cache_key is not None and "parse_error" not in result:
+            await cache_set(
+                cache_key,
+                orjson.dumps(result).decode(),
+                settings.job_match_cache_ttl_seconds,
+            )
+
+        return result
+
+    def _prefiltered_match(
+        self,
+        skills: List[str],
+        job_title: str,
+        job_description: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Canned weak match if the job mentions none of the resume skills.
+
+        A local substring check over the title and description: it only
+        applies for resumes with at least job_match_prefilter_min_skills
+        skills, and any single overlap sends the job to Gemini, so it only
+        skips the clear non-matches.
+
+        Returns:
+            Weak match result, or None if Gemini should analyze the job
+        """
+        if not settings.job_match_prefilter_enabled:
+            return None
+        if len(skills) < settings.job_match_prefilter_min_skills:
+            return None
+
+        posting = f"{job_title}\n{job_description}".lower()
+        if any(skill in posting for skill in skills):
+            return None
+
+        return {
+            "match_score": 30,
+            "match_level": "Weak Match",
+            "matching_skills": [],
+            "missing_skills": [],
+            "relevant_strengths": [],
+            "improvement_areas": [],
+            "recommendation": "None of your listed skills appear in this posting; it is likely a weak fit.",
+            "prefiltered": True,
+            "analyzed_at": time.time(),
+            "model_used": None,
+        }
+
+    def _build_match_prompt(
+        self,
+        profile: str,
+        job_title: str,
+        job_description: str,
+        company: Optional[str],
+    ) -> str:
+        """
+        Build the job match prompt.
 
+        Prompt layout: MATCH_PROMPT_PREFIX (static) first, then the candidate
+        profile (_candidate_profile_section) and job posting.
+        """
+        return MATCH_PROMPT_PREFIX + profile + f"""
 ## Job Posting
 - **Title**: {job_title}
 - **Company**: {company or 'Not specified'}
 - **Description**:
-{job_description[:2000]}
-
-## Task
-Analyze the match and provide:
-1. Overall match score (0-100)
-2. Skills that match the job requirements
-3. Skills the candidate is missing
-4. Strengths relevant to this role
-5. Areas where the candidate could improve
-6. Overall recommendation
-
-## Output Format
-Return ONLY valid JSON (no markdown):
-{{
-  "match_score": 85,
-  "match_level": "Strong Match" | "Good Match" | "Moderate Match" | "Weak Match",
-  "matching_skills": ["skill1", "skill2"],
-  "missing_skills": ["skill3", "skill4"],
-  "relevant_strengths": ["strength1"],
-  "improvement_areas": ["area1"],
-  "recommendation": "Brief recommendation about applying",
-  "key_requirements_met": ["req1", "req2"],
-  "key_requirements_missing": ["req3"]
-}}
+{_truncate_at_sentence(job_description, MATCH_DESCRIPTION_CHARS)}
 """
 
-        response = self.gemini_client.model.generate_content(prompt)
-
-        # Parse response
+    async def _analyze_match_with_gemini(self, prompt: str, user_id: int) -> Dict[str, Any]:
+        """Analyze job match using Gemini."""
+        # A reply that does not validate is re-asked (JSON_MAX_REPROMPTS)
         try:
-            text = response.text.strip()
-            if text.startswith("```"):
-                text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-
-            result = json.loads(text)
+            result = (await self.gemini_client._generate_json(prompt, JobMatchAnalysis)).model_dump()
             result["analyzed_at"] = time.time()
             result["model_used"] = self.gemini_client.model_name
             return result
 
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, ValidationError) as e:
             logger.error(
                 "match_analysis_parse_failed",
                 operation="analyze_match",
@@ -497,16 +916,191 @@ Return ONLY valid JSON (no markdown):
                 "parse_error": str(e),
             }
 
-    def _get_user_resume(self, user_id: int, resume_id: int) -> Optional[Resume]:
-        """Get user's resume by ID."""
+    async def refresh_saved_job_matches(self, user_id: int, resume_id: int) -> List[Job]:
+        """
+        Re-score all of a user's saved jobs against a resume.
+
+        Offline/bulk path: instead of one match call per job, several
+        postings share one prompt (BULK_MATCH_CHUNK_SIZE per call), so the
+        instructions and candidate profile are sent once per chunk rather
+        than once per job. Per-job results are cached by content hash of
+        (model, profile, posting), so a refresh only sends postings that
+        changed. Jobs whose result is missing, or whose chunk call failed,
+        keep their old score.
+
+        Args:
+            user_id: User ID
+            resume_id: Resume ID to score against
+
+        Returns:
+            The user's saved jobs with updated match_score/match_analysis
+
+        Raises:
+            ValueError: If the resume is not found or not analyzed
+        """
+        start_time = time.time()
+
+        analysis = self._get_resume_analysis(user_id, resume_id)
+        if not analysis:
+            raise ValueError(f"Resume {resume_id} not found or not analyzed")
+
+        # Full rows: the prompt needs the descriptions. Every saved job, not
+        # the first page the saved-jobs list shows.
+        jobs = list(self.db.scalars(self._saved_jobs_select(user_id, limit=None)))
+
+        logger.info(
+            "job_match_refresh_started",
+            operation="refresh_saved_job_matches",
+            user_id=f"user-{user_id}",
+            resume_id=resume_id,
+            jobs_count=len(jobs),
+        )
+
+        profile = self._candidate_profile_section(
+            analysis, self._canonicalize_skills(analysis.get("skills", []))
+        )
+
+        results: Dict[int, Dict[str, Any]] = {}
+        cache_keys: Dict[int, str] = {}
+        if settings.job_match_cache_enabled:
+            cache_keys = {job.id: self._bulk_match_cache_key(profile, job) for job in jobs}
+            cached = await cache_get_many(list(cache_keys.values()))
+            results = {
+                job_id: orjson.loads(value)
+                for job_id, value in zip(cache_keys, cached) if value is not None
+            }
+
+        pending = [job for job in jobs if job.id not in results]
+        chunks = [pending[i:i + BULK_MATCH_CHUNK_SIZE] for i in range(0, len(pending), BULK_MATCH_CHUNK_SIZE)]
+        # A failed chunk must not discard the others: its jobs keep their old scores
+        chunk_results = await asyncio.gather(*(
+            self._bulk_match_with_gemini(profile, chunk, user_id) for chunk in chunks
+        ), return_exceptions=True)
+
+        fresh: Dict[int, Dict[str, Any]] = {}
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, BaseException):
+                if not isinstance(chunk_result, Exception):
+                    raise chunk_result
+                logger.error(
+                    "bulk_match_chunk_failed",
+                    operation="refresh_saved_job_matches",
+                    user_id=f"user-{user_id}",
+                    jobs_count=len(chunk),
+                    error=str(chunk_result),
+                )
+                continue
+            for job, result in zip(chunk, chunk_result):
+                if result is not None:
+                    result.pop("job_index", None)
+                    fresh[job.id] = result
+        if cache_keys:
+            await asyncio.gather(*(
+                cache_set(
+                    cache_keys[job_id],
+                    orjson.dumps(result).decode(),
+                    settings.job_match_cache_ttl_seconds,
+                )
+                for job_id, result in fresh.items()
+            ))
+        results.update(fresh)
+
+        analyzed_at = time.time()
+        updated = 0
+        for job in jobs:
+            result = results.get(job.id)
+            if result is not None:
+                job.match_score = float(result["match_score"])
+                job.match_analysis = {
+                    **result,
+                    "resume_id": resume_id,
+                    "analyzed_at": analyzed_at,
+                    "model_used": self.gemini_client.model_name,
+                }
+                updated += 1
+        self.db.commit()
+
+        logger.info(
+            "job_match_refresh_completed",
+            operation="refresh_saved_job_matches",
+            user_id=f"user-{user_id}",
+            jobs_count=len(jobs),
+            cached_count=len(jobs) - len(pending),
+            updated_count=updated,
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
+
+        return jobs
+
+    def _bulk_match_cache_key(self, profile: str, job: Job) -> str:
+        """Content-hash cache key for one job's bulk match result."""
+        return make_cache_key("job_match_bulk", {
+            "model": self.gemini_client.model_name,
+            "profile": profile,
+            "title": job.title,
+            "company": job.company,
+            "description": _truncate_at_sentence(job.description or "", BULK_MATCH_DESCRIPTION_CHARS),
+        })
+
+    async def _bulk_match_with_gemini(
+        self,
+        profile: str,
+        jobs: List[Job],
+        user_id: int,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Score several jobs in one Gemini call.
+
+        Returns:
+            One result per job, in order; None where the reply had no usable
+            entry (a reply that is not JSON yields all None)
+        """
+        postings = "\n\n".join(
+            f"### Job {index}\n"
+            f"- **Title**: {job.title}\n"
+            f"- **Company**: {job.company}\n"
+            f"- **Description**:\n{_truncate_at_sentence(job.description or 'Not provided', BULK_MATCH_DESCRIPTION_CHARS)}"
+            for index, job in enumerate(jobs, start=1)
+        )
+        prompt = BULK_MATCH_PROMPT_PREFIX + profile + f"""
+## Job Postings
+{postings}
+"""
+
+        response_text = await self.gemini_client.generate_content(prompt)
+
+        try:
+            items = orjson.loads(GeminiClient._strip_code_fences(response_text))
+        except json.JSONDecodeError as e:
+            logger.error(
+                "bulk_match_parse_failed",
+                operation="bulk_match",
+                user_id=f"user-{user_id}",
+                error=str(e),
+            )
+            return [None] * len(jobs)
+
+        by_index = {
+            item.get("job_index"): item
+            for item in items if isinstance(item, dict) and isinstance(item.get("match_score"), (int, float))
+        } if isinstance(items, list) else {}
+        return [by_index.get(index) for index in range(1, len(jobs) + 1)]
+
+    def _get_resume_analysis(self, user_id: int, resume_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the analysis result of a user's analyzed resume.
+
+        Selects only the analysis column: the prompts use nothing else, so the
+        extracted text is not transferred and no Resume instance is built.
+        """
         return (
-            self.db.query(Resume)
+            self.db.query(Resume.analysis_result)
             .filter(
                 Resume.id == resume_id,
                 Resume.user_id == user_id,
                 Resume.status == "analyzed",
             )
-            .first()
+            .scalar()
         )
 
     async def save_job(
@@ -531,10 +1125,12 @@ Return ONLY valid JSON (no markdown):
             url=url,
             source=source,
             is_saved=True,
+            # Left unset, this onupdate column is re-SELECTed after the
+            # INSERT under eager_defaults
+            updated_at=None,
         )
         self.db.add(job)
         self.db.commit()
-        self.db.refresh(job)
 
         logger.info(
             "job_saved",
@@ -545,15 +1141,90 @@ Return ONLY valid JSON (no markdown):
 
         return job
 
+    def save_recommendations_as_jobs(
+        self,
+        user_id: int,
+        recommendations: List[Dict[str, Any]],
+    ) -> List[int]:
+        """
+        Save AI recommendations to the user's job list.
+
+        All rows go in one executemany INSERT ... RETURNING id and one commit,
+        instead of an add/commit per recommendation.
+
+        Args:
+            user_id: User ID
+            recommendations: Items in the get_job_recommendations shape
+
+        Returns:
+            New job IDs, in input order
+        """
+        # Values come from Gemini or the client: any JSON type, any length
+        rows = [
+            {
+                "user_id": user_id,
+                "title": _fit_column(Job.title, rec.get("title") or "Unknown Position"),
+                "company": _fit_column(
+                    Job.company,
+                    next(iter(rec.get("sample_companies") or []), None) or rec.get("company_type") or "Various",
+                ),
+                "location": _fit_column(Job.location, rec.get("location")),
+                "job_type": _fit_column(Job.job_type, rec.get("job_type")),
+                "experience_level": _fit_column(Job.experience_level, rec.get("experience_level")),
+                "match_score": rec.get("match_score"),
+                "match_analysis": {
+                    "match_score": rec.get("match_score"),
+                    "matching_skills": rec.get("matching_skills", []),
+                    "missing_skills": rec.get("skills_to_develop", []),
+                    "recommendation_reason": rec.get("match_reason"),
+                    "industry": rec.get("industry"),
+                    "sample_companies": rec.get("sample_companies", []),
+                    "model_used": self.gemini_client.model_name,
+                },
+                "source": "ai_recommended",
+                "is_saved": True,
+                "is_applied": False,
+            }
+            for rec in recommendations
+        ]
+        if not rows:
+            return []
+
+        job_ids = list(self.db.scalars(
+            insert(Job).returning(Job.id, sort_by_parameter_order=True),
+            rows,
+        ))
+        self.db.commit()
+
+        logger.info(
+            "recommendations_saved",
+            operation="save_recommendations_as_jobs",
+            user_id=f"user-{user_id}",
+            jobs_count=len(job_ids),
+        )
+
+        return job_ids
+
     def get_saved_jobs(self, user_id: int, limit: int = 50) -> List[Job]:
-        """Get user's saved jobs."""
-        return (
-            self.db.query(Job)
-            .filter(Job.user_id == user_id, Job.is_saved == True)
+        """
+        Get user's saved jobs for listing.
+
+        Only JOB_SUMMARY_COLUMNS are loaded (no description, requirements or
+        match analysis); use _saved_jobs_select for full rows.
+        """
+        return list(self.db.scalars(
+            self._saved_jobs_select(user_id, limit).options(load_only(*JOB_SUMMARY_COLUMNS))
+        ))
+
+    @staticmethod
+    def _saved_jobs_select(user_id: int, limit: Optional[int] = 50):
+        """Saved jobs of a user, best match first (ix_jobs_saved_by_user); limit=None for all."""
+        stmt = (
+            select(Job)
+            .where(Job.user_id == user_id, Job.is_saved == True)
             .order_by(Job.match_score.desc().nullslast(), Job.created_at.desc())
-            .limit(limit)
-            .all()
         )
+        return stmt.limit(limit) if limit is not None else stmt
 
     def get_job_by_id(self, job_id: int, user_id: int) -> Optional[Job]:
         """Get job by ID for specific user."""
@@ -11,27 +11,98 @@ T025: Resume analysis orchestration
 T026: Caching to avoid duplicate Gemini API calls
 """
 
+import asyncio
+import hashlib
+import multiprocessing
 import os
 import uuid
 import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, Dict, Any, BinaryIO
-from datetime import datetime
+from typing import Optional, Dict, Any, Awaitable, BinaryIO, Callable, List, Tuple
+from datetime import datetime, timezone
 
 import PyPDF2
 import docx
+from lxml import etree
 from fastapi import UploadFile
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:  # PyPDF2 fallback only
+    fitz = None
 
 from src.config import settings
 from src.models.resume import Resume
 from src.models.user import User
 from src.services.gemini_client import GeminiClient
-from src.utils.logging_config import get_logger
+from src.services.storage_service import StorageService
+from src.utils.logging_config import configure_logging, get_logger
 from src.utils.privacy import scrub_all_pii
 
 logger = get_logger(__name__)
 
+# Uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Allowed file types (a file passes on either its MIME type or its extension)
+DOCX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+ALLOWED_MIME_TYPES = frozenset({
+    "application/pdf",
+    DOCX_MIME_TYPE,
+    "application/msword",  # Legacy .doc
+    "application/octet-stream",  # Sometimes returned for .docx
+})
+WORD_EXTENSIONS = frozenset({".docx", ".doc"})
+ALLOWED_EXTENSIONS = frozenset({".pdf"}) | WORD_EXTENSIONS
+
+# WordprocessingML tags read when extracting DOCX text from word/document.xml
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY, W_P, W_R, W_HYPERLINK, W_T, W_BR = (
+    W_NS + tag for tag in ("body", "p", "r", "hyperlink", "t", "br")
+)
+# Other run children with a text equivalent (same mapping as python-docx Run.text)
+W_RUN_TEXT = {
+    W_NS + "tab": "\t",
+    W_NS + "ptab": "\t",
+    W_NS + "cr": "\n",
+    W_NS + "noBreakHyphen": "-",
+}
+
+
+@lru_cache(maxsize=1)
+def get_extract_pool() -> ProcessPoolExecutor:
+    """
+    Process pool for text extraction, created on first use.
+
+    Workers are spawned, not forked: the pool is created inside the running
+    server, and a forked worker would inherit the event loop's threads (and
+    any locks they hold) and the open database and Redis sockets. A spawned
+    worker starts fresh, so it configures logging before it imports this
+    module (retry decorators bind loggers at import, as in src.main).
+    """
+    return ProcessPoolExecutor(
+        max_workers=settings.resume_extract_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=configure_logging,
+        initargs=(settings.log_level, settings.is_production),
+    )
+
+
+def shutdown_extract_pool() -> None:
+    """Stop the extraction workers if the pool was created (application shutdown)."""
+    if get_extract_pool.cache_info().currsize:
+        get_extract_pool().shutdown(cancel_futures=True)
+        get_extract_pool.cache_clear()
+
+
+def _extract_text_worker(file_path: str, mime_type: str) -> str:
+    """Pool entry point (top-level so it pickles): ResumeService._extract_text."""
+    return ResumeService._extract_text(Path(file_path), mime_type)
+
 
 class ResumeService:
     """
@@ -42,15 +113,6 @@ class ResumeService:
     T026: Caching logic
     """
 
-    # Allowed file types
-    ALLOWED_MIME_TYPES = {
-        "application/pdf": ".pdf",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
-        "application/msword": ".doc",  # Legacy .doc
-        "application/octet-stream": None,  # Sometimes returned for .docx
-    }
-    ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc"}
-
     def __init__(self, db: Session):
         """
         Initialize resume service.
@@ -86,7 +148,7 @@ class ResumeService:
             ValueError: If file is invalid
             Exception: If analysis fails
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         logger.info(
             "resume_upload_started",
@@ -98,125 +160,275 @@ class ResumeService:
 
         try:
             # Step 1: Validate file (T024)
-            self._validate_file(file)
+            file_ext = self._validate_file(file)
 
-            # Step 2: Read file content
-            file_content = await file.read()
-            file_size = len(file_content)
-            file_hash = Resume.compute_file_hash(file_content)
+            # Step 2: Stream to a .partial file, hashing as it goes (memory stays O(chunk))
+            partial_path, file_size, file_hash = await self._save_stream(file_ext, file.read)
 
-            logger.info(
-                "file_read_completed",
+            return await self._analyze_partial_file(
+                filename=file.filename,
+                content_type=file.content_type,
+                partial_path=partial_path,
+                file_size=file_size,
+                file_hash=file_hash,
+                user_id=user_id,
+                start_time=start_time,
+            )
+
+        except Exception as e:
+            duration_ms = int((time.monotonic() - start_time) * 1000)
+            logger.error(
+                "resume_upload_failed",
                 operation="upload_and_analyze",
                 user_id=f"user-{user_id}",
-                file_size=file_size,
-                file_hash=file_hash[:16],  # First 16 chars
+                duration_ms=duration_ms,
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
             )
+            raise
 
-            # Step 3: Check cache (T026) - Avoid duplicate Gemini calls
-            cached_resume = self._get_cached_resume(user_id, file_hash)
-            if cached_resume:
-                logger.info(
-                    "resume_analysis_cache_hit",
-                    operation="upload_and_analyze",
-                    user_id=f"user-{user_id}",
-                    cached_resume_id=cached_resume.id,
-                )
-                return cached_resume
+    async def ingest_and_analyze_resume(
+        self,
+        object_key: str,
+        user_id: int,
+        filename: Optional[str] = None,
+    ) -> Resume:
+        """
+        Analyze a resume uploaded directly to object storage.
 
-            # Step 4: Save file to disk (Constitution III: UUID filename)
-            file_path = self._save_file(file.filename, file_content)
+        Same pipeline as upload_and_analyze_resume, but the bytes are fetched
+        server-side from storage (presigned PUT flow) instead of being parsed
+        out of a multipart request body.
 
-            # Step 5: Create database record
-            resume = Resume(
-                user_id=user_id,
-                original_filename=file.filename,
-                file_path=str(file_path),
+        Args:
+            object_key: Key returned by StorageService.create_upload_url
+            user_id: User ID
+            filename: Original filename (defaults to the object key basename)
+
+        Returns:
+            Resume object with analysis results
+
+        Raises:
+            ValueError: If the object is invalid or not owned by the user
+            FileNotFoundError: If no object exists under the key
+            Exception: If analysis fails
+        """
+        start_time = time.monotonic()
+        filename = filename or Path(object_key).name
+
+        logger.info(
+            "resume_ingest_started",
+            operation="ingest_and_analyze",
+            user_id=f"user-{user_id}",
+            filename=scrub_all_pii(filename),
+        )
+
+        try:
+            storage = StorageService()
+            # boto3 calls block, so the GET and each chunk read run in a worker thread
+            body, content_type = await asyncio.to_thread(storage.open_object, user_id, object_key)
+            try:
+                with body:
+                    file_ext = self.validate_file_type(filename, content_type)
+                    partial_path, file_size, file_hash = await self._save_stream(
+                        file_ext, partial(asyncio.to_thread, body.read)
+                    )
+            finally:
+                # Copied to local disk (or rejected): the stored object is not needed again
+                await asyncio.to_thread(storage.delete_object, object_key)
+
+            return await self._analyze_partial_file(
+                filename=filename,
+                content_type=content_type or "application/octet-stream",
+                partial_path=partial_path,
                 file_size=file_size,
-                mime_type=file.content_type,
                 file_hash=file_hash,
-                status="processing",
+                user_id=user_id,
+                start_time=start_time,
             )
-            self.db.add(resume)
-            self.db.commit()
-            self.db.refresh(resume)
 
-            logger.info(
-                "resume_record_created",
-                operation="upload_and_analyze",
+        except Exception as e:
+            duration_ms = int((time.monotonic() - start_time) * 1000)
+            logger.error(
+                "resume_ingest_failed",
+                operation="ingest_and_analyze",
                 user_id=f"user-{user_id}",
-                resume_id=resume.id,
+                duration_ms=duration_ms,
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
             )
+            raise
 
-            # Step 6: Extract text from file (T024)
-            try:
-                extracted_text = self._extract_text(file_path, file.content_type)
-                resume.extracted_text = extracted_text
-                self.db.commit()
-
-                logger.info(
-                    "text_extraction_completed",
-                    operation="upload_and_analyze",
-                    resume_id=resume.id,
-                    text_length=len(extracted_text),
-                )
-            except Exception as e:
-                resume.status = "failed"
-                resume.error_message = f"Text extraction failed: {str(e)}"
-                self.db.commit()
-                raise
+    async def _analyze_partial_file(
+        self,
+        filename: str,
+        content_type: str,
+        partial_path: Path,
+        file_size: int,
+        file_hash: str,
+        user_id: int,
+        start_time: float,
+    ) -> Resume:
+        """
+        Cache check → keep file → extract → analyze pipeline shared by both upload paths.
 
-            # Step 7: Analyze with Gemini (T025)
-            try:
-                analysis_result = self.gemini_client.analyze_resume_text(
-                    extracted_text,
-                    user_id=user_id,
-                )
+        T026: Check cache before calling Gemini
 
-                resume.analysis_result = analysis_result
-                resume.status = "analyzed"
-                resume.analyzed_at = datetime.utcnow()
-                self.db.commit()
+        Args:
+            filename: Original filename
+            content_type: MIME type
+            partial_path: .partial file written by _save_stream
+            file_size: File size in bytes
+            file_hash: SHA-256 hex digest of the content
+            user_id: User ID
+            start_time: Workflow start, from time.monotonic() (for duration logging)
 
-                logger.info(
-                    "resume_analysis_success",
-                    operation="upload_and_analyze",
-                    resume_id=resume.id,
-                    user_id=f"user-{user_id}",
-                )
+        Returns:
+            Resume object with analysis results
+        """
+        logger.info(
+            "file_read_completed",
+            operation="upload_and_analyze",
+            user_id=f"user-{user_id}",
+            file_size=file_size,
+            file_hash=file_hash[:16],  # First 16 chars
+        )
 
-            except Exception as e:
-                resume.status = "failed"
-                resume.error_message = f"Analysis failed: {str(e)}"
-                self.db.commit()
-                raise
+        # Step 3: Check cache (T026) - Avoid duplicate Gemini calls
+        cached_resume = self._get_cached_upload(user_id, file_hash)
+        if cached_resume:
+            partial_path.unlink(missing_ok=True)
+            return cached_resume
+
+        # Step 4: Keep the file only on a cache miss ("{uuid}{ext}.partial" -> "{uuid}{ext}")
+        file_path = partial_path.rename(partial_path.with_suffix(""))
+
+        return await self._analyze_saved_file(
+            filename=filename,
+            content_type=content_type,
+            file_path=file_path,
+            file_size=file_size,
+            file_hash=file_hash,
+            user_id=user_id,
+            start_time=start_time,
+        )
 
-            duration_ms = int((time.time() - start_time) * 1000)
+    def _get_cached_upload(self, user_id: int, file_hash: str) -> Optional[Resume]:
+        """Analyzed resume with the same content hash (T026), logged as an upload cache hit."""
+        cached_resume = self._get_cached_resume(user_id, file_hash)
+        if cached_resume:
             logger.info(
-                "resume_upload_completed",
+                "resume_analysis_cache_hit",
                 operation="upload_and_analyze",
-                resume_id=resume.id,
                 user_id=f"user-{user_id}",
-                duration_ms=duration_ms,
-                status=resume.status,
+                cached_resume_id=cached_resume.id,
             )
+        return cached_resume
 
-            return resume
+    async def _analyze_saved_file(
+        self,
+        filename: str,
+        content_type: str,
+        file_path: Path,
+        file_size: int,
+        file_hash: str,
+        user_id: int,
+        start_time: float,
+    ) -> Resume:
+        """
+        Record → extract → analyze pipeline for a file already saved to disk.
 
-        except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            logger.error(
-                "resume_upload_failed",
+        T025: Text extraction and analysis
+
+        Args:
+            filename: Original filename
+            content_type: MIME type
+            file_path: Saved file (UUID filename)
+            file_size: File size in bytes
+            file_hash: SHA-256 hex digest of the content
+            user_id: User ID
+            start_time: Workflow start, from time.monotonic() (for duration logging)
+
+        Returns:
+            Resume object with analysis results
+        """
+        # Step 5: Build the database record. It is inserted and committed once,
+        # after analysis (or once as "failed"), so no connection or
+        # transaction is held open across extraction or the Gemini call.
+        resume = Resume(
+            user_id=user_id,
+            original_filename=filename,
+            file_path=str(file_path),
+            file_size=file_size,
+            mime_type=content_type,
+            file_hash=file_hash,
+            status="processing",
+        )
+
+        # Step 6: Extract text from file (T024). Parsing is CPU-bound, so it
+        # runs in a worker process instead of blocking the event loop.
+        try:
+            extracted_text = await asyncio.get_running_loop().run_in_executor(
+                get_extract_pool(), _extract_text_worker, str(file_path), content_type
+            )
+            resume.extracted_text = extracted_text
+
+            logger.info(
+                "text_extraction_completed",
                 operation="upload_and_analyze",
                 user_id=f"user-{user_id}",
-                duration_ms=duration_ms,
-                error=str(e),
-                error_type=type(e).__name__,
-                exc_info=True,
+                text_length=len(extracted_text),
+            )
+        except Exception as e:
+            self._save_failed_resume(resume, f"Text extraction failed: {str(e)}")
+            raise
+
+        # Step 7: Analyze with Gemini (T025)
+        try:
+            # Non-blocking; concurrency is bounded by GEMINI_SEMAPHORE in the client
+            analysis_result = await self.gemini_client.analyze_resume_text(
+                extracted_text,
+                user_id=user_id,
             )
+        except Exception as e:
+            self._save_failed_resume(resume, f"Analysis failed: {str(e)}")
             raise
 
-    def _validate_file(self, file: UploadFile) -> None:
+        resume.analysis_result = analysis_result
+        resume.status = "analyzed"
+        resume.analyzed_at = datetime.now(timezone.utc)
+        self.db.add(resume)
+        self.db.commit()
+
+        logger.info(
+            "resume_analysis_success",
+            operation="upload_and_analyze",
+            resume_id=resume.id,
+            user_id=f"user-{user_id}",
+        )
+
+        duration_ms = int((time.monotonic() - start_time) * 1000)
+        logger.info(
+            "resume_upload_completed",
+            operation="upload_and_analyze",
+            resume_id=resume.id,
+            user_id=f"user-{user_id}",
+            duration_ms=duration_ms,
+            status=resume.status,
+        )
+
+        return resume
+
+    def _save_failed_resume(self, resume: Resume, error_message: str) -> None:
+        """Record a failed upload (one insert and commit) so the failure is visible."""
+        resume.status = "failed"
+        resume.error_message = error_message
+        self.db.add(resume)
+        self.db.commit()
+
+    def _validate_file(self, file: UploadFile) -> str:
         """
         Validate uploaded file.
 
@@ -225,79 +437,120 @@ class ResumeService:
         Args:
             file: Uploaded file
 
+        Returns:
+            Lowercased file extension ("" if the filename has none)
+
         Raises:
             ValueError: If file is invalid
         """
+        file_ext = self.validate_file_type(file.filename, file.content_type)
+
+        # Size of the spooled part, when the parser knows it; _save_stream
+        # still enforces the limit while reading
+        if file.size is not None and file.size > settings.max_upload_size_bytes:
+            raise ValueError(
+                f"File too large. Maximum allowed: {settings.max_upload_size_mb}MB"
+            )
+
+        return file_ext
+
+    @staticmethod
+    def validate_file_type(filename: Optional[str], content_type: Optional[str]) -> str:
+        """
+        Validate file type by MIME type or extension.
+
+        Shared by multipart uploads and presigned (direct-to-storage) uploads.
+
+        Args:
+            filename: Original filename
+            content_type: MIME type
+
+        Returns:
+            Lowercased file extension ("" if the filename has none)
+
+        Raises:
+            ValueError: If file type is not allowed
+        """
         # Get file extension
-        file_ext = Path(file.filename).suffix.lower() if file.filename else ""
+        file_ext = Path(filename).suffix.lower() if filename else ""
 
         # Check file type (MIME type OR extension)
-        is_valid_mime = file.content_type in self.ALLOWED_MIME_TYPES
-        is_valid_ext = file_ext in self.ALLOWED_EXTENSIONS
+        is_valid_mime = content_type in ALLOWED_MIME_TYPES
+        is_valid_ext = file_ext in ALLOWED_EXTENSIONS
 
         if not (is_valid_mime or is_valid_ext):
             raise ValueError(
-                f"Invalid file type: {file.content_type} ({file_ext}). "
+                f"Invalid file type: {content_type} ({file_ext}). "
                 f"Allowed types: PDF, DOCX"
             )
 
-        # File size will be checked after reading
-        # (UploadFile doesn't provide size before reading)
-
         logger.debug(
             "file_validation_passed",
             operation="validate_file",
-            content_type=file.content_type,
+            content_type=content_type,
             file_extension=file_ext,
         )
 
-    def _save_file(self, original_filename: str, content: bytes) -> Path:
+        return file_ext
+
+    async def _save_stream(
+        self,
+        file_ext: str,
+        read: Callable[[int], Awaitable[bytes]],
+    ) -> Tuple[Path, int, str]:
         """
-        Save file to disk with UUID filename.
+        Stream a file to a UUID-named .partial file, hashing as it goes.
 
         Constitution III: Secure storage - UUID filenames prevent information leakage
 
+        The file is read UPLOAD_CHUNK_SIZE bytes at a time, so memory use does
+        not grow with the file, and an oversized file is rejected as soon as
+        it crosses the limit. The caller renames the file to drop the .partial
+        suffix once it knows the upload is not a cache hit.
+
         Args:
-            original_filename: Original filename
-            content: File content
+            file_ext: Extension to keep on the saved file (from validate_file_type)
+            read: Async read(size) returning b"" at end of file
 
         Returns:
-            Path to saved file
+            Tuple of (.partial path, file size in bytes, SHA-256 hex digest)
 
         Raises:
             ValueError: If file is too large
         """
-        # Check file size (Constitution requirement: <5MB)
-        file_size_mb = len(content) / (1024 * 1024)
-        if file_size_mb > settings.max_upload_size_mb:
-            raise ValueError(
-                f"File too large: {file_size_mb:.2f}MB. "
-                f"Maximum allowed: {settings.max_upload_size_mb}MB"
-            )
-
-        # Generate UUID filename with original extension
-        file_ext = Path(original_filename).suffix
-        uuid_filename = f"{uuid.uuid4()}{file_ext}"
-        file_path = self.upload_dir / uuid_filename
+        file_path = self.upload_dir / f"{uuid.uuid4()}{file_ext}.partial"
+        digest = hashlib.sha256()
+        file_size = 0
 
-        # Save file
-        with open(file_path, "wb") as f:
-            f.write(content)
+        try:
+            with open(file_path, "wb") as f:
+                while chunk := await read(UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    if file_size > settings.max_upload_size_bytes:
+                        raise ValueError(
+                            f"File too large. Maximum allowed: {settings.max_upload_size_mb}MB"
+                        )
+                    digest.update(chunk)
+                    f.write(chunk)
+        except BaseException:
+            file_path.unlink(missing_ok=True)
+            raise
 
         logger.info(
             "file_saved",
-            operation="save_file",
+            operation="save_stream",
             file_path=str(file_path),
-            file_size_mb=file_size_mb,
+            file_size_mb=file_size / (1024 * 1024),
         )
 
-        return file_path
+        return file_path, file_size, digest.hexdigest()
 
-    def _extract_text(self, file_path: Path, mime_type: str) -> str:
+    @staticmethod
+    def _extract_text(file_path: Path, mime_type: str) -> str:
         """
         Extract text from PDF or DOCX file.
 
-        T024: Text extraction using PyPDF2 and python-docx
+        T024: Text extraction using PyMuPDF (PyPDF2 fallback) and python-docx
 
         Args:
             file_path: Path to file
@@ -314,9 +567,9 @@ class ResumeService:
             file_ext = file_path.suffix.lower()
 
             if mime_type == "application/pdf" or file_ext == ".pdf":
-                return self._extract_text_from_pdf(file_path)
-            elif mime_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document" or file_ext in [".docx", ".doc"]:
-                return self._extract_text_from_docx(file_path)
+                return ResumeService._extract_text_from_pdf(file_path)
+            elif mime_type == DOCX_MIME_TYPE or file_ext in WORD_EXTENSIONS:
+                return ResumeService._extract_text_from_docx(file_path)
             else:
                 raise ValueError(f"Unsupported file type: {mime_type} ({file_ext})")
         except Exception as e:
@@ -330,9 +583,14 @@ class ResumeService:
             )
             raise ValueError(f"Failed to extract text: {str(e)}")
 
-    def _extract_text_from_pdf(self, file_path: Path) -> str:
+    @staticmethod
+    def _extract_text_from_pdf(file_path: Path) -> str:
         """
-        Extract text from PDF file using PyPDF2.
+        Extract text from PDF file.
+
+        Uses PyMuPDF, whose native parser is several times faster than
+        PyPDF2 on content streams. PyPDF2 is the fallback when PyMuPDF is not
+        installed or rejects the document.
 
         Args:
             file_path: Path to PDF file
@@ -340,36 +598,46 @@ class ResumeService:
         Returns:
             Extracted text
         """
-        with open(file_path, "rb") as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-            text_parts = []
-
-            for page_num, page in enumerate(pdf_reader.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-
-                logger.debug(
-                    "pdf_page_extracted",
-                    operation="extract_pdf",
-                    page_num=page_num + 1,
-                    text_length=len(page_text) if page_text else 0,
-                )
-
-            full_text = "\n".join(text_parts)
-
-            logger.info(
-                "pdf_extraction_completed",
+        parser = "pymupdf"
+        try:
+            if fitz is None:
+                raise RuntimeError("PyMuPDF is not installed")
+            with fitz.open(file_path) as doc:
+                text_parts = [text for text in (page.get_text("text") for page in doc) if text]
+                total_pages = doc.page_count
+        except RuntimeError as e:
+            # fitz.FileDataError and friends subclass RuntimeError
+            logger.debug(
+                "pdf_pymupdf_fallback",
                 operation="extract_pdf",
-                total_pages=len(pdf_reader.pages),
-                total_text_length=len(full_text),
+                error=str(e),
             )
+            parser = "pypdf2"
+            with open(file_path, "rb") as f:
+                pdf_reader = PyPDF2.PdfReader(f)
+                text_parts = [text for text in (page.extract_text() for page in pdf_reader.pages) if text]
+                total_pages = len(pdf_reader.pages)
+
+        full_text = "\n".join(text_parts)
 
-            return full_text
+        logger.info(
+            "pdf_extraction_completed",
+            operation="extract_pdf",
+            parser=parser,
+            total_pages=total_pages,
+            total_text_length=len(full_text),
+        )
 
-    def _extract_text_from_docx(self, file_path: Path) -> str:
+        return full_text
+
+    @staticmethod
+    def _extract_text_from_docx(file_path: Path) -> str:
         """
-        Extract text from DOCX file using python-docx.
+        Extract text from DOCX file.
+
+        Streams word/document.xml with lxml iterparse instead of building the
+        python-docx object model, clearing each paragraph once read. python-docx
+        is the fallback when the file is not a well-formed DOCX package.
 
         Args:
             file_path: Path to DOCX file
@@ -377,31 +645,75 @@ class ResumeService:
         Returns:
             Extracted text
         """
-        doc = docx.Document(file_path)
-        text_parts = []
-
-        for para_num, para in enumerate(doc.paragraphs):
-            if para.text:
-                text_parts.append(para.text)
-
+        parser = "iterparse"
+        try:
+            paragraphs = ResumeService._read_docx_paragraphs(file_path)
+        except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError) as e:
             logger.debug(
-                "docx_paragraph_extracted",
+                "docx_iterparse_fallback",
                 operation="extract_docx",
-                para_num=para_num + 1,
-                text_length=len(para.text) if para.text else 0,
+                error=str(e),
             )
+            parser = "python-docx"
+            paragraphs = [para.text for para in docx.Document(file_path).paragraphs]
 
-        full_text = "\n".join(text_parts)
+        full_text = "\n".join(text for text in paragraphs if text)
 
         logger.info(
             "docx_extraction_completed",
             operation="extract_docx",
-            total_paragraphs=len(doc.paragraphs),
+            parser=parser,
+            total_paragraphs=len(paragraphs),
             total_text_length=len(full_text),
         )
 
         return full_text
 
+    @staticmethod
+    def _read_docx_paragraphs(file_path: Path) -> List[str]:
+        """
+        Text of each body-level paragraph, as python-docx Document.paragraphs.
+
+        Raises:
+            zipfile.BadZipFile: If the file is not a ZIP package
+            KeyError: If the package has no word/document.xml
+            etree.XMLSyntaxError: If the document XML is malformed
+        """
+        paragraphs = []
+        with zipfile.ZipFile(file_path) as package, package.open("word/document.xml") as xml:
+            for _, p in etree.iterparse(xml, tag=W_P, resolve_entities=False):
+                if p.getparent().tag == W_BODY:
+                    paragraphs.append(ResumeService._docx_paragraph_text(p))
+                    # Drop already-read siblings (paragraphs, tables) from the tree
+                    body = p.getparent()
+                    while p.getprevious() is not None:
+                        del body[0]
+                p.clear()
+        return paragraphs
+
+    @staticmethod
+    def _docx_paragraph_text(p: etree._Element) -> str:
+        """Text of a w:p element: its runs, including runs inside hyperlinks."""
+        parts = []
+        for child in p:
+            if child.tag == W_R:
+                runs = (child,)
+            elif child.tag == W_HYPERLINK:
+                runs = child.iterchildren(W_R)
+            else:
+                continue
+            for run in runs:
+                for el in run:
+                    if el.tag == W_T:
+                        parts.append(el.text or "")
+                    elif el.tag == W_BR:
+                        # Page and column breaks have no text equivalent
+                        if el.get(W_NS + "type", "textWrapping") == "textWrapping":
+                            parts.append("\n")
+                    else:
+                        parts.append(W_RUN_TEXT.get(el.tag, ""))
+        return "".join(parts)
+
     def _get_cached_resume(self, user_id: int, file_hash: str) -> Optional[Resume]:
         """
         Check if resume with same hash already exists for user.
@@ -416,8 +728,11 @@ class ResumeService:
         Returns:
             Cached resume if found (with valid ats_score), None otherwise
         """
+        # ix_resumes_user_hash_status; the extracted text (the largest column)
+        # is not needed to answer from cache, so it is not loaded
         cached = (
             self.db.query(Resume)
+            .options(defer(Resume.extracted_text))
             .filter(
                 Resume.user_id == user_id,
                 Resume.file_hash == file_hash,
@@ -0,0 +1,171 @@
+"""
+Object storage service for presigned resume uploads.
+
+Constitution Compliance:
+- Principle III: User Data Privacy - UUID object keys, per-user key prefixes
+- Principle V: Code Quality - Structured logging throughout
+
+Large resumes can be uploaded straight to S3-compatible storage (S3, GCS
+interoperability, MinIO) with a presigned PUT URL, so the bytes never pass
+through the multipart form parser. The API then ingests the object by key.
+"""
+
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+from botocore.response import StreamingBody
+
+from src.config import settings
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# get_object error codes for a key that is not there (S3 answers 403 instead of
+# 404 when the credentials cannot list the bucket)
+MISSING_OBJECT_ERROR_CODES = frozenset({"NoSuchKey", "404", "AccessDenied", "403"})
+
+
+@lru_cache(maxsize=1)
+def _get_s3_client():
+    """Create the S3 client once per process (credentials from the environment)."""
+    return boto3.client("s3", endpoint_url=settings.s3_endpoint_url)
+
+
+class StorageService:
+    """
+    Service for presigned uploads to object storage.
+
+    Object keys are namespaced per user (resumes/{user_id}/{uuid}{ext}) so a
+    user can only ingest objects that were presigned for them.
+    """
+
+    KEY_PREFIX = "resumes"
+
+    def __init__(self):
+        """
+        Initialize storage service.
+
+        Raises:
+            ValueError: If no upload bucket is configured
+        """
+        if not settings.resume_upload_bucket:
+            raise ValueError("Direct uploads are not configured (RESUME_UPLOAD_BUCKET is unset)")
+
+        self.bucket = settings.resume_upload_bucket
+        self.client = _get_s3_client()
+
+    def _user_prefix(self, user_id: int) -> str:
+        """Key prefix owned by a user."""
+        return f"{self.KEY_PREFIX}/{user_id}/"
+
+    def create_upload_url(self, user_id: int, filename: str, content_type: str) -> Dict[str, Any]:
+        """
+        Create a presigned PUT URL for a direct resume upload.
+
+        Constitution III: UUID object key, original filename is never part of the key
+
+        Args:
+            user_id: User ID
+            filename: Original filename (only the extension is used)
+            content_type: MIME type the client will send with the PUT
+
+        Returns:
+            Dictionary with upload_url, object_key, method and expires_in
+        """
+        object_key = f"{self._user_prefix(user_id)}{uuid.uuid4()}{Path(filename).suffix.lower()}"
+        expires_in = settings.presigned_url_ttl_seconds
+
+        upload_url = self.client.generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": object_key,
+                "ContentType": content_type,
+            },
+            ExpiresIn=expires_in,
+        )
+
+        logger.info(
+            "presigned_upload_url_created",
+            operation="create_upload_url",
+            user_id=f"user-{user_id}",
+            expires_in=expires_in,
+        )
+
+        return {
+            "upload_url": upload_url,
+            "object_key": object_key,
+            "method": "PUT",
+            "content_type": content_type,
+            "expires_in": expires_in,
+        }
+
+    def open_object(self, user_id: int, object_key: str) -> Tuple[StreamingBody, Optional[str]]:
+        """
+        Open an uploaded resume in object storage for streaming.
+
+        One GET: the size limit is checked against the response's
+        Content-Length before any of the body is read. boto3 calls block, so
+        async callers run this in a worker thread.
+
+        Args:
+            user_id: User ID (must own the key prefix)
+            object_key: Key returned by create_upload_url
+
+        Returns:
+            Tuple of (unread body stream, content type reported by storage)
+
+        Raises:
+            ValueError: If the key does not belong to the user or the object is too large
+            FileNotFoundError: If no object exists under the key (never uploaded or already ingested)
+        """
+        if not object_key.startswith(self._user_prefix(user_id)):
+            raise ValueError("Object key does not belong to the current user")
+
+        try:
+            obj = self.client.get_object(Bucket=self.bucket, Key=object_key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in MISSING_OBJECT_ERROR_CODES:
+                raise FileNotFoundError("Uploaded file not found; request a new upload URL") from e
+            raise
+
+        if obj["ContentLength"] > settings.max_upload_size_bytes:
+            obj["Body"].close()
+            self.delete_object(object_key)
+            raise ValueError(
+                f"File too large: {obj['ContentLength'] / (1024 * 1024):.2f}MB. "
+                f"Maximum allowed: {settings.max_upload_size_mb}MB"
+            )
+
+        logger.info(
+            "object_opened",
+            operation="open_object",
+            user_id=f"user-{user_id}",
+            file_size=obj["ContentLength"],
+        )
+
+        return obj["Body"], obj.get("ContentType")
+
+    def delete_object(self, object_key: str) -> None:
+        """
+        Delete an ingested or rejected upload (best effort).
+
+        Failures are logged, not raised: the resume is already copied (or
+        rejected), and a leftover object only costs storage.
+
+        Args:
+            object_key: Key of an object already opened with open_object
+        """
+        try:
+            self.client.delete_object(Bucket=self.bucket, Key=object_key)
+        except (BotoCoreError, ClientError) as e:
+            logger.warning(
+                "object_delete_failed",
+                operation="delete_object",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
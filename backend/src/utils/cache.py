@@ -0,0 +1,105 @@
+"""
+Redis response cache for PathPilot.
+
+Constitution Compliance:
+- Principle II: API Resilience - Cache errors are logged and treated as misses,
+  never surfaced to the request
+- Principle III: User Data Privacy - Keys are content hashes, never raw input
+- Principle V: Code Quality - Structured logging for cache failures
+
+Used to skip repeat Gemini calls for identical inputs.
+"""
+
+import hashlib
+from functools import lru_cache
+from typing import Any, List, Optional
+
+import orjson
+import redis.asyncio as redis
+
+from src.config import settings
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# A slow or absent Redis must not add noticeable latency to the request
+REDIS_SOCKET_TIMEOUT_SECONDS = 0.5
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    """Process-wide Redis client (connections are pooled and opened lazily)."""
+    return redis.from_url(
+        settings.redis_url,
+        decode_responses=True,
+        socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+    )
+
+
+def make_cache_key(namespace: str, payload: Any) -> str:
+    """
+    Build a cache key from a JSON-serializable payload.
+
+    Args:
+        namespace: Key namespace, e.g. "cover_letter"
+        payload: Inputs that fully determine the cached value
+
+    Returns:
+        Key of the form pathpilot:{namespace}:{128-bit blake2b hex digest}
+    """
+    digest = hashlib.blake2b(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS),
+        digest_size=16,
+    ).hexdigest()
+    return f"pathpilot:{namespace}:{digest}"
+
+
+async def cache_get(key: str) -> Optional[str]:
+    """Return the cached value, or None on a miss or Redis error."""
+    try:
+        return await get_redis().get(key)
+    except redis.RedisError as e:
+        logger.warning(
+            "cache_get_failed",
+            operation="cache_get",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return None
+
+
+async def cache_get_many(keys: List[str]) -> List[Optional[str]]:
+    """Return cached values for several keys in one round trip (None per miss or on error)."""
+    if not keys:
+        return []
+    try:
+        return await get_redis().mget(keys)
+    except redis.RedisError as e:
+        logger.warning(
+            "cache_get_failed",
+            operation="cache_get_many",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return [None] * len(keys)
+
+
+async def cache_set(key: str, value: str, ttl_seconds: int) -> None:
+    """Store a value with a TTL; errors are logged and ignored."""
+    try:
+        await get_redis().set(key, value, ex=ttl_seconds)
+    except redis.RedisError as e:
+        logger.warning(
+            "cache_set_failed",
+            operation="cache_set",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+
+
+async def close_redis() -> None:
+    """Close the Redis client if one was created (application shutdown)."""
+    if get_redis.cache_info().currsize:
+        await get_redis().aclose()
+        get_redis.cache_clear()
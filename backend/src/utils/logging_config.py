@@ -7,8 +7,11 @@ Constitution Compliance:
 """
 
 import logging
+import re
 import sys
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+import orjson
 import structlog
 from structlog.types import EventDict, Processor
 
@@ -20,24 +23,37 @@ def add_app_context(logger: logging.Logger, method_name: str, event_dict: EventD
     return event_dict
 
 
+def orjson_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    JSONRenderer serializer: orjson, ~5x faster than json.dumps per event.
+
+    Decoded to str because events go through stdlib logging handlers
+    (filter_by_level and add_logger_name need the stdlib logger factory, so
+    structlog's BytesLoggerFactory is not an option).
+    """
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Constitution III: keys containing any of these (case-insensitive) are redacted.
+# google_api_key, elevenlabs_api_key, ... are covered by "api_key".
+SENSITIVE_KEY_PATTERN = re.compile(r"password|api_key|token|secret|authorization", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _is_sensitive_key(key: str) -> bool:
+    """Log keys come from a small fixed vocabulary, so each is checked once."""
+    return SENSITIVE_KEY_PATTERN.search(key) is not None
+
+
 def censor_sensitive_keys(logger: logging.Logger, method_name: str, event_dict: EventDict) -> EventDict:
     """
     Censor sensitive data in logs.
 
     Constitution III: User Data Privacy - Never log API keys, passwords, or tokens.
     """
-    sensitive_keys = {
-        "password",
-        "api_key",
-        "token",
-        "secret",
-        "authorization",
-        "google_api_key",
-        "elevenlabs_api_key",
-    }
-
-    for key in list(event_dict.keys()):
-        if any(sensitive in key.lower() for sensitive in sensitive_keys):
+    # Only values are replaced, so the dict can be iterated directly
+    for key in event_dict:
+        if _is_sensitive_key(key):
             event_dict[key] = "***REDACTED***"
 
     return event_dict
@@ -60,22 +76,26 @@ def configure_logging(log_level: str = "INFO", json_output: bool = True) -> None
     - timestamp: ISO 8601 timestamp
     """
 
-    # Shared processors for all configurations
+    # Shared processors for all configurations. filter_by_level goes first so
+    # events below the stdlib level (e.g. debug in production) are dropped
+    # before any other processor builds on the event dict. No call site passes
+    # stack_info, so StackInfoRenderer is left out; tracebacks come from
+    # exc_info via the exception renderers below.
     shared_processors: list[Processor] = [
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso", utc=True),
         add_app_context,
         censor_sensitive_keys,
-        structlog.processors.StackInfoRenderer(),
     ]
 
     if json_output:
         # JSON output for production
         processors = shared_processors + [
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=orjson_dumps),
         ]
     else:
         # Console output for development
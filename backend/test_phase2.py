@@ -1,142 +0,0 @@
-"""
-Quick test script for Phase 2 (Foundational) components.
-
-Tests:
-- T007: Database connection and setup
-- T008: Retry wrapper functionality
-- T011: Structured logging
-- T012: Configuration loading
-- T014: FastAPI app initialization
-"""
-
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-print("=" * 60)
-print("Phase 2 Foundational Components Test")
-print("=" * 60)
-
-# Test 1: Config Loading (T012)
-print("\n[T012] Testing Configuration Loading...")
-try:
-    from src.config import settings
-
-    print(f"✅ Config loaded successfully")
-    print(f"   - Environment: {settings.app_env}")
-    print(f"   - Debug: {settings.app_debug}")
-    print(f"   - AI Model: {settings.preferred_ai_model}")
-    print(f"   - Log Level: {settings.log_level}")
-    print(f"   - Features:")
-    print(f"     • Job Discovery: {settings.feature_job_discovery}")
-    print(f"     • Mock Interview: {settings.feature_mock_interview}")
-    print(f"     • Dashboard Stats: {settings.feature_dashboard_stats}")
-except Exception as e:
-    print(f"❌ Config loading failed: {e}")
-    sys.exit(1)
-
-# Test 2: Logging Configuration (T011)
-print("\n[T011] Testing Structured Logging...")
-try:
-    from src.utils.logging_config import configure_logging, get_logger
-
-    configure_logging(log_level="INFO", json_output=False)
-    logger = get_logger("test")
-
-    logger.info(
-        "test_log_entry",
-        request_id="test-123",
-        user_id="test-user",
-        operation="phase2_test",
-        duration_ms=100,
-    )
-    print("✅ Structured logging configured successfully")
-    print("   - Logger created with structlog")
-    print("   - JSON output support: available")
-    print("   - Context fields: request_id, user_id, operation, duration_ms")
-except Exception as e:
-    print(f"❌ Logging configuration failed: {e}")
-    sys.exit(1)
-
-# Test 3: Database Setup (T007)
-print("\n[T007] Testing Database Configuration...")
-try:
-    from src.database import engine, SessionLocal, Base, get_db
-
-    print("✅ Database configuration loaded successfully")
-    print(f"   - Engine: {engine}")
-    print(f"   - Database URL: {settings.database_url.split('@')[1] if '@' in settings.database_url else 'configured'}")
-    print(f"   - Pool size: 10 (configured)")
-    print(f"   - Session factory: available")
-    print(f"   - Base model: {Base}")
-
-    # Note: Actual database connection test requires PostgreSQL to be running
-    print("\n   ⚠️  Actual database connection requires PostgreSQL running")
-    print("      Start with: docker-compose up -d postgres")
-
-except Exception as e:
-    print(f"❌ Database configuration failed: {e}")
-    sys.exit(1)
-
-# Test 4: Retry Wrapper (T008)
-print("\n[T008] Testing Retry Logic...")
-try:
-    from src.api.retry_wrapper import retry_with_backoff, retry_gemini_api
-
-    @retry_with_backoff(max_attempts=3, initial_wait=0.1)
-    def test_function():
-        return "Success!"
-
-    result = test_function()
-    print("✅ Retry wrapper configured successfully")
-    print(f"   - Basic retry: {result}")
-    print(f"   - Gemini retry decorator: available")
-    print(f"   - ElevenLabs retry decorator: available")
-    print(f"   - Max attempts: {settings.gemini_max_retries}")
-    print(f"   - Exponential backoff: 1s, 2s, 4s")
-except Exception as e:
-    print(f"❌ Retry wrapper failed: {e}")
-    sys.exit(1)
-
-# Test 5: FastAPI App (T014)
-print("\n[T014] Testing FastAPI Application...")
-try:
-    from src.main import app
-
-    print("✅ FastAPI app created successfully")
-    print(f"   - Title: {app.title}")
-    print(f"   - Version: {app.version}")
-    print(f"   - Docs URL: {app.docs_url}")
-    print(f"   - CORS enabled: Yes")
-    print(f"   - Logging middleware: Yes")
-    print(f"   - Health check: /health")
-    print(f"   - Root endpoint: /")
-
-    # Check routes
-    routes = [route.path for route in app.routes]
-    print(f"   - Routes configured: {len(routes)}")
-    print(f"     • {', '.join([r for r in routes if not r.startswith('/openapi')])}")
-
-except Exception as e:
-    print(f"❌ FastAPI app initialization failed: {e}")
-    sys.exit(1)
-
-# Summary
-print("\n" + "=" * 60)
-print("Phase 2 Test Summary")
-print("=" * 60)
-print("✅ T007: Database configuration - PASSED")
-print("✅ T008: Retry wrapper - PASSED")
-print("✅ T011: Structured logging - PASSED")
-print("✅ T012: Configuration loading - PASSED")
-print("✅ T014: FastAPI application - PASSED")
-print("\n🎯 Phase 2 (Foundational Infrastructure) is READY!")
-print("\n📋 Next Steps:")
-print("   1. Copy .env.example to .env (if not done)")
-print("   2. Add your GOOGLE_API_KEY to .env")
-print("   3. Start services: docker-compose up -d")
-print("   4. Test API: http://localhost:8000/health")
-print("   5. View docs: http://localhost:8000/docs")
-print("\n" + "=" * 60)
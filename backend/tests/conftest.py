@@ -5,59 +5,218 @@ Constitution Compliance:
 - Principle V: Code Quality - Comprehensive test infrastructure
 """
 
+import asyncio
+import copy
+import json
 import os
-import sys
 import pytest
-from typing import Generator
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+import pytest_asyncio
+from tempfile import SpooledTemporaryFile
+from types import SimpleNamespace
+from typing import AsyncGenerator, AsyncIterator, Callable, Generator
+from unittest.mock import AsyncMock, Mock, patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from fastapi import UploadFile
 from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
 
-# Add src to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from src.database import Base, get_db
+from src.database import Base, get_async_db, get_async_session_factory, get_db, get_session_factory
 from src.main import app
+from src.models.user import User
+
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register --run-integration (integration tests are skipped by default)."""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked integration (full upload workflows)",
+    )
 
-# Test database URL (in-memory SQLite for fast tests)
-TEST_DATABASE_URL = "sqlite:///:memory:"
 
+def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
+    """Skip integration-marked tests unless --run-integration is given."""
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="integration test: pass --run-integration to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
 
-@pytest.fixture(scope="function")
-def test_db() -> Generator[Session, None, None]:
+
+# Same spool threshold Starlette uses for multipart file parts
+UPLOAD_SPOOL_MAX_SIZE = 1024 * 1024
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw) -> str:
+    """Create JSONB columns as SQLite JSON (the JSON1 functions read both)."""
+    return "JSON"
+
+
+# Test database URL (in-memory SQLite for fast tests). A named shared-cache
+# database, unlike :memory:, is the same database for every connection that
+# opens it, so tests are not limited to the one connection StaticPool holds.
+# Under pytest-xdist (pytest -n auto) each worker gets its own database name.
+TEST_DATABASE_URL = (
+    f"sqlite:///file:pathpilot_test_{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}"
+    "?mode=memory&cache=shared&uri=true"
+)
+
+# Same database through aiosqlite, for the async (cover letter) services
+TEST_ASYNC_DATABASE_URL = TEST_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+
+
+def _use_explicit_begin(engine: Engine) -> None:
     """
-    Create test database session.
+    Let SQLAlchemy emit BEGIN itself on an SQLite engine.
 
-    Uses in-memory SQLite for fast, isolated tests.
-    Each test gets a fresh database.
+    The sqlite3 driver defers BEGIN to the first DML statement, which breaks
+    the SAVEPOINTs the per-test sessions rely on.
+    """
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+def test_engine() -> Generator[Engine, None, None]:
+    """
+    Create the test engine and schema once per test session.
+
+    StaticPool hands every checkout the same DBAPI connection, so the
+    in-memory database (and its tables) lives for the whole session.
     """
-    # Create test engine
     engine = create_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},  # Needed for SQLite
+        poolclass=StaticPool,
     )
 
+    _use_explicit_begin(engine)
+
     # Create tables
     Base.metadata.create_all(bind=engine)
 
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def test_db(test_engine: Engine) -> Generator[Session, None, None]:
+    """
+    Create test database session.
+
+    Each test runs inside an outer transaction that is rolled back on
+    teardown, so tests stay isolated without recreating the schema. Commits
+    made by the code under test only release a SAVEPOINT inside it.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+
     # Create session
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = TestingSessionLocal()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
 
     try:
         yield session
     finally:
         session.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def test_async_engine(test_engine: Engine) -> Generator[AsyncEngine, None, None]:
+    """
+    Create the async test engine once per test session.
+
+    Opens the same shared-cache database as test_engine (which created the
+    schema and keeps the in-memory database alive).
+    """
+    engine = create_async_engine(
+        TEST_ASYNC_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    _use_explicit_begin(engine.sync_engine)
+
+    try:
+        yield engine
+    finally:
+        asyncio.run(engine.dispose())
+
+
+@pytest_asyncio.fixture
+async def async_test_db(test_async_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create async test database session.
+
+    Same isolation as test_db: an outer transaction rolled back on teardown,
+    with commits from the code under test releasing SAVEPOINTs inside it.
+    """
+    connection = await test_async_engine.connect()
+    transaction = await connection.begin()
+
+    session = AsyncSession(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    try:
+        yield session
+    finally:
+        await session.close()
+        await transaction.rollback()
+        await connection.close()
+
+
+@pytest.fixture(scope="session")
+def app_client() -> Generator[TestClient, None, None]:
+    """
+    Create the FastAPI test client once per test session.
+
+    The app lifespan (startup and shutdown) runs once instead of per test;
+    per-test wiring lives in the client fixture. Startup skips init_db:
+    requests use the test database through the get_db override, and every
+    pytest-xdist worker would otherwise race to create tables in the one
+    database DATABASE_URL points at.
+    """
+    with patch("src.main.init_db"), patch("src.main.check_db_connection", return_value=True):
+        with TestClient(app) as test_client:
+            yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(test_db: Session) -> TestClient:
+def client(
+    app_client: TestClient,
+    test_db: Session,
+    async_test_db: AsyncSession,
+) -> Generator[TestClient, None, None]:
     """
     Create FastAPI test client with test database.
 
-    Overrides get_db dependency to use test database.
+    Overrides the session dependencies (get_db, get_async_db and the session
+    factories SSE handlers open their own sessions with) to use the test
+    database connections, inside each test's rolled-back transaction.
     """
     def override_get_db():
         try:
@@ -65,12 +224,176 @@ def client(test_db: Session) -> TestClient:
         finally:
             pass
 
-    app.dependency_overrides[get_db] = override_get_db
+    async def override_get_async_db():
+        yield async_test_db
+
+    overrides = {
+        get_db: override_get_db,
+        get_async_db: override_get_async_db,
+        get_session_factory: lambda: sessionmaker(
+            bind=test_db.bind,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        ),
+        get_async_session_factory: lambda: async_sessionmaker(
+            bind=async_test_db.bind,
+            autoflush=False,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ),
+    }
+    app.dependency_overrides.update(overrides)
+
+    try:
+        yield app_client
+    finally:
+        for dependency in overrides:
+            app.dependency_overrides.pop(dependency, None)
+
+
+@pytest.fixture(scope="session")
+def test_user(test_engine: Engine) -> User:
+    """
+    Create test user once per session.
+
+    Committed directly on the engine, outside the per-test transaction that
+    test_db rolls back, so every test sees the same row. The INSERT's
+    RETURNING fills in id and created_at, so no refresh SELECT is needed.
+    """
+    with Session(test_engine, expire_on_commit=False) as session:
+        user = User(email="test@example.com")
+        session.add(user)
+        session.commit()
+    return user
+
+
+# Sample Gemini analysis result; also the stub Gemini reply (see gemini_model)
+SAMPLE_ANALYSIS_RESULT = {
+    "strengths": [
+        "Strong technical leadership experience",
+        "Proven track record of performance improvements",
+        "Modern tech stack expertise"
+    ],
+    "weaknesses": [
+        "Limited frontend development details",
+        "No certifications mentioned"
+    ],
+    "recommendations": [
+        "Add specific metrics for leadership impact",
+        "Include relevant certifications or courses",
+        "Expand on frontend projects"
+    ],
+    "suitable_roles": [
+        "Senior Software Engineer",
+        "Tech Lead",
+        "Engineering Manager"
+    ],
+    "skills": [
+        "Python", "JavaScript", "React", "Docker",
+        "Kubernetes", "PostgreSQL", "AWS", "FastAPI", "CI/CD"
+    ],
+    "experience_years": 6
+}
+
+
+@pytest.fixture
+def sample_analysis_result():
+    """
+    Sample Gemini analysis result.
+
+    A fresh copy per test: tests and services store it in JSON columns and may
+    mutate it, so it cannot be a shared or read-only (MappingProxyType) object.
+    """
+    return copy.deepcopy(SAMPLE_ANALYSIS_RESULT)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def gemini_model() -> Generator[Mock, None, None]:
+    """
+    Stub genai.GenerativeModel for the whole test session.
+
+    Patched once instead of per test, and no test can reach the real API.
+    generate_content_async replies with SAMPLE_ANALYSIS_RESULT unless a test
+    sets its own return_value or side_effect; call counts reset per test.
+    """
+    model = Mock()
+    model.generate_content_async = AsyncMock(
+        return_value=SimpleNamespace(text=json.dumps(SAMPLE_ANALYSIS_RESULT))
+    )
+    with patch("src.services.gemini_client.genai.GenerativeModel", return_value=model):
+        yield model
+
+
+@pytest.fixture(autouse=True)
+def reset_gemini_model(gemini_model: Mock) -> Generator[None, None, None]:
+    """Restore the stub Gemini reply and clear its call counts after each test."""
+    reply = gemini_model.generate_content_async.return_value
+    yield
+    gemini_model.reset_mock(return_value=True, side_effect=True)
+    gemini_model.generate_content_async.return_value = reply
+
+
+@pytest.fixture
+def make_gemini_stream() -> Callable[..., AsyncIterator[SimpleNamespace]]:
+    """
+    Build a streamed Gemini reply (generate_content_async(..., stream=True)).
+
+    Set it as gemini_model.generate_content_async.return_value; each text
+    becomes one chunk. With hang=True the stream stalls after the last chunk,
+    like an upstream that stops sending, until the consumer is cancelled.
+    """
+    def _make_gemini_stream(*texts: str, hang: bool = False) -> AsyncIterator[SimpleNamespace]:
+        async def chunks():
+            for text in texts:
+                yield SimpleNamespace(text=text)
+            if hang:
+                await asyncio.Event().wait()
+
+        return chunks()
+
+    return _make_gemini_stream
+
+
+@pytest.fixture(scope="session")
+def parse_sse_events() -> Callable[[str], list]:
+    """Decode a text/event-stream body of "data: <json>" events."""
+    def _parse_sse_events(body: str) -> list:
+        return [
+            json.loads(event.removeprefix("data: "))
+            for event in body.split("\n\n")
+            if event.strip()
+        ]
+
+    return _parse_sse_events
+
+
+@pytest.fixture
+def make_upload_file() -> Generator[Callable[[str, bytes, str], UploadFile], None, None]:
+    """
+    Build UploadFiles the way Starlette's multipart parser does.
+
+    Content goes into an in-memory SpooledTemporaryFile and the content type
+    into the part headers (UploadFile.content_type is read-only). Files are
+    closed on teardown.
+    """
+    files = []
+
+    def _make_upload_file(filename: str, content: bytes, content_type: str) -> UploadFile:
+        spooled = SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_SIZE)
+        spooled.write(content)
+        spooled.seek(0)
+        files.append(spooled)
+        return UploadFile(
+            file=spooled,
+            size=len(content),
+            filename=filename,
+            headers=Headers({"content-type": content_type}),
+        )
 
-    with TestClient(app) as test_client:
-        yield test_client
+    yield _make_upload_file
 
-    app.dependency_overrides.clear()
+    for spooled in files:
+        spooled.close()
 
 
 @pytest.fixture
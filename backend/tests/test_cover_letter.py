@@ -0,0 +1,342 @@
+"""
+Tests for cover letter generation and management.
+
+Test Coverage:
+- T042: POST /cover-letter/generate endpoint
+- T043: PUT /cover-letter/{id} endpoint
+- GET /cover-letter/{id} endpoint
+- POST /cover-letter/generate/stream (SSE) and stream cancellation
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models.cover_letter import CoverLetter
+from src.models.user import User
+from src.services.cover_letter_service import CoverLetterService
+
+
+GENERATED_LETTER = "Dear Hiring Manager,\n\nI am excited to join Acme as a Backend Engineer."
+REGENERATED_LETTER = "Dear Acme team,\n\nBackend work at scale is what I do best."
+
+
+@pytest.fixture
+def make_cover_letter(async_test_db: AsyncSession, test_user: User):
+    """Create a generated cover letter owned by test_user (rolled back after the test)."""
+    async def _make_cover_letter(**fields) -> CoverLetter:
+        cover_letter = CoverLetter(**{
+            "user_id": test_user.id,
+            "job_title": "Backend Engineer",
+            "company_name": "Acme",
+            "content": GENERATED_LETTER,
+            "status": "generated",
+            "generation_params": {"tone": "professional", "length": "short"},
+            **fields,
+        })
+        async_test_db.add(cover_letter)
+        await async_test_db.commit()
+        return cover_letter
+
+    return _make_cover_letter
+
+
+# T042-T043: API Endpoint Tests
+@pytest.mark.asyncio
+class TestCoverLetterEndpoints:
+    """Tests for cover letter API endpoints."""
+
+    async def test_generate_cover_letter_success(
+        self,
+        client,
+        gemini_model,
+        async_test_db: AsyncSession,
+        test_user: User,
+    ):
+        """Test generation stores and returns the Gemini text."""
+        gemini_model.generate_content_async.return_value = SimpleNamespace(
+            text=f"```\n{GENERATED_LETTER}\n```"
+        )
+
+        response = client.post(
+            "/api/v1/cover-letter/generate",
+            json={"job_title": "Backend Engineer", "company_name": "Acme", "length": "short"},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["status"] == "generated"
+        assert data["content"] == GENERATED_LETTER
+        assert data["version"] == 1
+        assert data["word_count"] == len(GENERATED_LETTER.split())
+
+        cover_letter = await async_test_db.get(CoverLetter, data["cover_letter_id"])
+        assert cover_letter.user_id == test_user.id
+        assert cover_letter.generation_params["length"] == "short"
+        assert cover_letter.generated_at is not None
+
+    async def test_generate_cover_letter_gemini_failure(self, client, gemini_model, test_user: User):
+        """Test a failed generation is recorded and reported as a 500."""
+        gemini_model.generate_content_async.side_effect = RuntimeError("upstream unavailable")
+
+        response = client.post(
+            "/api/v1/cover-letter/generate",
+            json={"job_title": "Backend Engineer", "company_name": "Acme"},
+        )
+
+        assert response.status_code == 500
+
+    async def test_get_cover_letter_success(self, client, make_cover_letter):
+        """Test retrieving a stored cover letter."""
+        cover_letter = await make_cover_letter()
+
+        response = client.get(f"/api/v1/cover-letter/{cover_letter.id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["cover_letter_id"] == cover_letter.id
+        assert data["content"] == GENERATED_LETTER
+        assert data["generation_params"]["tone"] == "professional"
+
+    async def test_get_cover_letter_not_found(self, client):
+        """Test retrieving a non-existent cover letter."""
+        response = client.get("/api/v1/cover-letter/99999")
+
+        assert response.status_code == 404
+
+    async def test_update_cover_letter_manual_edit(self, client, make_cover_letter):
+        """Test a manual edit replaces the content and bumps the version."""
+        cover_letter = await make_cover_letter()
+
+        response = client.put(
+            f"/api/v1/cover-letter/{cover_letter.id}",
+            json={"content": "Edited by hand."},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["content"] == "Edited by hand."
+        assert data["version"] == 2
+
+    async def test_update_cover_letter_regenerate(self, client, gemini_model, make_cover_letter):
+        """Test an inline regeneration stores the new Gemini text."""
+        cover_letter = await make_cover_letter()
+        gemini_model.generate_content_async.return_value = SimpleNamespace(text=REGENERATED_LETTER)
+
+        response = client.put(
+            f"/api/v1/cover-letter/{cover_letter.id}",
+            json={"regenerate": True},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["content"] == REGENERATED_LETTER
+        assert data["version"] == 2
+        gemini_model.generate_content_async.assert_awaited_once()
+
+    async def test_update_cover_letter_not_found(self, client):
+        """Test updating a non-existent cover letter."""
+        response = client.put("/api/v1/cover-letter/99999", json={"content": "Edited"})
+
+        assert response.status_code == 404
+
+
+# T043: Queued (low-priority) regenerations
+@pytest.mark.asyncio
+class TestQueuedRegenerations:
+    """Tests for CoverLetterService.process_queued_regenerations."""
+
+    async def test_drain_claims_each_row_once(
+        self,
+        gemini_model,
+        async_test_db: AsyncSession,
+        make_cover_letter,
+    ):
+        """Test queued rows are regenerated once, with the version bumped in SQL."""
+        queued = [await make_cover_letter(status="queued", job_title=f"Role {i}") for i in range(2)]
+        # Claimed by another worker's drain: must be left alone
+        claimed = await make_cover_letter(status="regenerating")
+        gemini_model.generate_content_async.return_value = SimpleNamespace(text=REGENERATED_LETTER)
+
+        service = CoverLetterService(async_test_db)
+
+        assert await service.process_queued_regenerations() == 2
+        assert gemini_model.generate_content_async.await_count == 2
+
+        # A second drain finds nothing left to claim
+        assert await service.process_queued_regenerations() == 0
+        assert gemini_model.generate_content_async.await_count == 2
+
+        for cover_letter in queued:
+            await async_test_db.refresh(cover_letter)
+            assert cover_letter.status == "generated"
+            assert cover_letter.content == REGENERATED_LETTER
+            assert cover_letter.version == 2
+
+        await async_test_db.refresh(claimed)
+        assert claimed.status == "regenerating"
+        assert claimed.version == 1
+
+    async def test_drain_records_failures(
+        self,
+        gemini_model,
+        async_test_db: AsyncSession,
+        make_cover_letter,
+    ):
+        """Test a failed regeneration is marked failed and keeps its content."""
+        cover_letter = await make_cover_letter(status="queued")
+        gemini_model.generate_content_async.side_effect = RuntimeError("upstream unavailable")
+
+        assert await CoverLetterService(async_test_db).process_queued_regenerations() == 1
+
+        await async_test_db.refresh(cover_letter)
+        assert cover_letter.status == "failed"
+        assert "upstream unavailable" in cover_letter.error_message
+        assert cover_letter.content == GENERATED_LETTER
+        assert cover_letter.version == 1
+
+
+# Streaming generation (Server-Sent Events)
+@pytest.mark.asyncio
+class TestCoverLetterStream:
+    """Tests for POST /cover-letter/generate/stream and stream_cover_letter."""
+
+    async def test_stream_chunks_then_done(
+        self,
+        client,
+        gemini_model,
+        make_gemini_stream,
+        parse_sse_events,
+        async_test_db: AsyncSession,
+        test_user: User,
+    ):
+        """Test chunk events arrive in order and the done event reports the stored row."""
+        gemini_model.generate_content_async.return_value = make_gemini_stream(
+            "Dear Hiring Manager,\n\n", "I am excited to join Acme."
+        )
+
+        response = client.post(
+            "/api/v1/cover-letter/generate/stream",
+            json={"job_title": "Backend Engineer", "company_name": "Acme"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse_events(response.text)
+
+        assert [event["type"] for event in events] == ["chunk", "chunk", "done"]
+        assert "".join(event["text"] for event in events[:2]) == (
+            "Dear Hiring Manager,\n\nI am excited to join Acme."
+        )
+        done = events[-1]
+        assert done["status"] == "generated"
+        assert done["word_count"] == 9
+
+        cover_letter = await async_test_db.get(CoverLetter, done["cover_letter_id"])
+        assert cover_letter.status == "generated"
+        assert cover_letter.content == "Dear Hiring Manager,\n\nI am excited to join Acme."
+
+    async def test_stream_error_event(
+        self,
+        client,
+        gemini_model,
+        parse_sse_events,
+        async_test_db: AsyncSession,
+        test_user: User,
+    ):
+        """Test an upstream failure ends the stream with an error event and a failed row."""
+        gemini_model.generate_content_async.side_effect = RuntimeError("upstream unavailable")
+
+        response = client.post(
+            "/api/v1/cover-letter/generate/stream",
+            json={"job_title": "Backend Engineer", "company_name": "Acme"},
+        )
+
+        [event] = parse_sse_events(response.text)
+        assert event["type"] == "error"
+        assert "upstream unavailable" in event["message"]
+
+        cover_letter = await async_test_db.get(CoverLetter, event["cover_letter_id"])
+        assert cover_letter.status == "failed"
+
+    async def test_stream_stalled_upstream_error_event(
+        self,
+        client,
+        gemini_model,
+        make_gemini_stream,
+        parse_sse_events,
+        async_test_db: AsyncSession,
+        monkeypatch,
+    ):
+        """Test an upstream stream that stops sending ends with an error event, not a hang."""
+        monkeypatch.setattr(settings, "gemini_timeout_seconds", 0.05)
+        gemini_model.generate_content_async.return_value = make_gemini_stream("Dear", hang=True)
+
+        response = client.post(
+            "/api/v1/cover-letter/generate/stream",
+            json={"job_title": "Backend Engineer", "company_name": "Acme"},
+        )
+
+        events = parse_sse_events(response.text)
+        assert [event["type"] for event in events] == ["chunk", "error"]
+        assert "stalled" in events[-1]["message"]
+
+        cover_letter = await async_test_db.get(CoverLetter, events[-1]["cover_letter_id"])
+        assert cover_letter.status == "failed"
+
+    async def test_stream_closed_early_marks_row_failed(
+        self,
+        gemini_model,
+        make_gemini_stream,
+        async_test_db: AsyncSession,
+        test_user: User,
+    ):
+        """Test a stream closed mid-generation (GeneratorExit) does not stay "generating"."""
+        gemini_model.generate_content_async.return_value = make_gemini_stream("Dear", " Hiring", " Manager")
+        stream = CoverLetterService(async_test_db).stream_cover_letter(
+            user_id=test_user.id, job_title="Backend Engineer", company_name="Acme"
+        )
+
+        assert (await stream.__anext__())["type"] == "chunk"
+        await stream.aclose()
+
+        [cover_letter] = (
+            await async_test_db.execute(select(CoverLetter).where(CoverLetter.user_id == test_user.id))
+        ).scalars().all()
+        assert cover_letter.status == "failed"
+        assert "cancelled" in cover_letter.error_message
+
+    async def test_stream_cancelled_marks_row_failed(
+        self,
+        gemini_model,
+        make_gemini_stream,
+        async_test_db: AsyncSession,
+        test_user: User,
+    ):
+        """Test a cancelled stream (client disconnect) marks the row failed and re-raises."""
+        gemini_model.generate_content_async.return_value = make_gemini_stream("Dear", hang=True)
+        events = []
+
+        async def consume():
+            async for event in CoverLetterService(async_test_db).stream_cover_letter(
+                user_id=test_user.id, job_title="Backend Engineer", company_name="Acme"
+            ):
+                events.append(event)
+
+        task = asyncio.create_task(consume())
+        while not events:
+            await asyncio.sleep(0)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        [cover_letter] = (
+            await async_test_db.execute(select(CoverLetter).where(CoverLetter.user_id == test_user.id))
+        ).scalars().all()
+        assert cover_letter.status == "failed"
+        assert "cancelled" in cover_letter.error_message
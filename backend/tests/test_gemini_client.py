@@ -0,0 +1,247 @@
+"""
+Tests for Gemini reply handling.
+
+Test Coverage:
+- T023: Reply schemas (defaults, clamping, rejection)
+- T023: _generate_json re-prompting on invalid replies
+- iter_json_array_items incremental parsing of streamed arrays
+- GeminiClient.stream_content chunk timeout and semaphore release
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from src.config import settings
+from src.services.gemini_client import (
+    GEMINI_SEMAPHORE,
+    JSON_MAX_REPROMPTS,
+    JSON_REPROMPT_SUFFIX,
+    AnalyzeAndWriteResult,
+    GeminiClient,
+    ResumeAnalysis,
+    iter_json_array_items,
+)
+from src.services.job_service import JobMatchAnalysis, RecommendationList
+
+
+def _reply(text: str) -> SimpleNamespace:
+    return SimpleNamespace(text=text)
+
+
+async def _chunks(*texts: str):
+    for text in texts:
+        yield text
+
+
+async def _items(*texts: str) -> list:
+    return [item async for item in iter_json_array_items(_chunks(*texts))]
+
+
+class TestReplySchemas:
+    """Tests for the pydantic models Gemini JSON replies are validated against."""
+
+    def test_resume_analysis_defaults(self):
+        """Test missing fields get the defaults the API has always returned."""
+        analysis = ResumeAnalysis.model_validate({"strengths": ["Python"], "extra_note": "kept"})
+
+        assert analysis.strengths == ["Python"]
+        assert analysis.weaknesses == []
+        assert analysis.experience_years == 0
+        assert analysis.ats_score.overall == 50
+        assert analysis.model_dump()["extra_note"] == "kept"
+
+    def test_ats_overall_filled_from_subscores(self):
+        """Test a missing overall ATS score is the mean of the three subscores."""
+        analysis = ResumeAnalysis.model_validate(
+            {"ats_score": {"format_score": 90, "keyword_score": 60, "content_score": 75}}
+        )
+
+        assert analysis.ats_score.overall == 75
+
+    def test_resume_analysis_rejects_wrong_types(self):
+        """Test a list field that is not a list is rejected, not coerced."""
+        with pytest.raises(ValidationError):
+            ResumeAnalysis.model_validate({"strengths": "Python"})
+
+    def test_analyze_and_write_requires_cover_letter(self):
+        """Test the fused reply needs a non-blank cover letter."""
+        with pytest.raises(ValidationError):
+            AnalyzeAndWriteResult.model_validate({"analysis": {}, "cover_letter": "   "})
+
+        result = AnalyzeAndWriteResult.model_validate({"cover_letter": "  Dear team,  "})
+        assert result.cover_letter == "Dear team,"
+
+    @pytest.mark.parametrize(("score", "expected"), [(140, 100), (-5, 0), (87.5, 87.5)])
+    def test_match_score_clamped(self, score, expected):
+        """Test match scores are clamped to 0-100."""
+        assert JobMatchAnalysis.model_validate({"match_score": score}).match_score == expected
+        [item] = RecommendationList.model_validate([{"match_score": score}]).root
+        assert item.match_score == expected
+
+    def test_match_analysis_requires_score(self):
+        """Test a match reply without a score is rejected."""
+        with pytest.raises(ValidationError):
+            JobMatchAnalysis.model_validate({"match_level": "Strong Match"})
+
+    def test_recommendation_defaults_and_unknown_fields(self):
+        """Test recommendation items get defaults and drop unknown fields."""
+        [item] = RecommendationList.model_validate([{"title": "Data Engineer", "salary": "?"}]).root
+
+        assert item.title == "Data Engineer"
+        assert item.match_score == 70
+        assert "salary" not in item.model_dump()
+
+
+@pytest.mark.asyncio
+class TestGenerateJson:
+    """Tests for GeminiClient._generate_json."""
+
+    async def test_valid_reply_first_time(self, gemini_model):
+        """Test a fenced valid reply is parsed without re-asking."""
+        gemini_model.generate_content_async.return_value = _reply('```json\n{"match_score": 82}\n```')
+
+        result = await GeminiClient()._generate_json("prompt", JobMatchAnalysis)
+
+        assert result.match_score == 82
+        gemini_model.generate_content_async.assert_awaited_once()
+
+    async def test_reprompts_after_invalid_reply(self, gemini_model):
+        """Test unparseable and off-schema replies are re-asked with the JSON suffix."""
+        gemini_model.generate_content_async.side_effect = [
+            _reply("Sure! Here is the analysis."),
+            _reply('{"match_level": "Strong Match"}'),
+            _reply('{"match_score": 120}'),
+        ]
+
+        result = await GeminiClient()._generate_json("prompt", JobMatchAnalysis)
+
+        assert result.match_score == 100
+        prompts = [c.args[0] for c in gemini_model.generate_content_async.await_args_list]
+        assert prompts == ["prompt", "prompt" + JSON_REPROMPT_SUFFIX, "prompt" + JSON_REPROMPT_SUFFIX]
+
+    async def test_gives_up_after_max_reprompts(self, gemini_model):
+        """Test the last parse error is raised once the re-prompts are used up."""
+        gemini_model.generate_content_async.return_value = _reply("not json")
+
+        with pytest.raises(json.JSONDecodeError):
+            await GeminiClient()._generate_json("prompt", JobMatchAnalysis)
+
+        assert gemini_model.generate_content_async.await_count == JSON_MAX_REPROMPTS + 1
+
+
+@pytest.mark.asyncio
+class TestIterJsonArrayItems:
+    """Tests for iter_json_array_items."""
+
+    async def test_items_split_across_chunks(self):
+        """Test elements are reassembled whatever the chunk boundaries are."""
+        text = json.dumps([{"question": "Why us?", "difficulty": 2}, {"question": "Why now?", "difficulty": 3}])
+
+        for size in (1, 3, 7, len(text)):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            assert await _items(*chunks) == json.loads(text)
+
+    async def test_yields_before_stream_ends(self):
+        """Test an element is yielded as soon as it closes, not at end of stream."""
+        seen = []
+
+        async def chunks():
+            yield '[{"id": 1}, '
+            # The first element must be out before the rest arrives
+            seen.append("second chunk")
+            yield '{"id": 2}]'
+
+        async for item in iter_json_array_items(chunks()):
+            seen.append(item)
+
+        assert seen == [{"id": 1}, "second chunk", {"id": 2}]
+
+    async def test_escaped_quotes_and_brackets_in_strings(self):
+        """Test quotes, brackets and commas inside strings do not end an element."""
+        items = [{"question": 'Explain "a[0]}, b{1]" and \\ paths', "tags": ["x,y", "]"]}, "tail\\"]
+        text = json.dumps(items)
+
+        assert await _items(text[:20], text[20:]) == items
+
+    async def test_nested_arrays(self):
+        """Test nested arrays stay inside their top-level element."""
+        items = [[1, [2, 3]], {"matrix": [[4], [5, 6]]}, []]
+
+        assert await _items(json.dumps(items)) == items
+
+    async def test_code_fence_and_trailing_text_skipped(self):
+        """Test a leading ```json fence and anything after the array are ignored."""
+        assert await _items("```json\n[1, ", '{"a": 2}]\n```\nHope this helps! [3]') == [1, {"a": 2}]
+
+    async def test_trailing_comma(self):
+        """Test a trailing comma before the closing bracket adds no element."""
+        assert await _items('[{"id": 1},\n {"id": 2},\n]') == [{"id": 1}, {"id": 2}]
+
+    async def test_empty_array(self):
+        """Test an empty array yields nothing."""
+        assert await _items("[ ]") == []
+
+    async def test_truncated_output(self):
+        """Test complete elements are kept and a cut-off element raises."""
+        items = []
+
+        with pytest.raises(orjson.JSONDecodeError):
+            async for item in iter_json_array_items(_chunks('[{"id": 1}, {"id": 2}, {"quest')):
+                items.append(item)
+
+        assert items == [{"id": 1}, {"id": 2}]
+
+    async def test_truncated_after_complete_element(self):
+        """Test output cut right after an element (no closing bracket) still yields it."""
+        assert await _items('[{"id": 1}, {"id": 2}') == [{"id": 1}, {"id": 2}]
+
+    async def test_source_drained_after_array(self):
+        """Test the source is read to the end even after the array closes."""
+        consumed = []
+
+        async def chunks():
+            for text in ("[1]", " trailing", " text"):
+                consumed.append(text)
+                yield text
+
+        assert [item async for item in iter_json_array_items(chunks())] == [1]
+        assert consumed == ["[1]", " trailing", " text"]
+
+
+@pytest.mark.asyncio
+class TestStreamContent:
+    """Tests for GeminiClient.stream_content."""
+
+    async def test_streams_chunks(self, gemini_model, make_gemini_stream):
+        """Test chunks are yielded in order and empty chunks skipped."""
+        gemini_model.generate_content_async.return_value = make_gemini_stream("Dear", "", " team")
+
+        chunks = [text async for text in GeminiClient().stream_content("prompt")]
+
+        assert chunks == ["Dear", " team"]
+        assert gemini_model.generate_content_async.call_args.kwargs["stream"] is True
+
+    async def test_stalled_stream_times_out_and_frees_slot(
+        self,
+        gemini_model,
+        make_gemini_stream,
+        monkeypatch,
+    ):
+        """Test a stream that stops sending fails after the timeout and releases its slot."""
+        monkeypatch.setattr(settings, "gemini_timeout_seconds", 0.05)
+        gemini_model.generate_content_async.return_value = make_gemini_stream("Dear", hang=True)
+        free_slots = GEMINI_SEMAPHORE._value
+        chunks = []
+
+        with pytest.raises(asyncio.TimeoutError, match="stalled"):
+            async for text in GeminiClient().stream_content("prompt"):
+                chunks.append(text)
+                assert GEMINI_SEMAPHORE._value == free_slots - 1
+
+        assert chunks == ["Dear"]
+        assert GEMINI_SEMAPHORE._value == free_slots
@@ -0,0 +1,335 @@
+"""
+Tests for the mock interview feature.
+
+Test Coverage:
+- T070: InterviewService.generate_interview session state after commit
+- POST /interview/generate-questions/stream (SSE) and stream cancellation
+- T071: POST /interview/{id}/evaluate-answer (answer upsert, completion)
+- migrate_interview_answers (interviews.answers JSONB -> interview_answers)
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, inspect, select, text
+from sqlalchemy.orm import Session
+
+from migrate_interview_answers import migrate_interview_answers
+from src.config import settings
+from src.models.interview import Interview
+from src.models.interview_answer import InterviewAnswer
+from src.models.user import User
+from src.services.interview_service import InterviewService
+
+
+QUESTIONS = [
+    {"question": "Tell me about a project you led.", "type": "behavioral", "difficulty": 3},
+    {"question": "How would you design a rate limiter?", "type": "technical", "difficulty": 4},
+]
+
+
+@pytest.fixture
+def ready_interview(test_db: Session, test_user: User) -> Interview:
+    """Interview with QUESTIONS generated and no answers yet (rolled back after the test)."""
+    interview = Interview(
+        user_id=test_user.id,
+        job_title="Backend Engineer",
+        config={"language": "en"},
+        questions=[{"id": i, **question} for i, question in enumerate(QUESTIONS, start=1)],
+        status="ready",
+    )
+    test_db.add(interview)
+    test_db.commit()
+    return interview
+
+
+def _evaluation_reply(score: int) -> SimpleNamespace:
+    return SimpleNamespace(text=json.dumps({"score": score, "strengths": ["Clear"], "feedback": "Good."}))
+
+
+# T070: Question generation
+@pytest.mark.asyncio
+class TestGenerateInterview:
+    """Tests for InterviewService.generate_interview."""
+
+    async def test_generated_interview_stays_loaded(self, gemini_model, test_db: Session, test_user: User):
+        """Test the generated interview is usable after commit without a reload SELECT."""
+        gemini_model.generate_content_async.return_value = SimpleNamespace(text=json.dumps(QUESTIONS))
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_db.bind, "before_cursor_execute", record)
+        try:
+            interview = await InterviewService(test_db).generate_interview(
+                user_id=test_user.id, job_title="Backend Engineer", question_count=2, language="en"
+            )
+            assert interview.id is not None
+            assert interview.created_at is not None
+        finally:
+            event.remove(test_db.bind, "before_cursor_execute", record)
+
+        assert not [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
+        assert not inspect(interview).expired_attributes
+        assert interview.status == "ready"
+        assert len(interview.questions) == 2
+        # Only the generation commit skips expiry; the session keeps its setting
+        assert test_db.expire_on_commit is True
+
+    async def test_server_values_fresh_after_later_commit(
+        self,
+        gemini_model,
+        test_db: Session,
+        ready_interview: Interview,
+    ):
+        """Test other commits still expire, so server-set values (updated_at) are reloaded."""
+        assert ready_interview.updated_at is None
+        gemini_model.generate_content_async.return_value = _evaluation_reply(80)
+
+        await InterviewService(test_db).evaluate_answer(
+            interview_id=ready_interview.id,
+            user_id=ready_interview.user_id,
+            question_id=1,
+            answer_text="I led the billing rewrite.",
+        )
+
+        assert ready_interview.updated_at is not None
+        assert ready_interview.completed_questions == 1
+
+
+# Streaming generation (Server-Sent Events)
+@pytest.mark.asyncio
+class TestInterviewStream:
+    """Tests for POST /interview/generate-questions/stream and stream_interview."""
+
+    async def test_stream_questions_then_done(
+        self,
+        client,
+        gemini_model,
+        make_gemini_stream,
+        parse_sse_events,
+        test_db: Session,
+        test_user: User,
+    ):
+        """Test each question is an event as soon as it closes, then done."""
+        reply = "```json\n" + json.dumps(QUESTIONS) + "\n```"
+        # Split mid-object so questions straddle chunk boundaries
+        gemini_model.generate_content_async.return_value = make_gemini_stream(reply[:40], reply[40:90], reply[90:])
+
+        response = client.post(
+            "/api/v1/interview/generate-questions/stream",
+            json={"job_title": "Backend Engineer", "question_count": 2, "language": "en"},
+        )
+
+        assert response.status_code == 200
+        events = parse_sse_events(response.text)
+
+        assert [event["type"] for event in events] == ["question", "question", "done"]
+        assert [event["question"]["question"] for event in events[:2]] == [q["question"] for q in QUESTIONS]
+        assert [event["question"]["id"] for event in events[:2]] == [1, 2]
+        done = events[-1]
+        assert done["status"] == "ready"
+        assert done["question_count"] == 2
+
+        interview = test_db.get(Interview, done["interview_id"])
+        assert interview.status == "ready"
+        assert len(interview.questions) == 2
+
+    async def test_stream_error_event(
+        self,
+        client,
+        gemini_model,
+        parse_sse_events,
+        test_db: Session,
+        test_user: User,
+    ):
+        """Test an upstream failure ends the stream with an error event and a failed record."""
+        gemini_model.generate_content_async.side_effect = RuntimeError("upstream unavailable")
+
+        response = client.post(
+            "/api/v1/interview/generate-questions/stream",
+            json={"job_title": "Backend Engineer", "question_count": 2, "language": "en"},
+        )
+
+        [event] = parse_sse_events(response.text)
+        assert event["type"] == "error"
+        assert "upstream unavailable" in event["message"]
+
+        interview = test_db.get(Interview, event["interview_id"])
+        assert interview.status == "failed"
+
+    async def test_stream_stalled_upstream_error_event(
+        self,
+        client,
+        gemini_model,
+        make_gemini_stream,
+        parse_sse_events,
+        test_db: Session,
+        monkeypatch,
+    ):
+        """Test an upstream stream that stops sending ends with an error event, not a hang."""
+        monkeypatch.setattr(settings, "gemini_timeout_seconds", 0.05)
+        gemini_model.generate_content_async.return_value = make_gemini_stream(json.dumps(QUESTIONS[:1]), hang=True)
+
+        response = client.post(
+            "/api/v1/interview/generate-questions/stream",
+            json={"job_title": "Backend Engineer", "question_count": 2, "language": "en"},
+        )
+
+        events = parse_sse_events(response.text)
+        assert events[-1]["type"] == "error"
+        assert "stalled" in events[-1]["message"]
+
+        interview = test_db.get(Interview, events[-1]["interview_id"])
+        assert interview.status == "failed"
+
+    async def test_stream_closed_early_records_failure(
+        self,
+        gemini_model,
+        make_gemini_stream,
+        test_db: Session,
+        test_user: User,
+    ):
+        """Test a stream closed mid-generation is recorded as failed, not dropped."""
+        gemini_model.generate_content_async.return_value = make_gemini_stream(json.dumps(QUESTIONS), hang=True)
+        stream = InterviewService(test_db).stream_interview(
+            user_id=test_user.id, job_title="Backend Engineer", question_count=2, language="en"
+        )
+
+        assert (await stream.__anext__())["type"] == "question"
+        await stream.aclose()
+
+        [interview] = test_db.query(Interview).filter(Interview.user_id == test_user.id).all()
+        assert interview.status == "failed"
+        assert "cancelled" in interview.error_message
+
+
+# T071: Answer evaluation
+@pytest.mark.asyncio
+class TestEvaluateAnswer:
+    """Tests for POST /interview/{id}/evaluate-answer and the answer upsert."""
+
+    def _answer(self, client, interview: Interview, question_id: int, answer_text: str):
+        return client.post(
+            f"/api/v1/interview/{interview.id}/evaluate-answer",
+            json={"question_id": question_id, "answer_text": answer_text},
+        )
+
+    def _answer_rows(self, test_db: Session, interview: Interview):
+        return test_db.scalars(
+            select(InterviewAnswer).where(InterviewAnswer.interview_id == interview.id)
+        ).all()
+
+    async def test_first_answer(self, client, gemini_model, test_db: Session, ready_interview: Interview):
+        """Test the first answer stores one row and starts the interview."""
+        gemini_model.generate_content_async.return_value = _evaluation_reply(80)
+
+        response = self._answer(client, ready_interview, 1, "I led the billing rewrite.")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["evaluation"]["score"] == 80
+        assert data["progress"]["answered"] == 1
+        assert data["is_completed"] is False
+        assert data["total_score"] is None
+
+        [row] = self._answer_rows(test_db, ready_interview)
+        assert row.question_id == 1
+        assert row.answer_text == "I led the billing rewrite."
+        assert row.evaluation["score"] == 80
+
+        test_db.refresh(ready_interview)
+        assert ready_interview.status == "in_progress"
+        assert ready_interview.started_at is not None
+        assert ready_interview.completed_questions == 1
+
+    async def test_reanswer_replaces_row(self, client, gemini_model, test_db: Session, ready_interview: Interview):
+        """Test re-answering a question replaces its row instead of adding one."""
+        gemini_model.generate_content_async.return_value = _evaluation_reply(40)
+        self._answer(client, ready_interview, 1, "First try.")
+        gemini_model.generate_content_async.return_value = _evaluation_reply(90)
+
+        response = self._answer(client, ready_interview, 1, "Second try.")
+
+        assert response.status_code == 200
+        assert response.json()["progress"]["answered"] == 1
+
+        [row] = self._answer_rows(test_db, ready_interview)
+        assert row.answer_text == "Second try."
+        assert row.evaluation["score"] == 90
+
+        test_db.refresh(ready_interview)
+        assert ready_interview.completed_questions == 1
+        assert ready_interview.status == "in_progress"
+
+    async def test_last_answer_completes_interview(
+        self,
+        client,
+        gemini_model,
+        test_db: Session,
+        ready_interview: Interview,
+    ):
+        """Test answering every question completes the interview with the average score."""
+        gemini_model.generate_content_async.return_value = _evaluation_reply(70)
+        self._answer(client, ready_interview, 1, "I led the billing rewrite.")
+        gemini_model.generate_content_async.return_value = _evaluation_reply(85)
+
+        response = self._answer(client, ready_interview, 2, "A token bucket per API key in Redis.")
+
+        data = response.json()
+        assert data["is_completed"] is True
+        assert data["total_score"] == 77.5
+        assert data["progress"]["answered"] == 2
+
+        test_db.refresh(ready_interview)
+        assert ready_interview.status == "completed"
+        assert ready_interview.completed_at is not None
+        assert ready_interview.total_score == 77.5
+        assert [a["question_id"] for a in ready_interview.answers] == [1, 2]
+
+    async def test_unknown_question(self, client, ready_interview: Interview):
+        """Test answering a question that is not in the interview is a 400."""
+        response = self._answer(client, ready_interview, 99, "An answer.")
+
+        assert response.status_code == 400
+
+
+class TestAnswersMigration:
+    """Tests for migrate_interview_answers."""
+
+    def test_copies_answers_and_drops_column(self, test_db: Session, ready_interview: Interview):
+        """Test old JSONB answers become rows (latest per question) and the column is dropped."""
+        connection = test_db.connection()
+        # Recreate the pre-migration column; DDL is rolled back with the test
+        connection.execute(text("ALTER TABLE interviews ADD COLUMN answers JSON"))
+        old_answers = [
+            {"question_id": 1, "answer_text": "First try.", "answered_at": "2025-01-02T10:00:00",
+             "evaluation": {"score": 40}},
+            {"question_id": 2, "answer_text": "Token bucket.", "evaluation": {"score": 85}},
+            {"question_id": 1, "answer_text": "Second try.", "answered_at": "2025-01-02T10:05:00Z",
+             "evaluation": {"score": 90}},
+        ]
+        connection.execute(
+            text("UPDATE interviews SET answers = :answers WHERE id = :id"),
+            {"answers": json.dumps(old_answers), "id": ready_interview.id},
+        )
+
+        assert migrate_interview_answers(connection) == 2
+
+        rows = test_db.scalars(
+            select(InterviewAnswer)
+            .where(InterviewAnswer.interview_id == ready_interview.id)
+            .order_by(InterviewAnswer.question_id)
+        ).all()
+        assert [(row.question_id, row.answer_text) for row in rows] == [(1, "Second try."), (2, "Token bucket.")]
+        assert rows[1].evaluation == {"score": 85}
+        assert rows[1].answered_at is not None
+
+        test_db.refresh(ready_interview)
+        assert ready_interview.completed_questions == 2
+        assert "answers" not in {column["name"] for column in inspect(connection).get_columns("interviews")}
+
+        # Re-running is a no-op once the column is gone
+        assert migrate_interview_answers(connection) is None
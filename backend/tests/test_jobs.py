@@ -0,0 +1,292 @@
+"""
+Tests for job matching.
+
+Test Coverage:
+- JobService.refresh_saved_job_matches (bulk match of all saved jobs)
+- JobService.save_recommendations_as_jobs and POST /jobs/recommend/save
+- JobService._prefiltered_match (local skip of clear non-matches)
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.models.job import Job
+from src.models.resume import Resume
+from src.models.user import User
+from src.services.job_service import BULK_MATCH_CHUNK_SIZE, JobService
+
+
+# "### Job <index>" heading and title line of each posting in a bulk match prompt
+_POSTING_RE = re.compile(r"### Job (\d+)\n- \*\*Title\*\*: Role (\d+)")
+
+
+@pytest.fixture
+def analyzed_resume(test_db: Session, test_user: User, sample_analysis_result) -> Resume:
+    """Analyzed resume owned by test_user (rolled back after the test)."""
+    resume = Resume(
+        user_id=test_user.id,
+        original_filename="test.pdf",
+        file_path="/uploads/test-jobs.pdf",
+        file_size=1024,
+        mime_type="application/pdf",
+        status="analyzed",
+        analysis_result=sample_analysis_result,
+    )
+    test_db.add(resume)
+    test_db.flush()
+    return resume
+
+
+@pytest.fixture
+def make_saved_jobs(test_db: Session, test_user: User):
+    """Create saved jobs "Role 1".."Role n" for test_user, all with match_score 33."""
+    def _make_saved_jobs(count: int) -> list:
+        jobs = [
+            Job(
+                user_id=test_user.id,
+                title=f"Role {number}",
+                company="Acme",
+                description=f"Posting {number}.",
+                is_saved=True,
+                match_score=33.0,
+            )
+            for number in range(1, count + 1)
+        ]
+        test_db.add_all(jobs)
+        test_db.flush()
+        return jobs
+
+    return _make_saved_jobs
+
+
+def bulk_match_reply(prompt: str, *args, fail_on=(), drop=(), **kwargs) -> SimpleNamespace:
+    """
+    Stub Gemini bulk match reply: each posting "Role N" scores N.
+
+    Entries come back in reverse order. Roles in drop get no entry (one
+    without job_index instead); a prompt with a role in fail_on raises.
+    """
+    postings = [(int(index), int(number)) for index, number in _POSTING_RE.findall(prompt)]
+    if any(number in fail_on for _, number in postings):
+        raise RuntimeError("upstream unavailable")
+
+    items = []
+    for index, number in reversed(postings):
+        if number in drop:
+            items.append({"match_score": 99})
+        else:
+            items.append({"job_index": index, "match_score": number, "match_level": "Good Match"})
+    return SimpleNamespace(text="```json\n" + json.dumps(items) + "\n```")
+
+
+@pytest.mark.asyncio
+class TestRefreshSavedJobMatches:
+    """Tests for JobService.refresh_saved_job_matches."""
+
+    async def test_scores_every_saved_job(
+        self,
+        gemini_model,
+        test_db: Session,
+        test_user: User,
+        analyzed_resume: Resume,
+        make_saved_jobs,
+    ):
+        """Test all saved jobs are scored (not just the first 50), matched by job_index."""
+        make_saved_jobs(55)
+        gemini_model.generate_content_async.side_effect = bulk_match_reply
+
+        jobs = await JobService(test_db).refresh_saved_job_matches(test_user.id, analyzed_resume.id)
+
+        assert len(jobs) == 55
+        assert gemini_model.generate_content_async.await_count == -(-55 // BULK_MATCH_CHUNK_SIZE)
+        for job in jobs:
+            assert job.match_score == int(job.title.split()[-1])
+            assert job.match_analysis["resume_id"] == analyzed_resume.id
+            assert "job_index" not in job.match_analysis
+
+    async def test_failed_chunk_and_missing_entries_keep_old_scores(
+        self,
+        gemini_model,
+        test_db: Session,
+        test_user: User,
+        analyzed_resume: Resume,
+        make_saved_jobs,
+    ):
+        """Test a failed chunk or a missing job_index keeps the old score; other jobs update."""
+        make_saved_jobs(BULK_MATCH_CHUNK_SIZE + 2)
+        failing_chunk = set()
+
+        def reply(prompt, *args, **kwargs):
+            postings = {int(number) for _, number in _POSTING_RE.findall(prompt)}
+            # Fail whichever chunk holds Role 1; drop Role 2 unless it is in that chunk
+            if 1 in postings:
+                failing_chunk.update(postings)
+            return bulk_match_reply(prompt, fail_on={1}, drop={2})
+
+        gemini_model.generate_content_async.side_effect = reply
+
+        jobs = await JobService(test_db).refresh_saved_job_matches(test_user.id, analyzed_resume.id)
+
+        assert len(jobs) == BULK_MATCH_CHUNK_SIZE + 2
+        scores = {int(job.title.split()[-1]): job.match_score for job in jobs}
+        for number, score in scores.items():
+            if number in failing_chunk or number == 2:
+                assert score == 33.0
+            else:
+                assert score == number
+        assert len(failing_chunk) < len(jobs)
+
+
+RECOMMENDATIONS = [
+    {"title": "Backend Engineer", "sample_companies": ["Acme"], "location": "Seoul", "match_score": 88},
+    {"title": "Data Engineer", "company_type": "Startup", "job_type": "contract", "match_score": 75},
+    {"title": "Platform Engineer", "sample_companies": [], "experience_level": "senior"},
+]
+
+
+class TestSaveRecommendations:
+    """Tests for JobService.save_recommendations_as_jobs and POST /jobs/recommend/save."""
+
+    def test_save_in_input_order(self, test_db: Session, test_user: User):
+        """Test every recommendation becomes a saved job, ids in input order."""
+        job_ids = JobService(test_db).save_recommendations_as_jobs(test_user.id, RECOMMENDATIONS)
+
+        assert len(job_ids) == 3
+        jobs = [test_db.get(Job, job_id) for job_id in job_ids]
+        assert [job.title for job in jobs] == [rec["title"] for rec in RECOMMENDATIONS]
+        assert [job.company for job in jobs] == ["Acme", "Startup", "Various"]
+        assert jobs[0].location == "Seoul"
+        assert jobs[0].match_score == 88
+        assert jobs[1].job_type == "contract"
+        assert jobs[2].experience_level == "senior"
+        assert all(job.is_saved and job.source == "ai_recommended" for job in jobs)
+
+    def test_empty_list(self, test_db: Session, test_user: User):
+        """Test nothing is inserted for no recommendations."""
+        assert JobService(test_db).save_recommendations_as_jobs(test_user.id, []) == []
+
+    @pytest.mark.parametrize(("first_company", "expected"), [
+        ({"name": "Acme"}, "{'name': 'Acme'}"),
+        (42, "42"),
+        (None, "Various"),
+    ])
+    def test_non_string_sample_company(self, test_db: Session, test_user: User, first_company, expected):
+        """Test a non-string first sample company is stored as text, not a TypeError."""
+        [job_id] = JobService(test_db).save_recommendations_as_jobs(
+            test_user.id, [{"title": "Backend Engineer", "sample_companies": [first_company, "Other"]}]
+        )
+
+        assert test_db.get(Job, job_id).company == expected
+
+    def test_over_long_values_truncated(self, test_db: Session, test_user: User):
+        """Test values longer than their columns are cut to the column length."""
+        [job_id] = JobService(test_db).save_recommendations_as_jobs(test_user.id, [{
+            "title": "T" * 300,
+            "location": "L" * 300,
+            "job_type": "full-time " * 20,
+            "experience_level": 7,
+        }])
+
+        job = test_db.get(Job, job_id)
+        assert job.title == "T" * 255
+        assert job.location == "L" * 255
+        assert job.job_type == ("full-time " * 20)[:50]
+        assert job.experience_level == "7"
+
+    def test_endpoint_saves_in_order(self, client, test_db: Session):
+        """Test the endpoint returns the new ids in request order."""
+        response = client.post("/api/v1/jobs/recommend/save", json={"recommendations": RECOMMENDATIONS})
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["count"] == 3
+        assert [test_db.get(Job, job_id).title for job_id in data["job_ids"]] == [
+            rec["title"] for rec in RECOMMENDATIONS
+        ]
+
+    def test_endpoint_non_string_company_and_long_job_type(self, client, test_db: Session):
+        """Test a dict sample company and an over-long job_type are saved, not a 500."""
+        response = client.post("/api/v1/jobs/recommend/save", json={"recommendations": [{
+            "title": "Backend Engineer",
+            "sample_companies": [{"name": "Acme"}],
+            "job_type": "x" * 120,
+        }]})
+
+        assert response.status_code == 201
+        [job_id] = response.json()["job_ids"]
+        job = test_db.get(Job, job_id)
+        assert job.company == "{'name': 'Acme'}"
+        assert job.job_type == "x" * 50
+
+
+# Mentions none of the sample resume skills
+NON_MATCHING_POSTING = "Pastry chef wanted. Bake bread and croissants every morning."
+
+
+@pytest.mark.asyncio
+class TestMatchPrefilter:
+    """Tests for the job match prefilter (_prefiltered_match via analyze_job_match)."""
+
+    async def _match(self, test_db: Session, resume: Resume, description: str) -> dict:
+        return await JobService(test_db).analyze_job_match(
+            resume.user_id, resume.id, "Pastry Chef", description
+        )
+
+    async def test_non_match_skips_gemini(self, gemini_model, test_db: Session, analyzed_resume: Resume):
+        """Test a posting with none of the resume skills gets the canned weak match."""
+        result = await self._match(test_db, analyzed_resume, NON_MATCHING_POSTING)
+
+        assert result["prefiltered"] is True
+        assert result["match_score"] == 30
+        assert result["match_level"] == "Weak Match"
+        gemini_model.generate_content_async.assert_not_called()
+
+    async def test_single_overlap_calls_gemini(self, gemini_model, test_db: Session, analyzed_resume: Resume):
+        """Test one shared skill is enough to send the job to Gemini."""
+        gemini_model.generate_content_async.return_value = SimpleNamespace(text='{"match_score": 55}')
+
+        result = await self._match(test_db, analyzed_resume, NON_MATCHING_POSTING + " Orders run on Docker.")
+
+        assert result["match_score"] == 55
+        assert "prefiltered" not in result
+        gemini_model.generate_content_async.assert_awaited_once()
+
+    async def test_few_skills_calls_gemini(
+        self,
+        gemini_model,
+        test_db: Session,
+        analyzed_resume: Resume,
+        sample_analysis_result,
+    ):
+        """Test resumes with fewer than job_match_prefilter_min_skills skills are never prefiltered."""
+        skills = ["Python", "Docker", "AWS", "React", "FastAPI", "Go"][:settings.job_match_prefilter_min_skills - 1]
+        analyzed_resume.analysis_result = {**sample_analysis_result, "skills": skills}
+        test_db.flush()
+        gemini_model.generate_content_async.return_value = SimpleNamespace(text='{"match_score": 20}')
+
+        result = await self._match(test_db, analyzed_resume, NON_MATCHING_POSTING)
+
+        assert result["match_score"] == 20
+        gemini_model.generate_content_async.assert_awaited_once()
+
+    async def test_disabled_calls_gemini(
+        self,
+        gemini_model,
+        test_db: Session,
+        analyzed_resume: Resume,
+        monkeypatch,
+    ):
+        """Test JOB_MATCH_PREFILTER_ENABLED=false sends every job to Gemini."""
+        monkeypatch.setattr(settings, "job_match_prefilter_enabled", False)
+        gemini_model.generate_content_async.return_value = SimpleNamespace(text='{"match_score": 25}')
+
+        result = await self._match(test_db, analyzed_resume, NON_MATCHING_POSTING)
+
+        assert result["match_score"] == 25
+        assert "prefiltered" not in result
+        gemini_model.generate_content_async.assert_awaited_once()
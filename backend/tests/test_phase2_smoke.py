@@ -0,0 +1,79 @@
+"""
+Smoke tests for Phase 2 (Foundational) components.
+
+Constitution Compliance:
+- Principle V: Code Quality - Foundational modules load and wire together
+
+Test Coverage:
+- T007: Database connection and setup
+- T008: Retry wrapper functionality
+- T011: Structured logging
+- T012: Configuration loading
+- T014: FastAPI app initialization
+
+Modules are imported once at module scope and share sys.modules with the
+rest of the suite (conftest.py has already loaded src.main).
+"""
+
+from src.api.retry_wrapper import retry_gemini_api, retry_with_backoff
+from src.config import settings
+from src.database import Base, SessionLocal, engine, get_db
+from src.main import app
+from src.utils.logging_config import configure_logging, get_logger
+
+
+# T012: Configuration Loading
+def test_phase2_config_loaded():
+    """Test settings load with the fields the app depends on."""
+    assert settings.app_env
+    assert settings.preferred_ai_model
+    assert settings.log_level
+    assert isinstance(settings.feature_job_discovery, bool)
+    assert isinstance(settings.feature_mock_interview, bool)
+    assert isinstance(settings.feature_dashboard_stats, bool)
+
+
+# T011: Structured Logging
+def test_phase2_structured_logging():
+    """Test structlog configuration and a log call with the context fields."""
+    configure_logging(log_level=settings.log_level, json_output=settings.is_production)
+    logger = get_logger("test")
+
+    logger.info(
+        "test_log_entry",
+        request_id="test-123",
+        user_id="test-user",
+        operation="phase2_test",
+        duration_ms=100,
+    )
+
+
+# T007: Database Setup
+def test_phase2_database_configured():
+    """Test engine, session factory and declarative base are available."""
+    assert engine is not None
+    assert callable(SessionLocal)
+    assert callable(get_db)
+    assert Base.metadata.tables
+
+
+# T008: Retry Wrapper
+def test_phase2_retry_wrapper():
+    """Test the retry decorators wrap a function that succeeds first time."""
+    @retry_with_backoff(max_attempts=3, initial_wait=0.1)
+    def succeed():
+        return "Success!"
+
+    assert succeed() == "Success!"
+    assert callable(retry_gemini_api())
+
+
+# T014: FastAPI App
+def test_phase2_fastapi_app():
+    """Test the app is created with docs, health check and root routes."""
+    routes = {route.path for route in app.routes}
+
+    assert app.title == "PathPilot API"
+    assert app.docs_url == "/docs"
+    assert "/health" in routes
+    assert "/" in routes
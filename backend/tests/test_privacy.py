@@ -0,0 +1,71 @@
+"""
+Tests for PII scrubbing.
+
+Test Coverage:
+- T029-T030: scrub_all_pii placeholders per PII category (one combined pass)
+"""
+
+import pytest
+
+from src.utils.privacy import scrub_all_pii, scrub_all_pii_async, scrub_dict_pii
+
+
+class TestScrubAllPii:
+    """Tests for scrub_all_pii and its combined ALL_PII_PATTERN."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("SSN 123-45-6789", "SSN [SSN]"),
+            ("card 4111 1111 1111 1111", "card [CARD]"),
+            ("call 555-123-4567", "call [PHONE]"),
+            ("mail john.doe@example.com", "mail [EMAIL]"),
+            ("lives at 123 Main Street", "lives at [ADDRESS]"),
+            ("from 192.168.0.1", "from [IP]"),
+        ],
+    )
+    def test_placeholder_per_category(self, text, expected):
+        """Test each category is replaced by its own placeholder."""
+        assert scrub_all_pii(text) == expected
+
+    def test_mixed_categories_in_one_pass(self):
+        """Test several categories in one string keep their own placeholders."""
+        text = "Email: john@test.com, Phone: 555-123-4567, SSN: 123-45-6789"
+
+        assert scrub_all_pii(text) == "Email: [EMAIL], Phone: [PHONE], SSN: [SSN]"
+
+    def test_ssn_takes_priority_over_phone(self):
+        """Test a nine-digit run is an SSN, not a phone number (alternation order)."""
+        assert scrub_all_pii("id 123456789") == "id [SSN]"
+
+    def test_text_without_pii_unchanged(self):
+        """Test text with no digit or @ is returned as is."""
+        assert scrub_all_pii("Senior Backend Engineer") == "Senior Backend Engineer"
+        assert scrub_all_pii("") == ""
+
+    def test_long_text_not_cached(self):
+        """Test text past the memoization limit is scrubbed the same way."""
+        text = "x " * 400 + "john@test.com"
+
+        assert scrub_all_pii(text).endswith("[EMAIL]")
+
+    @pytest.mark.asyncio
+    async def test_scrub_all_pii_async(self):
+        """Test the batched async variant keeps argument order and None."""
+        title, company, missing = await scrub_all_pii_async("call 555-123-4567", "Acme", None)
+
+        assert (title, company, missing) == ("call [PHONE]", "Acme", None)
+
+    def test_scrub_dict_pii_nested(self):
+        """Test nested dicts and lists are scrubbed, other values kept."""
+        data = {
+            "contact": {"email": "john@example.com"},
+            "notes": ["ssn 123-45-6789", 42],
+            "years": 6,
+        }
+
+        assert scrub_dict_pii(data) == {
+            "contact": {"email": "[EMAIL]"},
+            "notes": ["ssn [SSN]", 42],
+            "years": 6,
+        }
@@ -12,43 +12,58 @@ Test Coverage:
 - T021: Integration tests
 """
 
+import hashlib
 import io
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from fastapi import UploadFile
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
+from botocore.exceptions import ClientError
 from sqlalchemy.orm import Session
 
+from src.config import settings
 from src.models.resume import Resume
 from src.models.user import User
-from src.services.resume_service import ResumeService
+from src.services.resume_service import ResumeService, get_extract_pool
 from src.services.gemini_client import GeminiClient
 
 
 # Fixtures
 @pytest.fixture
-def test_user(test_db: Session):
-    """Create test user."""
-    user = User(
-        email="test@example.com",
-        hashed_password="hashed_password",
-        full_name="Test User",
-    )
-    test_db.add(user)
-    test_db.commit()
-    test_db.refresh(user)
-    return user
-
+def make_resumes(test_db: Session, test_user: User):
+    """
+    Create resumes owned by test_user with one add_all and one flush.
 
-@pytest.fixture
+    Each keyword dict overrides the defaults for one resume. Nothing is
+    committed; the test_db rollback discards the rows.
+    """
+    def _make_resumes(*overrides: dict) -> list:
+        resumes = [
+            Resume(**{
+                "user_id": test_user.id,
+                "original_filename": "test.pdf",
+                "file_path": "/uploads/test.pdf",
+                "file_size": 1024,
+                "mime_type": "application/pdf",
+                **fields,
+            })
+            for fields in overrides
+        ]
+        test_db.add_all(resumes)
+        test_db.flush()
+        return resumes
+
+    return _make_resumes
+
+
+@pytest.fixture(scope="session")
 def sample_pdf_content():
-    """Sample PDF content for testing."""
+    """Sample PDF content for testing (immutable, so shared by the whole session)."""
     # Minimal valid PDF structure
     return b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n2 0 obj\n<<\n/Type /Pages\n/Kids [3 0 R]\n/Count 1\n>>\nendobj\n3 0 obj\n<<\n/Type /Page\n/Parent 2 0 R\n/MediaBox [0 0 612 792]\n/Contents 4 0 R\n>>\nendobj\n4 0 obj\n<<\n/Length 44\n>>\nstream\nBT\n/F1 12 Tf\n100 700 Td\n(Test Resume) Tj\nET\nendstream\nendobj\nxref\n0 5\n0000000000 65535 f\n0000000015 00000 n\n0000000068 00000 n\n0000000125 00000 n\n0000000229 00000 n\ntrailer\n<<\n/Size 5\n/Root 1 0 R\n>>\nstartxref\n322\n%%EOF"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_resume_text():
-    """Sample resume text for testing."""
+    """Sample resume text for testing (immutable, so shared by the whole session)."""
     return """
     John Doe
     Software Engineer
@@ -68,37 +83,6 @@ def sample_resume_text():
     """
 
 
-@pytest.fixture
-def sample_analysis_result():
-    """Sample Gemini analysis result."""
-    return {
-        "strengths": [
-            "Strong technical leadership experience",
-            "Proven track record of performance improvements",
-            "Modern tech stack expertise"
-        ],
-        "weaknesses": [
-            "Limited frontend development details",
-            "No certifications mentioned"
-        ],
-        "recommendations": [
-            "Add specific metrics for leadership impact",
-            "Include relevant certifications or courses",
-            "Expand on frontend projects"
-        ],
-        "suitable_roles": [
-            "Senior Software Engineer",
-            "Tech Lead",
-            "Engineering Manager"
-        ],
-        "skills": [
-            "Python", "JavaScript", "React", "Docker",
-            "Kubernetes", "PostgreSQL", "AWS", "FastAPI", "CI/CD"
-        ],
-        "experience_years": 6
-    }
-
-
 # T017: Resume Model Tests
 class TestResumeModel:
     """Tests for Resume model."""
@@ -116,49 +100,20 @@ class TestResumeModel:
         hash3 = Resume.compute_file_hash(b"different content")
         assert hash1 != hash3
 
-    def test_is_analyzed(self, test_db: Session, test_user: User):
+    def test_is_analyzed(self, make_resumes):
         """Test is_analyzed method."""
-        resume = Resume(
-            user_id=test_user.id,
-            original_filename="test.pdf",
-            file_path="/uploads/test.pdf",
-            file_size=1024,
-            mime_type="application/pdf",
-            status="analyzed",
-            analysis_result={"strengths": ["test"]},
+        resume, resume2 = make_resumes(
+            {"status": "analyzed", "analysis_result": {"strengths": ["test"]}},
+            # Without analysis
+            {"original_filename": "test2.pdf", "file_path": "/uploads/test2.pdf", "status": "uploaded"},
         )
-        test_db.add(resume)
-        test_db.commit()
 
         assert resume.is_analyzed() is True
-
-        # Test without analysis
-        resume2 = Resume(
-            user_id=test_user.id,
-            original_filename="test2.pdf",
-            file_path="/uploads/test2.pdf",
-            file_size=1024,
-            mime_type="application/pdf",
-            status="uploaded",
-        )
-        test_db.add(resume2)
-        test_db.commit()
-
         assert resume2.is_analyzed() is False
 
-    def test_get_analysis_summary(self, test_db: Session, test_user: User, sample_analysis_result):
+    def test_get_analysis_summary(self, make_resumes, sample_analysis_result):
         """Test get_analysis_summary method."""
-        resume = Resume(
-            user_id=test_user.id,
-            original_filename="test.pdf",
-            file_path="/uploads/test.pdf",
-            file_size=1024,
-            mime_type="application/pdf",
-            status="analyzed",
-            analysis_result=sample_analysis_result,
-        )
-        test_db.add(resume)
-        test_db.commit()
+        [resume] = make_resumes({"status": "analyzed", "analysis_result": sample_analysis_result})
 
         summary = resume.get_analysis_summary()
 
@@ -173,51 +128,72 @@ class TestResumeService:
     """Tests for ResumeService."""
 
     @pytest.mark.asyncio
-    async def test_validate_file_valid_pdf(self, test_db: Session):
+    async def test_validate_file_valid_pdf(self, test_db: Session, make_upload_file):
         """Test file validation with valid PDF."""
         service = ResumeService(test_db)
 
-        file = UploadFile(
-            filename="resume.pdf",
-            file=io.BytesIO(b"test content"),
-        )
-        file.content_type = "application/pdf"
+        file = make_upload_file("resume.pdf", b"test content", "application/pdf")
 
         # Should not raise exception
         service._validate_file(file)
 
     @pytest.mark.asyncio
-    async def test_validate_file_invalid_type(self, test_db: Session):
+    async def test_validate_file_invalid_type(self, test_db: Session, make_upload_file):
         """Test file validation with invalid file type."""
         service = ResumeService(test_db)
 
-        file = UploadFile(
-            filename="resume.txt",
-            file=io.BytesIO(b"test content"),
-        )
-        file.content_type = "text/plain"
+        file = make_upload_file("resume.txt", b"test content", "text/plain")
 
         with pytest.raises(ValueError, match="Invalid file type"):
             service._validate_file(file)
 
-    def test_save_file(self, test_db: Session, tmp_path):
-        """Test file saving with UUID filename."""
+    @pytest.mark.asyncio
+    async def test_save_stream(self, test_db: Session, tmp_path):
+        """Test streaming a file to a UUID-named .partial file, hashed on the way."""
         service = ResumeService(test_db)
         service.upload_dir = tmp_path  # Use temp directory
 
-        content = b"test content"
-        filename = "resume.pdf"
+        content = b"test content" * 10_000
+        body = io.BytesIO(content)
+
+        async def read(size: int) -> bytes:
+            return body.read(size)
 
-        saved_path = service._save_file(filename, content)
+        saved_path, file_size, file_hash = await service._save_stream(".pdf", read)
 
         assert saved_path.exists()
         assert saved_path.parent == tmp_path
-        assert saved_path.suffix == ".pdf"
-        assert saved_path.name != filename  # UUID filename
+        assert saved_path.name.endswith(".pdf.partial")  # UUID filename
+        assert file_size == len(content)
+        assert file_hash == hashlib.sha256(content).hexdigest()
+        assert saved_path.read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_save_stream_too_large(self, test_db: Session, tmp_path):
+        """Test an oversized stream is rejected and its partial file removed."""
+        service = ResumeService(test_db)
+        service.upload_dir = tmp_path
+        body = io.BytesIO(b"x" * (settings.max_upload_size_bytes + 1))
 
-        # Verify content
-        with open(saved_path, "rb") as f:
-            assert f.read() == content
+        async def read(size: int) -> bytes:
+            return body.read(size)
+
+        with pytest.raises(ValueError, match="File too large"):
+            await service._save_stream(".pdf", read)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_extract_pool_spawns_workers(self):
+        """Test extraction workers are spawned, not forked from the server process."""
+        get_extract_pool.cache_clear()
+        try:
+            with patch("src.services.resume_service.ProcessPoolExecutor") as mock_pool:
+                assert get_extract_pool() is get_extract_pool()
+        finally:
+            get_extract_pool.cache_clear()
+
+        mock_pool.assert_called_once()
+        assert mock_pool.call_args.kwargs["mp_context"].get_start_method() == "spawn"
 
     def test_get_cached_resume(self, test_db: Session, test_user: User, sample_analysis_result):
         """Test caching logic (T026)."""
@@ -238,7 +214,8 @@ class TestResumeService:
             mime_type="application/pdf",
             file_hash=file_hash,
             status="analyzed",
-            analysis_result=sample_analysis_result,
+            # Results without an ATS score are re-analyzed, not served from cache
+            analysis_result={**sample_analysis_result, "ats_score": {"overall_score": 80}},
         )
         test_db.add(resume)
         test_db.commit()
@@ -251,7 +228,7 @@ class TestResumeService:
 
     @patch("src.services.resume_service.PyPDF2.PdfReader")
     def test_extract_text_from_pdf(self, mock_pdf_reader, test_db: Session, tmp_path):
-        """Test PDF text extraction."""
+        """Test PDF text extraction (PyPDF2 fallback: PyMuPDF rejects the fake file)."""
         service = ResumeService(test_db)
 
         # Mock PDF reader
@@ -270,6 +247,19 @@ class TestResumeService:
         assert extracted_text == "Test resume content"
         mock_pdf_reader.assert_called_once()
 
+    def test_extract_text_from_pdf_pymupdf(self, tmp_path, sample_pdf_content):
+        """Test PDF text extraction with PyMuPDF on a real PDF."""
+        pytest.importorskip("fitz")
+
+        pdf_path = tmp_path / "resume.pdf"
+        pdf_path.write_bytes(sample_pdf_content)
+
+        with patch("src.services.resume_service.PyPDF2.PdfReader") as mock_pdf_reader:
+            extracted_text = ResumeService._extract_text_from_pdf(pdf_path)
+
+        assert "Test Resume" in extracted_text
+        mock_pdf_reader.assert_not_called()
+
 
 # T019: Gemini API Client Tests
 class TestGeminiClient:
@@ -329,25 +319,14 @@ class TestGeminiClient:
 class TestResumeEndpoints:
     """Tests for resume API endpoints."""
 
-    @patch("src.services.gemini_client.genai.GenerativeModel")
     async def test_upload_resume_success(
         self,
-        mock_gemini_model,
         client,
         test_db: Session,
         test_user: User,
         sample_pdf_content,
-        sample_analysis_result
     ):
-        """Test successful resume upload and analysis."""
-        # Mock Gemini API response
-        mock_response = Mock()
-        import json
-        mock_response.text = json.dumps(sample_analysis_result)
-        mock_model_instance = Mock()
-        mock_model_instance.generate_content.return_value = mock_response
-        mock_gemini_model.return_value = mock_model_instance
-
+        """Test successful resume upload and analysis (stub Gemini reply, see conftest)."""
         # Upload file
         files = {"file": ("resume.pdf", io.BytesIO(sample_pdf_content), "application/pdf")}
 
@@ -408,6 +387,129 @@ class TestResumeEndpoints:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"]["message"]
 
+    async def test_upload_url_not_configured(self, client):
+        """Test presigned upload URL when no bucket is configured."""
+        with patch("src.routers.resume.settings.resume_upload_bucket", None):
+            response = client.post(
+                "/api/v1/resume/upload-url",
+                json={"filename": "resume.pdf", "content_type": "application/pdf"},
+            )
+
+        assert response.status_code == 503
+
+    @patch("src.services.storage_service._get_s3_client")
+    async def test_upload_url_success(self, mock_s3_client, client):
+        """Test presigned upload URL uses a per-user UUID key."""
+        mock_s3_client.return_value.generate_presigned_url.return_value = "https://storage/upload"
+
+        with patch("src.config.settings.resume_upload_bucket", "resumes-bucket"):
+            response = client.post(
+                "/api/v1/resume/upload-url",
+                json={"filename": "John_Doe_Resume.pdf", "content_type": "application/pdf"},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["upload_url"] == "https://storage/upload"
+        assert data["method"] == "PUT"
+        assert data["object_key"].startswith("resumes/1/")
+        assert data["object_key"].endswith(".pdf")
+        assert "John_Doe" not in data["object_key"]
+
+    @patch("src.services.storage_service._get_s3_client")
+    async def test_ingest_rejects_foreign_key(self, mock_s3_client, client):
+        """Test ingest refuses an object key outside the user's prefix."""
+        with patch("src.config.settings.resume_upload_bucket", "resumes-bucket"):
+            response = client.post(
+                "/api/v1/resume/ingest",
+                json={"object_key": "resumes/2/other-user.pdf"},
+            )
+
+        assert response.status_code == 400
+        assert "does not belong" in response.json()["detail"]["message"]
+        mock_s3_client.return_value.get_object.assert_not_called()
+        mock_s3_client.return_value.delete_object.assert_not_called()
+
+    @patch("src.services.storage_service._get_s3_client")
+    async def test_ingest_rejects_oversize_object(self, mock_s3_client, client):
+        """Test ingest checks ContentLength before reading the body."""
+        body = Mock()
+        mock_s3_client.return_value.get_object.return_value = {
+            "ContentLength": 50 * 1024 * 1024,
+            "Body": body,
+            "ContentType": "application/pdf",
+        }
+
+        with patch("src.config.settings.resume_upload_bucket", "resumes-bucket"):
+            response = client.post(
+                "/api/v1/resume/ingest",
+                json={"object_key": "resumes/1/big.pdf"},
+            )
+
+        assert response.status_code == 400
+        assert "File too large" in response.json()["detail"]["message"]
+        body.read.assert_not_called()
+        body.close.assert_called_once()
+        mock_s3_client.return_value.delete_object.assert_called_once_with(
+            Bucket="resumes-bucket", Key="resumes/1/big.pdf"
+        )
+
+    @patch("src.services.storage_service._get_s3_client")
+    async def test_ingest_missing_object(self, mock_s3_client, client):
+        """Test a missing or already ingested object is a 404, not a 500."""
+        mock_s3_client.return_value.get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey", "Message": "The specified key does not exist."}},
+            "GetObject",
+        )
+
+        with patch("src.config.settings.resume_upload_bucket", "resumes-bucket"):
+            response = client.post(
+                "/api/v1/resume/ingest",
+                json={"object_key": "resumes/1/gone.pdf"},
+            )
+
+        assert response.status_code == 404
+
+    @patch("src.services.storage_service._get_s3_client")
+    async def test_ingest_success(
+        self,
+        mock_s3_client,
+        client,
+        test_db: Session,
+        test_user: User,
+        sample_pdf_content,
+        tmp_path,
+    ):
+        """Test ingest analyzes the stored object and deletes it from the bucket."""
+        mock_s3_client.return_value.get_object.return_value = {
+            "ContentLength": len(sample_pdf_content),
+            "Body": io.BytesIO(sample_pdf_content),
+            "ContentType": "application/pdf",
+        }
+
+        with patch("src.config.settings.resume_upload_bucket", "resumes-bucket"), \
+                patch("src.services.resume_service.settings.upload_dir", str(tmp_path)):
+            response = client.post(
+                "/api/v1/resume/ingest",
+                json={"object_key": "resumes/1/abc.pdf", "filename": "resume.pdf"},
+            )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["status"] == "analyzed"
+        assert len(data["analysis"]["strengths"]) > 0
+
+        resume = test_db.get(Resume, data["resume_id"])
+        assert resume.original_filename == "resume.pdf"
+        assert resume.file_hash == Resume.compute_file_hash(sample_pdf_content)
+        mock_s3_client.return_value.get_object.assert_called_once_with(
+            Bucket="resumes-bucket", Key="resumes/1/abc.pdf"
+        )
+        mock_s3_client.return_value.delete_object.assert_called_once_with(
+            Bucket="resumes-bucket", Key="resumes/1/abc.pdf"
+        )
+
 
 # T021: Integration Tests
 @pytest.mark.integration
@@ -415,49 +517,32 @@ class TestResumeIntegration:
     """Integration tests for complete resume workflow."""
 
     @pytest.mark.asyncio
-    @patch("src.services.gemini_client.genai.GenerativeModel")
     async def test_complete_workflow_with_caching(
         self,
-        mock_gemini_model,
+        gemini_model,
         test_db: Session,
         test_user: User,
         sample_pdf_content,
-        sample_analysis_result
+        make_upload_file,
     ):
         """Test complete workflow: upload -> analyze -> cache -> re-upload (cached)."""
-        # Mock Gemini API
-        mock_response = Mock()
-        import json
-        mock_response.text = json.dumps(sample_analysis_result)
-        mock_model_instance = Mock()
-        mock_model_instance.generate_content.return_value = mock_response
-        mock_gemini_model.return_value = mock_model_instance
-
         service = ResumeService(test_db)
 
         # First upload
-        file1 = UploadFile(
-            filename="resume.pdf",
-            file=io.BytesIO(sample_pdf_content),
-        )
-        file1.content_type = "application/pdf"
+        file1 = make_upload_file("resume.pdf", sample_pdf_content, "application/pdf")
 
         resume1 = await service.upload_and_analyze_resume(file1, test_user.id)
 
         assert resume1.status == "analyzed"
         assert resume1.analysis_result is not None
-        call_count_first = mock_model_instance.generate_content.call_count
+        call_count_first = gemini_model.generate_content_async.call_count
 
         # Second upload with same content (should use cache)
-        file2 = UploadFile(
-            filename="resume_copy.pdf",
-            file=io.BytesIO(sample_pdf_content),
-        )
-        file2.content_type = "application/pdf"
+        file2 = make_upload_file("resume_copy.pdf", sample_pdf_content, "application/pdf")
 
         resume2 = await service.upload_and_analyze_resume(file2, test_user.id)
 
         # Should return cached result
         assert resume2.id == resume1.id  # Same resume returned
         # Gemini API should not be called again
-        assert mock_model_instance.generate_content.call_count == call_count_first
+        assert gemini_model.generate_content_async.call_count == call_count_first
@@ -0,0 +1,83 @@
+"""
+Tests for Gemini retry behaviour.
+
+Test Coverage:
+- T008: wait_for_gemini_error (per-failure wait) and retry_gemini_api
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from google.api_core.exceptions import ResourceExhausted
+from pydantic import ValidationError
+
+from src.api.retry_wrapper import retry_gemini_api, wait_for_gemini_error
+from src.services.gemini_client import AnalyzeAndWriteResult
+
+
+def _retry_state(exception: Exception, attempt_number: int = 1) -> SimpleNamespace:
+    """Minimal tenacity RetryCallState: the failed outcome and its attempt number."""
+    return SimpleNamespace(
+        attempt_number=attempt_number,
+        outcome=SimpleNamespace(exception=lambda: exception),
+    )
+
+
+def _validation_error() -> ValidationError:
+    try:
+        AnalyzeAndWriteResult.model_validate({"cover_letter": ""})
+    except ValidationError as e:
+        return e
+    raise AssertionError("expected a ValidationError")
+
+
+class TestWaitForGeminiError:
+    """Tests for wait_for_gemini_error."""
+
+    def test_rate_limit_backs_off_exponentially_with_cap(self):
+        """Test 429s wait 2s, 4s, 8s, 16s, then stay at the 30s cap."""
+        waits = [
+            wait_for_gemini_error(_retry_state(ResourceExhausted("quota exceeded"), attempt))
+            for attempt in range(1, 7)
+        ]
+
+        assert waits == [2, 4, 8, 16, 30, 30]
+
+    @pytest.mark.parametrize(
+        "exception",
+        [json.JSONDecodeError("Expecting value", "not json", 0), _validation_error()],
+        ids=["json", "schema"],
+    )
+    def test_parse_errors_retry_immediately(self, exception):
+        """Test format errors are re-asked without waiting."""
+        assert wait_for_gemini_error(_retry_state(exception, attempt_number=3)) == 0
+
+    def test_other_errors_fixed_wait(self):
+        """Test other failures use the fixed 2s wait."""
+        assert wait_for_gemini_error(_retry_state(TimeoutError(), attempt_number=5)) == 2.0
+
+    def test_no_outcome_fixed_wait(self):
+        """Test a state without an outcome falls back to the fixed wait."""
+        assert wait_for_gemini_error(SimpleNamespace(attempt_number=1, outcome=None)) == 2.0
+
+
+class TestRetryGeminiApi:
+    """Tests for the retry_gemini_api decorator."""
+
+    @pytest.mark.asyncio
+    async def test_retries_with_per_error_waits(self):
+        """Test a 429 then a parse error are retried with their own waits."""
+        failures = [ResourceExhausted("quota exceeded"), json.JSONDecodeError("Expecting value", "", 0)]
+
+        @retry_gemini_api(max_attempts=3)
+        async def call():
+            if failures:
+                raise failures.pop(0)
+            return "ok"
+
+        with patch.object(call.retry, "sleep", AsyncMock()) as sleep:
+            assert await call() == "ok"
+
+        assert [c.args[0] for c in sleep.await_args_list] == [2, 0]
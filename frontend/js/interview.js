@@ -259,9 +259,12 @@ function displayEvaluation(result) {
         .map(i => `<li>${i}</li>`)
         .join('');
 
-    // Update model answer
+    // Update model answer (generated on demand, after the score is shown)
     document.getElementById('model-answer').innerHTML =
-        `<p>${evaluation.model_answer || 'No model answer provided.'}</p>`;
+        `<p>${evaluation.model_answer || 'Loading model answer...'}</p>`;
+    if (!evaluation.model_answer) {
+        loadModelAnswer(result.question_id, evaluation);
+    }
 
     // Update next button
     const nextBtn = document.getElementById('next-btn');
@@ -282,6 +285,34 @@ function displayEvaluation(result) {
     showSection('evaluation');
 }
 
+// Fetch the model answer for an evaluated question
+async function loadModelAnswer(questionId, evaluation) {
+    const modelAnswerEl = document.getElementById('model-answer');
+
+    try {
+        const response = await fetch(
+            `${API_BASE_URL}/interview/${currentInterview.interview_id}/answers/${questionId}/model-answer`
+        );
+
+        if (!response.ok) {
+            throw new Error('Failed to load model answer');
+        }
+
+        const data = await response.json();
+        evaluation.model_answer = data.model_answer;
+
+        // The user may have moved on to another question meanwhile
+        if (currentInterview.questions[currentQuestionIndex].id !== questionId) {
+            return;
+        }
+        modelAnswerEl.innerHTML = `<p>${data.model_answer || 'No model answer provided.'}</p>`;
+
+    } catch (error) {
+        console.error('Error loading model answer:', error);
+        modelAnswerEl.innerHTML = '<p>No model answer provided.</p>';
+    }
+}
+
 // Skip question
 function skipQuestion() {
     if (confirm('Are you sure you want to skip this question? You can come back to it later.')) {